@@ -18,7 +18,9 @@ modules:
 # isort: skip_file
 
 from __future__ import annotations
+import importlib
 from functools import partial
+from typing import TYPE_CHECKING, Any
 from toolz import compose
 from aenum import constant  # type: ignore[import-untyped]
 
@@ -35,24 +37,16 @@ from gdsfactory.component import (
 )
 from gdsfactory.config import CONF, call_if_func, PATH, logger
 from gdsfactory.port import Port
-from gdsfactory.read.import_gds import import_gds
 from gdsfactory.cross_section import CrossSection, Section
 from gdsfactory.difftest import difftest, diff
 from gdsfactory.boolean import boolean
 
 from gdsfactory import cross_section
-from gdsfactory import asserts
 from gdsfactory import port
-from gdsfactory import components
 from gdsfactory import typings
 from gdsfactory import path
 from gdsfactory import snap
-from gdsfactory import read
-from gdsfactory import add_ports
-from gdsfactory import write_cells
-from gdsfactory import add_pins
 from gdsfactory import technology
-from gdsfactory import routing
 
 from gdsfactory.add_padding import (
     add_padding,
@@ -69,10 +63,50 @@ from gdsfactory.pdk import (
     get_cell,
     get_constant,
 )
-from gdsfactory.get_factories import get_cells
 from gdsfactory.cross_section import get_cross_sections
 
-c = components
+if TYPE_CHECKING:
+    from gdsfactory import (
+        add_pins,
+        add_ports,
+        asserts,
+        components,
+        read,
+        routing,
+        write_cells,
+    )
+    from gdsfactory import components as c
+    from gdsfactory.get_factories import get_cells
+    from gdsfactory.read.import_gds import import_gds
+
+# name: (module, attribute). attribute None means the module itself.
+# These are imported on first access to keep `import gdsfactory` fast.
+_lazy_imports: dict[str, tuple[str, str | None]] = {
+    "add_pins": ("gdsfactory.add_pins", None),
+    "add_ports": ("gdsfactory.add_ports", None),
+    "asserts": ("gdsfactory.asserts", None),
+    "c": ("gdsfactory.components", None),
+    "components": ("gdsfactory.components", None),
+    "read": ("gdsfactory.read", None),
+    "routing": ("gdsfactory.routing", None),
+    "write_cells": ("gdsfactory.write_cells", None),
+    "get_cells": ("gdsfactory.get_factories", "get_cells"),
+    "import_gds": ("gdsfactory.read.import_gds", "import_gds"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _lazy_imports[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_imports))
 
 
 __all__ = (
@@ -1,10 +1,45 @@
-"""Cell decorator for functions that return a Component."""
+"""Cell decorator for functions that return a Component.
+
+With CONF.cell_cache enabled, cells are also stored on disk in PATH.cell_cache,
+one OASIS file with the cell hierarchy and its metadata (ports, settings, info)
+per call, so that later sessions, CI jobs or worker processes load them instead
+of building them again.
+
+Only the source of the decorated function is part of the key. Edits to the
+functions it calls, such as helpers or cells that are not in the PDK, are not
+detected, so call clear_cell_cache after changing them.
+"""
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
+import json
+import os
 import warnings
+from collections.abc import Callable
+from typing import Any
+
+import kfactory as kf
+
+from gdsfactory.config import CONF, PATH, __version__
+
+_cells: dict[str, kf.KCell] = {}
+_cell_caches: dict[str, dict[Any, kf.KCell]] = {}
+_loaded_names: set[str] = set()
+_cell_cache_info = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_cell_cache_size: int | None = None
 
-from kfactory import cell
+
+class _CellCache(dict):  # type: ignore[type-arg]
+    """Cache of a cell function, by the kfactory key of its settings.
+
+    Always true, as kfactory replaces an empty cache with its own.
+    """
+
+    def __bool__(self) -> bool:
+        return True
 
 
 def clear_cache() -> None:
@@ -12,4 +47,331 @@ def clear_cache() -> None:
     warnings.warn("clear_cache is deprecated and does nothing in gdsfactory>=8.0.0")
 
 
-__all__ = ["cell"]
+def cell(_func: Callable[..., Any] | None = None, /, **kwargs: Any) -> Any:
+    """Decorator to cache and auto name the Component, see kfactory.cell.
+
+    When CONF.cell_cache is True, cells are also cached on disk, keyed by the
+    function, its source code, the active PDK (see Pdk.get_hash) and the
+    settings serialized with clean_value_json. Changes in the functions it calls
+    are not detected.
+
+    Keyword Args:
+        set_settings: copy the args and kwargs into the settings dictionary.
+        set_name: auto name the cell from the function name and settings.
+        check_ports: warn about non manhattan ports.
+        check_instances: raise on complex instances.
+        snap_ports: snap port centers onto the grid.
+        rec_dicts: allow recursive dictionaries as parameters.
+        basename: overwrite the name inferred from the function.
+        drop_params: parameters to drop from the settings.
+        info: additional metadata for the info attribute.
+        post_process: functions to call after the cell has been created.
+        cache: dict of the cells by settings. Defaults to a new one.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = kwargs.get("cache") or _CellCache()
+        _cell_caches[f"{func.__module__}.{func.__qualname__}"] = cache
+        kf_func = kf.cell(**(kwargs | {"cache": cache}))(func)
+
+        @functools.wraps(kf_func)
+        def wrapper(*args: Any, **settings: Any) -> Any:
+            if not CONF.cell_cache:
+                return kf_func(*args, **settings)
+            return _get_cell(func, kf_func, args, settings)
+
+        return wrapper
+
+    return decorator if _func is None else decorator(_func)
+
+
+@functools.cache
+def _source_hash(func: Callable[..., Any]) -> str | None:
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _is_serializable(value: Any) -> bool:
+    """Returns False for values that clean_value_json does not tell apart.
+
+    Lambdas and local functions are serialized by name only.
+    """
+    if isinstance(value, functools.partial):
+        return (
+            _is_serializable(value.func)
+            and _is_serializable(value.args)
+            and _is_serializable(value.keywords)
+        )
+    if isinstance(value, dict):
+        return all(_is_serializable(v) for v in value.values())
+    if isinstance(value, list | tuple | set):
+        return all(_is_serializable(v) for v in value)
+    if inspect.isfunction(value):
+        return "<" not in value.__qualname__
+    return True
+
+
+def _normalize(value: Any) -> Any:
+    """Returns value with integral floats as ints, as 1 and 1.0 name the same cell."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _cell_key(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> str | None:
+    """Returns the disk cache key of a cell call, None if it cannot be cached."""
+    from gdsfactory.pdk import get_active_pdk
+    from gdsfactory.serialization import clean_value_json
+
+    source = _source_hash(func)
+    if source is None:
+        return None
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    if not _is_serializable(bound.arguments):
+        return None
+    try:
+        settings = clean_value_json(bound.arguments)
+        settings = json.dumps(_normalize(settings), sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+    key = "\n".join(
+        [
+            __version__,
+            kf.__version__,
+            get_active_pdk().get_hash(),
+            f"{func.__module__}.{func.__qualname__}",
+            source,
+            settings,
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _get_cell(
+    func: Callable[..., Any],
+    kf_func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    key = _cell_key(func, args, kwargs)
+    if key is None:
+        return kf_func(*args, **kwargs)
+
+    component = _cells.get(key)
+    if component is not None and not component._destroyed():
+        return component
+
+    component = _load_cell(key)
+    if component is None:
+        _cell_cache_info["misses"] += 1
+        component = kf_func(*args, **kwargs)
+        _store_cell(key, component)
+    else:
+        _cell_cache_info["hits"] += 1
+    _cells[key] = component
+    return component
+
+
+def _bottom_up(top: kf.kdb.Cell) -> list[str]:
+    """Returns the names of the cells in the hierarchy of top, children first."""
+    layout = top.layout()
+    names: list[str] = []
+    visited: set[int] = set()
+
+    def visit(cell_index: int) -> None:
+        visited.add(cell_index)
+        for child in layout.cell(cell_index).each_child_cell():
+            if child not in visited:
+                visit(child)
+        names.append(layout.cell_name(cell_index))
+
+    visit(top.cell_index())
+    return names
+
+
+def _store_cell(key: str, component: kf.KCell) -> None:
+    """Writes the component hierarchy and its metadata to PATH.cell_cache."""
+    global _cell_cache_size
+
+    filepath = PATH.cell_cache / f"{key}.oas"
+    metapath = filepath.with_suffix(".json")
+    tmp = f".{os.getpid()}.tmp"
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        names = _bottom_up(component._kdb_cell)
+        for name in names:
+            component.kcl[name].set_meta_data()
+        options = kf.kcell.save_layout_options()
+        options.format = "OASIS"
+        component._kdb_cell.write(str(filepath) + tmp, options)
+        os.replace(str(filepath) + tmp, filepath)
+        # the metadata file is written last, as it marks the entry complete
+        metapath.with_suffix(tmp).write_text(json.dumps({"cells": names}))
+        os.replace(metapath.with_suffix(tmp), metapath)
+    except (OSError, RuntimeError, TypeError, ValueError):
+        for path in (filepath, metapath):
+            path.unlink(missing_ok=True)
+        return
+
+    _cell_cache_info["stores"] += 1
+    if _cell_cache_size is not None:
+        _cell_cache_size += filepath.stat().st_size + metapath.stat().st_size
+    if get_cell_cache_size() > CONF.cell_cache_max_size:
+        _evict_cells(keep=key)
+
+
+def _load_cell(key: str) -> kf.KCell | None:
+    """Returns the cached component read from PATH.cell_cache, or None."""
+    from gdsfactory.read.import_gds import component_from_meta_info
+
+    filepath = PATH.cell_cache / f"{key}.oas"
+    metapath = filepath.with_suffix(".json")
+    try:
+        names = json.loads(metapath.read_text())["cells"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    kcl = kf.kcl
+    layout = kcl.layout
+    if layout.cell(names[-1]) is not None:
+        # loaded before as part of the hierarchy of another cached cell
+        return kcl[names[-1]] if names[-1] in _loaded_names else None
+    new_names = [name for name in names if layout.cell(name) is None]
+    try:
+        layout.read(str(filepath), kf.kcell.load_layout_options())
+    except RuntimeError:
+        return None
+
+    for name in new_names:
+        component_from_meta_info(layout.cell(name), kcl=kcl)
+    _loaded_names.update(new_names)
+
+    os.utime(metapath)
+    return kcl[names[-1]]
+
+
+def get_cell_cache_size() -> int:
+    """Returns the size in bytes of the cell cache on disk."""
+    global _cell_cache_size
+
+    if _cell_cache_size is None:
+        _cell_cache_size = sum(
+            path.stat().st_size
+            for path in PATH.cell_cache.glob("*")
+            if path.suffix in {".oas", ".json"}
+        )
+    return _cell_cache_size
+
+
+def _evict_cells(keep: str | None = None) -> None:
+    """Deletes the least recently used cells until the cache fits.
+
+    The cache fits when it is at most CONF.cell_cache_max_size bytes.
+    """
+    global _cell_cache_size
+
+    entries = []
+    for metapath in PATH.cell_cache.glob("*.json"):
+        filepath = metapath.with_suffix(".oas")
+        try:
+            size = metapath.stat().st_size + filepath.stat().st_size
+            entries.append((metapath.stat().st_mtime, size, metapath, filepath))
+        except OSError:
+            continue
+    entries.sort(key=lambda entry: entry[0])
+
+    size = sum(entry[1] for entry in entries)
+    for _, entry_size, metapath, filepath in entries:
+        if size <= CONF.cell_cache_max_size:
+            break
+        if metapath.stem == keep:
+            continue
+        metapath.unlink(missing_ok=True)
+        filepath.unlink(missing_ok=True)
+        size -= entry_size
+        _cell_cache_info["evictions"] += 1
+    _cell_cache_size = size
+
+
+def get_cached_cell_names() -> dict[tuple[str, Any], str]:
+    """Returns the names of the cells built by the cell functions in this process.
+
+    Keys are the function and the kfactory key of its settings.
+    """
+    return {
+        (function, key): cell.name
+        for function, cache in _cell_caches.items()
+        for key, cell in cache.items()
+    }
+
+
+def register_cached_cells(
+    names: dict[tuple[str, Any], str], kcl: kf.KCLayout | None = None
+) -> None:
+    """Adds cells of the layout to the caches of the cell functions.
+
+    Calls with the same settings then return them instead of building
+    cells with the same name again.
+    Cells need to be loaded in kcl first, for example with component_from_meta_info.
+
+    Args:
+        names: cell names by function and settings key, from get_cached_cell_names.
+        kcl: layout with the cells.
+    """
+    kcl = kcl or kf.kcl
+    for (function, key), name in names.items():
+        cache = _cell_caches.get(function)
+        kdb_cell = kcl.layout.cell(name)
+        if cache is None or key in cache or kdb_cell is None:
+            continue
+        cache[key] = kcl[kdb_cell.cell_index()]
+
+
+def cell_cache_info() -> dict[str, int]:
+    """Returns the cell cache metrics of this session.
+
+    hits: cells loaded from disk.
+    misses: cells built because they were not on disk.
+    stores: cells written to disk.
+    evictions: cells deleted from disk to fit CONF.cell_cache_max_size.
+    size: bytes on disk.
+    """
+    return _cell_cache_info | {"size": get_cell_cache_size()}
+
+
+def clear_cell_cache() -> None:
+    """Clears the cell cache on disk and its metrics."""
+    global _cell_cache_size
+
+    _cells.clear()
+    _loaded_names.clear()
+    for path in PATH.cell_cache.glob("*"):
+        if path.suffix in {".oas", ".json"}:
+            path.unlink(missing_ok=True)
+    for name in _cell_cache_info:
+        _cell_cache_info[name] = 0
+    _cell_cache_size = None
+
+
+__all__ = [
+    "cell",
+    "cell_cache_info",
+    "clear_cell_cache",
+    "get_cached_cell_names",
+    "get_cell_cache_size",
+    "register_cached_cells",
+]
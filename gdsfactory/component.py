@@ -4,14 +4,15 @@ from __future__ import annotations
 
 import pathlib
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from typing import TYPE_CHECKING, Any
 
 import kfactory as kf
 import numpy as np
 from kfactory import Instance, kdb
-from kfactory.kcell import cell, save_layout_options
+from kfactory.kcell import save_layout_options
 
+from gdsfactory.cell import cell
 from gdsfactory.config import GDSDIR_TEMP
 from gdsfactory.port import pprint_ports, select_ports, to_dict
 from gdsfactory.serialization import clean_value_json
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
 cell_without_validator = cell
 ComponentReference = Instance
 
+PLOT_IMAGES_SIZE = 256
+# (kcl id, cell index, cell name, layer views hash, show_labels, show_ruler) -> PNG
+_plot_images: OrderedDict[tuple, bytes] = OrderedDict()
+
 
 def ensure_tuple_of_tuples(points) -> tuple[tuple[float, float]]:
     # Convert a single NumPy array to a tuple of tuples
@@ -76,6 +81,97 @@ boolean_operations = {
 }
 
 
+def _region_to_arrays(region: kdb.Region) -> tuple[np.ndarray, np.ndarray]:
+    """Returns (points, offsets) in dbu for the polygons of a region.
+
+    points is an (N, 2) int64 array with the vertices of all polygons, polygon i
+    being points[offsets[i]:offsets[i + 1]]. Holes are cut into the hull.
+    """
+    polygons = [polygon.to_simple_polygon() for polygon in region.each()]
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([polygon.num_points() for polygon in polygons])
+    points = np.fromiter(
+        (
+            xy
+            for polygon in polygons
+            for point in polygon.each_point()
+            for xy in (point.x, point.y)
+        ),
+        dtype=np.int64,
+        count=2 * int(offsets[-1]),
+    )
+    return points.reshape(-1, 2), offsets
+
+
+def _trans_to_matrix(trans: kdb.ICplxTrans, dbu: float) -> np.ndarray:
+    """Returns the 3x3 affine matrix of a transformation, in um."""
+    angle = np.deg2rad(trans.angle)
+    cos, sin = np.cos(angle) * trans.mag, np.sin(angle) * trans.mag
+    mirror = -1 if trans.is_mirror() else 1
+    return np.array(
+        [
+            [cos, -sin * mirror, trans.disp.x * dbu],
+            [sin, cos * mirror, trans.disp.y * dbu],
+            [0, 0, 1],
+        ]
+    )
+
+
+def _instance_to_matrices(instance: kdb.Instance, dbu: float) -> np.ndarray:
+    """Returns the (K, 3, 3) affine matrices (um) of the K members of an instance."""
+    matrix = _trans_to_matrix(instance.cplx_trans, dbu)
+    if not instance.is_regular_array():
+        return matrix[None]
+    a, b = instance.a, instance.b
+    i, j = np.meshgrid(np.arange(instance.na), np.arange(instance.nb), indexing="ij")
+    i, j = i.ravel(), j.ravel()
+    matrices = np.repeat(matrix[None], len(i), axis=0)
+    matrices[:, 0, 2] += (i * a.x + j * b.x) * dbu
+    matrices[:, 1, 2] += (i * a.y + j * b.y) * dbu
+    return matrices
+
+
+def _cells_top_down(cell: kdb.Cell) -> list[int]:
+    """Returns the indexes of cell and the cells it calls, parents first."""
+    layout = cell.layout()
+    cell_indexes: list[int] = []
+    visited: set[int] = set()
+
+    def visit(cell_index: int) -> None:
+        visited.add(cell_index)
+        for child in layout.cell(cell_index).each_child_cell():
+            if child not in visited:
+                visit(child)
+        cell_indexes.append(cell_index)
+
+    visit(cell.cell_index())
+    return cell_indexes[::-1]
+
+
+def _filter_polygons_by_bbox(
+    points: np.ndarray,
+    offsets: np.ndarray,
+    bbox: tuple[tuple[float, float], tuple[float, float]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Keeps the polygons whose bounding box overlaps bbox."""
+    (xmin, ymin), (xmax, ymax) = bbox
+    if len(offsets) == 1:
+        return points, offsets
+    starts = offsets[:-1]
+    pmin = np.minimum.reduceat(points, starts)
+    pmax = np.maximum.reduceat(points, starts)
+    keep = (
+        (pmax[:, 0] >= xmin)
+        & (pmin[:, 0] <= xmax)
+        & (pmax[:, 1] >= ymin)
+        & (pmin[:, 1] <= ymax)
+    )
+    lengths = np.diff(offsets)
+    new_offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+    new_offsets[1:] = np.cumsum(lengths[keep])
+    return points[np.repeat(keep, lengths)], new_offsets
+
+
 def copy(region: kdb.Region) -> kdb.Region:
     return region.dup()
 
@@ -138,6 +234,7 @@ class Component(kf.KCell):
         layer: LayerSpec | None = None,
         port_type: str = "optical",
         cross_section: CrossSection | None = None,
+        keep_mirror: bool = False,
     ) -> kf.Port:
         """Adds a Port to the Component.
 
@@ -150,9 +247,13 @@ class Component(kf.KCell):
             layer: layer spec to add port on.
             port_type: port type (optical, electrical, ...)
             cross_section: cross_section of the port.
+            keep_mirror: keep the mirror flag of port.
         """
+        if isinstance(name, kf.Port):
+            # kfactory passes the port first
+            name, port = None, name
         if port:
-            kf.KCell.add_port(self, port=port, name=name)
+            kf.KCell.add_port(self, port=port, name=name, keep_mirror=keep_mirror)
             return port
         else:
             from gdsfactory.pdk import get_cross_section, get_layer
@@ -191,6 +292,93 @@ class Component(kf.KCell):
                 dcplx_trans=trans,
             )
 
+    def create_ports(
+        self,
+        names: list[str | None],
+        centers: np.ndarray | list[tuple[float, float]],
+        orientations: float | np.ndarray | list[float],
+        widths: float | np.ndarray | list[float] | None = None,
+        layer: LayerSpec | None = None,
+        port_type: str | list[str] = "optical",
+        cross_section: CrossSection | None = None,
+    ) -> list[kf.Port]:
+        """Adds many Ports to the Component at once.
+
+        Same as calling add_port for each port, but the layer and cross_section
+        are resolved once and the centers and widths converted with NumPy.
+
+        Args:
+            names: of the ports.
+            centers: (N, 2) array with the centers of the ports in um.
+            orientations: of the ports in degrees, one for all or one per port.
+            widths: of the ports in um, one for all or one per port.
+                Defaults to the cross_section width.
+            layer: layer spec to add the ports on.
+            port_type: port type (optical, electrical, ...), one for all or one per
+                port.
+            cross_section: cross_section of the ports.
+        """
+        from gdsfactory.pdk import get_cross_section, get_layer
+
+        if layer is None or widths is None:
+            if cross_section is None:
+                raise ValueError("Must specify layer and width or cross_section")
+            xs = get_cross_section(cross_section)
+            layer = xs.layer if layer is None else layer
+            widths = xs.width if widths is None else widths
+        if orientations is None:
+            raise ValueError("Must specify orientations")
+        layer = get_layer(layer)
+
+        n = len(names)
+        dbu = self.kcl.dbu
+        port_types = [port_type] * n if isinstance(port_type, str) else port_type
+        centers = np.asarray(centers, dtype=np.float64).reshape(n, 2)
+        orientations = np.broadcast_to(np.asarray(orientations, dtype=np.float64), n)
+        widths = np.broadcast_to(np.asarray(widths, dtype=np.float64), n)
+
+        width_dbu = np.round(widths / dbu).astype(np.int64)
+        if (width_dbu % 2).any():
+            raise ValueError(
+                f"widths need to be even to snap to grid. Got {widths[width_dbu % 2 == 1]}"
+            )
+        # same rounding as DCplxTrans.to_itype, half away from zero
+        xy = centers / dbu
+        xy = np.trunc(xy + np.copysign(0.5, xy)).astype(np.int64)
+        # manhattan ports on grid get a simple transformation, like add_port
+        simple = (orientations % 90 == 0) & (xy * dbu == centers).all(axis=1)
+        angles = (orientations // 90 % 4).astype(np.int64)
+
+        ports = []
+        for name, port_type, is_simple, angle, orientation, point, center, width in zip(
+            names,
+            port_types,
+            simple.tolist(),
+            angles.tolist(),
+            orientations.tolist(),
+            xy.tolist(),
+            centers.tolist(),
+            width_dbu.tolist(),
+        ):
+            if is_simple:
+                port = self.create_port(
+                    name=name,
+                    width=width,
+                    layer=layer,
+                    port_type=port_type,
+                    trans=kdb.Trans(angle, False, *point),
+                )
+            else:
+                port = self.create_port(
+                    name=name,
+                    dwidth=width * dbu,
+                    layer=layer,
+                    port_type=port_type,
+                    dcplx_trans=kdb.DCplxTrans(1, orientation, False, *center),
+                )
+            ports.append(port)
+        return ports
+
     def from_kcell(self) -> Component:
         """Returns a Component from a KCell."""
         kdb_copy = self._kdb_copy()
@@ -257,6 +445,48 @@ class Component(kf.KCell):
         else:
             return polygon
 
+    def add_polygons(
+        self,
+        points: np.ndarray | list[np.ndarray],
+        layer: LayerSpec,
+        offsets: np.ndarray | None = None,
+    ) -> None:
+        """Adds many Polygons on one layer at once.
+
+        Much faster than calling add_polygon for each polygon: the points are
+        converted to dbu with NumPy and the polygons inserted in one operation.
+
+        Args:
+            points: (N, 2) array in um with the vertices of all polygons, or a list
+                of (Ni, 2) arrays, one per polygon.
+            layer: layer spec to add polygons on.
+            offsets: polygon i is points[offsets[i]:offsets[i + 1]].
+                Defaults to a single polygon for an array.
+        """
+        from gdsfactory.pdk import get_layer
+
+        layer = get_layer(layer)
+        if isinstance(points, list | tuple):
+            if not len(points):
+                return
+            sizes = [len(polygon) for polygon in points]
+            offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(sizes)
+            points = np.concatenate(points)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if offsets is None:
+            offsets = np.array([0, len(points)])
+
+        # same rounding as DPolygon.to_itype, half away from zero
+        xy = points / self.kcl.dbu
+        xy = np.trunc(xy + np.copysign(0.5, xy)).astype(np.int64)
+        vertices = list(map(kdb.Point, xy[:, 0].tolist(), xy[:, 1].tolist()))
+        polygons = [
+            kdb.Polygon(vertices[start:stop])
+            for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+        self.shapes(layer).insert(kdb.Region(polygons))
+
     def add_label(
         self,
         text: str = "hello",
@@ -325,7 +555,7 @@ class Component(kf.KCell):
             port_type: select ports with port_type (optical, electrical, vertical_te).
             clockwise: if True, sort ports clockwise, False: counter-clockwise.
         """
-        return select_ports(self.ports, **kwargs)
+        return select_ports(self, **kwargs)
 
     def add_route_info(
         self,
@@ -453,6 +683,138 @@ class Component(kf.KCell):
             polygons_points[layer_tuple] = all_points
         return polygons_points
 
+    def _get_layer_indexes(self, layers: list[LayerSpec] | None) -> dict[int, Layer]:
+        """Returns layer index to (layer, datatype) for layers, all if None."""
+        from gdsfactory import get_layer
+
+        if layers is None:
+            layer_indexes = self.kcl.layer_indexes()
+        else:
+            layer_indexes = [get_layer(layer) for layer in layers]
+        layer_to_tuple = {}
+        for layer_index in layer_indexes:
+            info = self.kcl.get_info(layer_index)
+            layer_to_tuple[layer_index] = (info.layer, info.datatype)
+        return layer_to_tuple
+
+    def get_polygons_arrays_by_cell(
+        self, layers: list[LayerSpec] | None = None
+    ) -> dict[str, tuple[dict[Layer, tuple[np.ndarray, np.ndarray]], np.ndarray]]:
+        """Returns the polygons of each unique cell and where the cell is placed.
+
+        Each cell in the hierarchy is only read once, so this is much cheaper
+        than flattening for arrays and repeated cells.
+
+        Args:
+            layers: layers to extract. Defaults to all layers.
+
+        Returns:
+            cell name to (polygons, transforms).
+            polygons maps (layer, datatype) to (points, offsets): points is an
+            (N, 2) array in um with the vertices of the polygons drawn in the cell
+            itself, polygon i being points[offsets[i]:offsets[i + 1]].
+            transforms is an (M, 3, 3) array with the affine matrices (um) of the M
+            placements of the cell in this component.
+        """
+        dbu = self.kcl.dbu
+        layer_to_tuple = self._get_layer_indexes(layers)
+
+        layout = self.kcl.layout
+
+        # top-down, so all placements of a cell are known before its children
+        placements: dict[int, list[np.ndarray]] = {self.cell_index(): [np.eye(3)[None]]}
+        cell_to_transforms: dict[int, np.ndarray] = {}
+        for cell_index in _cells_top_down(self._kdb_cell):
+            transforms = np.concatenate(placements.pop(cell_index))
+            cell_to_transforms[cell_index] = transforms
+            for instance in layout.cell(cell_index).each_inst():
+                members = _instance_to_matrices(instance, dbu)
+                placed = (transforms[:, None] @ members[None]).reshape(-1, 3, 3)
+                placements.setdefault(instance.cell_index, []).append(placed)
+
+        cells = {}
+        for cell_index, transforms in cell_to_transforms.items():
+            kdb_cell = layout.cell(cell_index)
+            polygons = {}
+            for layer_index, layer in layer_to_tuple.items():
+                shapes = kdb_cell.shapes(layer_index)
+                if shapes.is_empty():
+                    continue
+                points, offsets = _region_to_arrays(kdb.Region(shapes))
+                if len(offsets) > 1:
+                    polygons[layer] = (points * dbu, offsets)
+            if polygons:
+                cells[kdb_cell.name] = (polygons, transforms)
+        return cells
+
+    def get_polygons_arrays(
+        self,
+        layers: list[LayerSpec] | None = None,
+        bbox: tuple[tuple[float, float], tuple[float, float]] | None = None,
+        merge: bool = False,
+    ) -> dict[Layer, tuple[np.ndarray, np.ndarray]]:
+        """Returns packed NumPy arrays with the flattened polygons per layer.
+
+        Faster than get_polygons_points: each unique cell is read once and its
+        polygons are placed with vectorized transforms.
+
+        Args:
+            layers: layers to extract. Defaults to all layers.
+            bbox: ((xmin, ymin), (xmax, ymax)) in um. Only keeps polygons that
+                overlap it.
+            merge: if True, merges the polygons. Needs a flat Region.
+
+        Returns:
+            (layer, datatype) to (points, offsets): points is an (N, 2) array in um
+            and polygon i is points[offsets[i]:offsets[i + 1]].
+        """
+        polygons: dict[Layer, tuple[np.ndarray, np.ndarray]] = {}
+
+        if merge:
+            for layer_index, layer in self._get_layer_indexes(layers).items():
+                region = kdb.Region(self.begin_shapes_rec(layer_index))
+                region.merge()
+                points, offsets = _region_to_arrays(region)
+                if len(offsets) > 1:
+                    polygons[layer] = (points * self.kcl.dbu, offsets)
+
+        else:
+            layer_to_arrays = defaultdict(list)
+            for cell_polygons, transforms in self.get_polygons_arrays_by_cell(
+                layers=layers
+            ).values():
+                for layer, (points, offsets) in cell_polygons.items():
+                    # (M, N, 2): one copy of the cell points per placement
+                    placed = (
+                        np.einsum("mij,nj->mni", transforms[:, :2, :2], points)
+                        + transforms[:, None, :2, 2]
+                    )
+                    copies = np.arange(len(transforms))[:, None] * len(points)
+                    layer_to_arrays[layer].append(
+                        (placed.reshape(-1, 2), (offsets[:-1] + copies).ravel())
+                    )
+
+            for layer, arrays in layer_to_arrays.items():
+                starts, index = [], 0
+                for points, cell_starts in arrays:
+                    starts.append(cell_starts + index)
+                    index += len(points)
+                offsets = np.append(np.concatenate(starts), index)
+                points = np.concatenate([points for points, _ in arrays])
+                polygons[layer] = (points, offsets)
+
+        if bbox is not None:
+            polygons = {
+                layer: _filter_polygons_by_bbox(points, offsets, bbox)
+                for layer, (points, offsets) in polygons.items()
+            }
+            polygons = {
+                layer: arrays
+                for layer, arrays in polygons.items()
+                if len(arrays[1]) > 1
+            }
+        return polygons
+
     def area(self, layer: LayerSpec) -> float:
         """Returns the area of the Component in um2."""
         from gdsfactory import get_layer
@@ -717,6 +1079,10 @@ class Component(kf.KCell):
     ):
         """Plots the Component using klayout.
 
+        Renders from memory without writing a GDS. Images of locked components
+        are cached per cell, layer views content and view settings, keeping
+        the PLOT_IMAGES_SIZE most recently used.
+
         Args:
             show_labels: if True, shows labels.
             show_ruler: if True, shows ruler.
@@ -731,22 +1097,42 @@ class Component(kf.KCell):
 
         from gdsfactory.pdk import get_layer_views
 
-        gdspath = self.write_gds()
-        lyp_path = gdspath.with_suffix(".lyp")
-
-        layer_views = get_layer_views()
-        layer_views.to_lyp(filepath=lyp_path)
-
-        layout_view = lay.LayoutView()
-        layout_view.load_layout(str(gdspath.absolute()))
-        layout_view.max_hier()
-        layout_view.load_layer_props(str(lyp_path))
-
-        layout_view.set_config("text-visible", "true" if show_labels else "false")
-        layout_view.set_config("grid-show-ruler", "true" if show_ruler else "false")
-
-        pixel_buffer = layout_view.get_pixels_with_options(800, 600)
-        png_data = pixel_buffer.to_png_data()
+        lyp_path, lyp_hash = get_layer_views()._get_lyp()
+        key = None
+        png_data = None
+        if self._locked:
+            key = (
+                id(self.kcl),
+                self.cell_index(),
+                self.name,
+                lyp_hash,
+                show_labels,
+                show_ruler,
+            )
+            png_data = _plot_images.get(key)
+            if png_data is not None:
+                _plot_images.move_to_end(key)
+
+        if png_data is None:
+            # render a copy of the cell tree straight from memory
+            layout = kdb.Layout()
+            layout.dbu = self.kcl.dbu
+            layout.create_cell(self.name).copy_tree(self._kdb_cell)
+
+            layout_view = lay.LayoutView()
+            layout_view.show_layout(layout, False)
+            layout_view.max_hier()
+            layout_view.load_layer_props(str(lyp_path))
+
+            layout_view.set_config("text-visible", "true" if show_labels else "false")
+            layout_view.set_config("grid-show-ruler", "true" if show_ruler else "false")
+
+            pixel_buffer = layout_view.get_pixels_with_options(800, 600)
+            png_data = pixel_buffer.to_png_data()
+            if key:
+                _plot_images[key] = png_data
+                if len(_plot_images) > PLOT_IMAGES_SIZE:
+                    _plot_images.popitem(last=False)
 
         # Convert PNG data to NumPy array and display with matplotlib
         with BytesIO(png_data) as f:
@@ -809,6 +1195,40 @@ def container(component, function, **kwargs) -> Component:
     return c
 
 
+def _demo_polygons_arrays(columns: int = 20, rows: int = 20, repeat: int = 3) -> None:
+    """Times get_polygons_points against get_polygons_arrays on a ring array."""
+    import timeit
+
+    import gdsfactory as gf
+
+    c = gf.components.array(
+        gf.components.ring_single(), columns=columns, rows=rows, spacing=(100, 100)
+    )
+    for method in (c.get_polygons_points, c.get_polygons_arrays):
+        t = timeit.timeit(method, number=repeat) / repeat
+        print(f"{method.__name__}: {t * 1e3:.1f} ms")
+
+
+def _demo_create_ports(n: int = 10_000, repeat: int = 3) -> None:
+    """Times add_port in a loop against create_ports for n ports."""
+    import timeit
+
+    names = [f"e{i}" for i in range(n)]
+    centers = np.stack([np.arange(n) * 10.0, np.zeros(n)], axis=1)
+
+    def add_port() -> None:
+        c = Component()
+        for name, center in zip(names, centers.tolist()):
+            c.add_port(name, center=center, width=10, orientation=90, layer=(49, 0))
+
+    def create_ports() -> None:
+        Component().create_ports(names, centers, 90, 10, layer=(49, 0))
+
+    for function in (add_port, create_ports):
+        t = timeit.timeit(function, number=repeat) / repeat
+        print(f"{function.__name__}: {t * 1e3:.1f} ms")
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
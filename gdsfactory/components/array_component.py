@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.cell import cell
 from gdsfactory.component import Component
@@ -59,7 +61,40 @@ def array(
     ref.center = (0, 0) if centered else old_center
     center_shift = ref.center - old_center
 
-    if add_ports and component.ports:
+    ports = list(component.ports)
+    if (
+        add_ports
+        and ports
+        and len({port.layer for port in ports}) == 1
+        and not any(dict(port.info) for port in ports)
+        and not any(port.dcplx_trans.is_mirror() for port in ports)
+    ):
+        # all ports alike and not mirrored, create them in one pass
+        offsets = np.array(
+            [
+                (col * spacing[0], row * spacing[1])
+                for col in range(int(columns))
+                for row in range(int(rows))
+            ]
+        ).reshape(-1, 1, 2)
+        offsets = offsets + np.array([center_shift.x, center_shift.y]) * c.kcl.dbu
+        centers = offsets + np.array([port.d.center for port in ports])
+        names = [
+            f"{port.name}_{row+1}_{col+1}"
+            for col in range(int(columns))
+            for row in range(int(rows))
+            for port in ports
+        ]
+        n = len(offsets)
+        c.create_ports(
+            names,
+            centers.reshape(-1, 2),
+            np.tile([port.orientation for port in ports], n),
+            np.tile([port.d.width for port in ports], n),
+            layer=ports[0].layer,
+            port_type=[port.port_type for port in ports] * n,
+        )
+    elif add_ports and ports:
         for col in range(int(columns)):
             for row in range(int(rows)):
                 for port in component.ports:
@@ -67,7 +102,7 @@ def array(
                     port.x += col * spacing[0] / c.kcl.dbu + center_shift.x
                     port.y += row * spacing[1] / c.kcl.dbu + center_shift.y
                     name = f"{port.name}_{row+1}_{col+1}"
-                    c.add_port(name, port=port)
+                    c.add_port(name, port=port, keep_mirror=True)
     return c
 
 
@@ -181,14 +181,16 @@ def grating_coupler_elliptical(
     gap = gf.snap.snap_to_grid(period - grating_line_width)
 
     xi = taper_length
+    teeth = []
     for p in range(n_periods):
         xi += gap + width / 2
         p = xi / period
         pts = grating_tooth_points(
             p * a1, p * b1, p * x1, width, taper_angle, spiked=spiked
         )
-        c.add_polygon(pts, layer)
+        teeth.append(pts)
         xi += width / 2
+    c.add_polygons(teeth, layer)
 
     w = 1.0
     total_length = (
@@ -101,11 +101,11 @@ def grating_coupler_elliptical_arbitrary(
     ps = np.divide(xis, periods)
 
     # grating teeth
-    for a1, b1, x1, p, width in zip(a1s, b1s, x1s, ps, widths):
-        pts = grating_tooth_points(
-            p * a1, p * b1, p * x1, width, taper_angle, spiked=spiked
-        )
-        c.add_polygon(pts, layer_grating)
+    teeth = [
+        grating_tooth_points(p * a1, p * b1, p * x1, width, taper_angle, spiked=spiked)
+        for a1, b1, x1, p, width in zip(a1s, b1s, x1s, ps, widths)
+    ]
+    c.add_polygons(teeth, layer_grating)
 
     # taper
     p = taper_length / periods[0]  # (gaps[0]+widths[0])
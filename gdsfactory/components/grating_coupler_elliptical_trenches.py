@@ -82,15 +82,17 @@ def grating_coupler_elliptical_trenches(
     c = gf.Component()
 
     # Make each grating line
-    for p in range(p_start, p_start + n_periods + 1):
-        pts = grating_tooth_points(
+    trenches = [
+        grating_tooth_points(
             p * a1,
             p * b1,
             p * x1,
             width=trench_line_width,
             taper_angle=taper_angle + trenches_extra_angle,
         )
-        c.add_polygon(pts, layer_trench)
+        for p in range(p_start, p_start + n_periods + 1)
+    ]
+    c.add_polygons(trenches, layer_trench)
 
     # Make the taper
     p_taper = p_start - 1
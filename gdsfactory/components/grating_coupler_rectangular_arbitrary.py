@@ -104,6 +104,7 @@ def grating_coupler_rectangular_arbitrary(
 
     y0 = width_grating / 2
 
+    teeth = []
     for width, gap in zip(widths, gaps):
         xi += gap
         points = snap_to_grid(
@@ -116,11 +117,9 @@ def grating_coupler_rectangular_arbitrary(
                 ]
             )
         )
-        c.add_polygon(
-            points,
-            layer_grating,
-        )
+        teeth.append(points)
         xi += width
+    c.add_polygons(teeth, layer_grating)
 
     if layer_slab:
         slab_xmin = length_taper - slab_offset
@@ -1,49 +1,168 @@
 from __future__ import annotations
 
 import itertools as it
+import multiprocessing
+import pathlib
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
+import kfactory as kf
+from rich.progress import track
+
 import gdsfactory as gf
+from gdsfactory.cell import get_cached_cell_names, register_cached_cells
 from gdsfactory.component import Component
 from gdsfactory.grid import grid, grid_with_text
 from gdsfactory.pack import pack
+from gdsfactory.read.import_gds import component_from_meta_info
 from gdsfactory.typings import CellSpec, ComponentSpec
 
 _doe = "mmi1x2"
 _settings = dict(length_mmi=(2.5, 100), width_mmi=(4, 10))
 
 
+def _get_settings_list(
+    settings: dict[str, list[Any]], do_permutations: bool
+) -> list[dict[str, Any]]:
+    if do_permutations:
+        return [dict(zip(settings, t)) for t in it.product(*settings.values())]
+    return [dict(zip(settings, t)) for t in zip(*settings.values())]
+
+
+def _build_doe_component(
+    doe: ComponentSpec, settings: dict[str, Any], function: CellSpec | None
+) -> Component:
+    component = gf.get_component(doe, **settings)
+    if function:
+        component = function(component)
+    return component
+
+
+def _write_doe_component(
+    doe: ComponentSpec,
+    settings: dict[str, Any],
+    function: CellSpec | None,
+    dirpath: str,
+) -> tuple[str, str, dict[tuple[str, Any], str]]:
+    """Builds a DOE component in a worker process and writes it to OASIS.
+
+    Returns the component name, the OASIS file path and the names of the cells
+    built by the cell functions, by function and settings key.
+    """
+    cached = get_cached_cell_names()
+    component = _build_doe_component(doe, settings, function)
+    filepath = pathlib.Path(dirpath) / f"{component.name}.oas"
+    component.write(
+        filename=str(filepath),
+        save_options=kf.kcell.save_layout_options(format="OASIS"),
+    )
+
+    names = {}
+    for key, name in get_cached_cell_names().items():
+        if key in cached:
+            continue
+        try:
+            pickle.dumps(key)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # settings with lambdas or local functions
+            continue
+        names[key] = name
+    return component.name, str(filepath), names
+
+
+def _read_doe_component(
+    name: str, filepath: str, names: dict[tuple[str, Any], str]
+) -> Component:
+    """Merges a DOE component written by a worker into the active layout.
+
+    Cells that already exist in the layout (shared sub-cells or variants built before)
+    are kept, as cell names are deterministic for the same function and settings.
+    New cells are added to the caches of their cell functions,
+    so building them again in this process returns the same cells.
+    """
+    options = kf.kcell.load_layout_options()
+    options.cell_conflict_resolution = (
+        kf.kdb.LoadLayoutOptions.CellConflictResolution.SkipNewCell
+    )
+    gf.kcl.read(filepath, options, test_merge=False)
+    kdb_cell = gf.kcl.layout.cell(name)
+    for cell_index in [*kdb_cell.called_cells(), kdb_cell.cell_index()]:
+        if cell_index not in gf.kcl.kcells:
+            component_from_meta_info(gf.kcl.layout.cell(cell_index))
+    register_cached_cells(names)
+    return gf.kcl[kdb_cell.cell_index()]
+
+
 def generate_doe(
     doe: ComponentSpec,
     settings: dict[str, list[Any]],
     do_permutations: bool = False,
     function: CellSpec | None = None,
+    max_workers: int | None = None,
+    progress: bool = False,
 ) -> tuple[tuple[Component, ...], tuple[dict, ...]]:
     """Generates a component DOE (Design of Experiment).
 
     which can then be packed, or used elsewhere.
 
+    With max_workers > 1 each variant is built in a separate process,
+    written to OASIS and merged back into the active layout.
+    Workers are forked so they inherit the active PDK,
+    and the doe, settings and function need to be picklable.
+    Components are returned in the same order as the settings, with the same names
+    as when they are built serially.
+    Cells built by workers are added to the cell function caches of this process.
+
     Args:
         doe: function to return Components.
         settings: component settings.
         do_permutations: for each setting.
         function: for the component (add padding, grating couplers ...)
+        max_workers: number of worker processes. None or 1 builds in this process.
+        progress: shows a progress bar.
     """
-    if do_permutations:
-        settings_list = [dict(zip(settings, t)) for t in it.product(*settings.values())]
-    else:
-        settings_list = [dict(zip(settings, t)) for t in zip(*settings.values())]
+    settings_list = _get_settings_list(settings, do_permutations)
 
     if function:
         function = gf.get_cell(function)
         if not callable(function):
             raise ValueError(f"Error {function!r} needs to be callable.")
-        component_list = [
-            function(gf.get_component(doe, **settings)) for settings in settings_list
-        ]
+
+    description = "Generating DOE"
+    if max_workers and max_workers > 1 and len(settings_list) > 1:
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        n = len(settings_list)
+        with (
+            tempfile.TemporaryDirectory() as dirpath,
+            ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=context
+            ) as executor,
+        ):
+            results = executor.map(
+                _write_doe_component,
+                [doe] * n,
+                settings_list,
+                [function] * n,
+                [dirpath] * n,
+            )
+            if progress:
+                results = track(results, total=n, description=description)
+            component_list = [
+                _read_doe_component(name, filepath, names)
+                for name, filepath, names in results
+            ]
     else:
+        iterable = (
+            track(settings_list, description=description) if progress else settings_list
+        )
         component_list = [
-            gf.get_component(doe, **settings) for settings in settings_list
+            _build_doe_component(doe, settings, function) for settings in iterable
         ]
 
     component_list = tuple(component_list)
@@ -56,6 +175,8 @@ def pack_doe(
     settings: dict[str, tuple[Any, ...]] = _settings,
     do_permutations: bool = False,
     function: CellSpec | None = None,
+    max_workers: int | None = None,
+    progress: bool = False,
     **kwargs,
 ) -> Component:
     """Packs a component DOE (Design of Experiment) using pack.
@@ -65,6 +186,8 @@ def pack_doe(
         settings: component settings.
         do_permutations: for each setting.
         function: to apply (add padding, grating couplers).
+        max_workers: number of worker processes to build the DOE (see generate_doe).
+        progress: shows a progress bar while building the DOE.
 
     keyword Args:
         spacing: Minimum distance between adjacent shapes.
@@ -84,7 +207,12 @@ def pack_doe(
         v_mirror: vertical mirror using x axis (1, y) (0, y).
     """
     component_list, settings_list = generate_doe(
-        doe, settings, do_permutations, function
+        doe,
+        settings,
+        do_permutations,
+        function,
+        max_workers=max_workers,
+        progress=progress,
     )
 
     c = pack(component_list=component_list, **kwargs)
@@ -105,6 +233,8 @@ def pack_doe_grid(
     do_permutations: bool = False,
     function: CellSpec | None = None,
     with_text: bool = False,
+    max_workers: int | None = None,
+    progress: bool = False,
     **kwargs,
 ) -> Component:
     """Packs a component DOE (Design of Experiment) using grid.
@@ -115,6 +245,8 @@ def pack_doe_grid(
         do_permutations: for each setting.
         function: to apply to component (add padding, grating couplers).
         with_text: includes text label.
+        max_workers: number of worker processes to build the DOE (see generate_doe).
+        progress: shows a progress bar while building the DOE.
 
     keyword Args:
         spacing: between adjacent elements on the grid, can be a tuple for
@@ -131,25 +263,14 @@ def pack_doe_grid(
         h_mirror: horizontal mirror y axis (x, 1) (1, 0). most common mirror.
         v_mirror: vertical mirror using x axis (1, y) (0, y).
     """
-    if do_permutations:
-        settings_list = [dict(zip(settings, t)) for t in it.product(*settings.values())]
-    else:
-        settings_list = [dict(zip(settings, t)) for t in zip(*settings.values())]
-
-    if function:
-        function = gf.get_cell(function)
-        if not callable(function):
-            raise ValueError(f"Error {function!r} needs to be callable.")
-        component_list = [
-            function(gf.get_component(doe, **settings)) for settings in settings_list
-        ]
-    else:
-        component_list = [
-            gf.get_component(doe, **settings) for settings in settings_list
-        ]
-
-    component_list = tuple(component_list)
-    settings_list = tuple(settings_list)
+    component_list, settings_list = generate_doe(
+        doe,
+        settings,
+        do_permutations,
+        function,
+        max_workers=max_workers,
+        progress=progress,
+    )
 
     if with_text:
         c = grid_with_text(component_list, **kwargs)
@@ -100,16 +100,20 @@ def pad_array(
     c.add_array(pad, columns=columns, rows=rows, spacing=spacing)
     width = size[0] if port_orientation in {90, 270} else size[1]
 
-    for col in range(columns):
-        for row in range(rows):
-            c.add_port(
-                name=f"e{row+1}{col+1}",
-                center=(col * spacing[0], row * spacing[1]),
-                width=width,
-                orientation=port_orientation,
-                port_type="electrical",
-                layer=layer,
-            )
+    names = [f"e{row+1}{col+1}" for col in range(columns) for row in range(rows)]
+    centers = [
+        (col * spacing[0], row * spacing[1])
+        for col in range(columns)
+        for row in range(rows)
+    ]
+    c.create_ports(
+        names,
+        centers,
+        port_orientation,
+        width,
+        port_type="electrical",
+        layer=layer,
+    )
     return c
 
 
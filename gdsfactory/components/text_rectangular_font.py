@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from functools import cache
 
+import numpy as np
+
 from gdsfactory.cell import cell
 from gdsfactory.component import Component
 from gdsfactory.typings import LayerSpec
@@ -32,22 +34,18 @@ def pixel_array(
     component = Component()
     lines = [line for line in pixels.split("\n") if len(line) > 0]
     lines.reverse()
-    i = 0
-    i_max = 0
-    a = pixel_size
-    for j, line in enumerate(lines):
-        i = 0
-        for c in line:
-            if c in ["X", "1"]:
-                pixel = [
-                    (i * a, j * a),
-                    ((i + 1) * a, j * a),
-                    ((i + 1) * a, (j + 1) * a),
-                    (i * a, (j + 1) * a),
-                ]
-                component.add_polygon(pixel, layer=layer)
-            i += 1
-        i_max = max(i_max, i)
+    ij = np.array(
+        [
+            (i, j)
+            for j, line in enumerate(lines)
+            for i, c in enumerate(line)
+            if c in "X1"
+        ]
+    ).reshape(-1, 2)
+    square = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+    points = (ij[:, None, :] + square) * pixel_size
+    offsets = np.arange(0, 4 * len(ij) + 1, 4)
+    component.add_polygons(points.reshape(-1, 2), layer=layer, offsets=offsets)
     return component
 
 
@@ -222,6 +222,10 @@ class Settings(BaseSettings):
         loglevel: Log level.
         pdk: PDK to use. Defaults to generic.
         difftest_ignore_cell_name_differences: Ignore cell name differences in difftest.
+        yaml_cache: Cache compiled YAML netlists on disk in PATH.yaml_cache.
+        yaml_cache_max_size: Maximum size in bytes of the YAML cache on disk.
+        cell_cache: Cache cells on disk in PATH.cell_cache across sessions.
+        cell_cache_max_size: Maximum size in bytes of the cell cache on disk.
     """
 
     n_threads: int = get_number_of_cores()
@@ -259,6 +263,18 @@ class Settings(BaseSettings):
         default="ignore", description="When connecting ports with different types."
     )
     default_show_suffix: Literal[".oas", ".gds"] = ".gds"
+    yaml_cache: bool = Field(
+        default=False, description="Cache compiled YAML netlists on disk."
+    )
+    yaml_cache_max_size: int = Field(
+        default=2**27, description="Maximum size in bytes of the YAML cache on disk."
+    )
+    cell_cache: bool = Field(
+        default=False, description="Cache cells on disk across sessions."
+    )
+    cell_cache_max_size: int = Field(
+        default=2**30, description="Maximum size in bytes of the cell cache on disk."
+    )
     raise_error_on_mutation: bool = True
     logger: ClassVar[Logger] = logger
     logfilter: LogFilter = Field(default_factory=LogFilter)
@@ -289,6 +305,8 @@ class Paths:
     gdslib = home / ".gdsfactory"
     modes = gdslib / "modes"
     sparameters = gdslib / "sp"
+    yaml_cache = gdslib / "yaml"
+    cell_cache = gdslib / "cells"
     capacitance = gdslib / "capacitance"
     interconnect = gdslib / "interconnect"
     optimiser = repo_path / "tune"
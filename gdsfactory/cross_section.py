@@ -9,7 +9,8 @@ from __future__ import annotations
 import hashlib
 import sys
 import warnings
-from collections.abc import Callable, Iterable
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from functools import partial
 from inspect import getmembers, signature
 from types import ModuleType
@@ -166,6 +167,10 @@ class ComponentAlongPath(BaseModel):
 
 Sections = tuple[Section, ...]
 
+_cross_section_names: dict[int, str] = {}
+CROSS_SECTION_COPIES_SIZE = 1024
+_cross_section_copies: dict[int, dict[str, CrossSection]] = {}
+
 
 class CrossSection(BaseModel):
     """Waveguide information to extrude a path.
@@ -239,8 +244,17 @@ class CrossSection(BaseModel):
 
     @property
     def name(self) -> str:
+        xs_id = id(self)
+        if xs_id in _cross_section_names:
+            return _cross_section_names[xs_id]
+
         h = hashlib.md5(str(self).encode()).hexdigest()[:8]
-        return f"xs_{h}"
+        name = f"xs_{h}"
+        # bbox_layers can be a lazy iterator whose repr changes once consumed
+        if not isinstance(self.bbox_layers, Iterator):
+            _cross_section_names[xs_id] = name
+            weakref.finalize(self, _cross_section_names.pop, xs_id, None)
+        return name
 
     @property
     def width(self) -> float:
@@ -272,6 +286,9 @@ class CrossSection(BaseModel):
     ) -> CrossSection:
         """Returns copy of the cross_section with new parameters.
 
+        CrossSections are immutable, so the same instance is returned when nothing
+        changes, and copies with the same parameters are shared.
+
         Args:
             width: of the section (um). Defaults to current width.
             layer: layer spec. Defaults to current layer.
@@ -287,11 +304,34 @@ class CrossSection(BaseModel):
             bbox_offsets: offset to add to the bounding box.
 
         """
+        changed = width_function or offset_function or width or layer or sections
+        if not changed and not kwargs:
+            return self
+
+        # repr keeps 1 and 1.0 apart, as they give different names
+        key = repr(
+            (
+                width,
+                layer,
+                width_function,
+                offset_function,
+                sections,
+                sorted(kwargs.items()),
+            )
+        )
+        xs_id = id(self)
+        if xs_id not in _cross_section_copies:
+            _cross_section_copies[xs_id] = {}
+            weakref.finalize(self, _cross_section_copies.pop, xs_id, None)
+        copies = _cross_section_copies[xs_id]
+        if key in copies:
+            return copies[key]
+
         for kwarg in kwargs:
             if kwarg not in dict(self):
                 raise ValueError(f"{kwarg!r} not in CrossSection")
 
-        if width_function or offset_function or width or layer or sections:
+        if changed:
             if sections is None:
                 sections = self.sections
             sections = [s.model_copy() for s in sections]
@@ -303,8 +343,14 @@ class CrossSection(BaseModel):
                     "layer": layer or self.layer,
                 }
             )
-            return self.model_copy(update={"sections": tuple(sections), **kwargs})
-        return self.model_copy(update=kwargs)
+            xs = self.model_copy(update={"sections": tuple(sections), **kwargs})
+        else:
+            xs = self.model_copy(update=kwargs)
+
+        if len(copies) >= CROSS_SECTION_COPIES_SIZE:
+            copies.pop(next(iter(copies)))
+        copies[key] = xs
+        return xs
 
     def mirror(self) -> CrossSection:
         """Returns a mirrored copy of the cross_section."""
@@ -2425,6 +2471,23 @@ xs_pn_with_trenches_asymmetric = pn_with_trenches_asymmetric()
 cross_sections = get_cross_sections(sys.modules[__name__])
 
 
+def _demo_cross_section_lookup(n: int = 10_000) -> None:
+    """Times cross_section lookups and names as used by routing and extrude."""
+    import timeit
+
+    from gdsfactory.pdk import get_cross_section
+
+    xs = get_cross_section("xs_sc")
+    for label, statement in [
+        ("name", lambda: xs.name),
+        ("get_cross_section", lambda: get_cross_section("xs_sc")),
+        ("get_cross_section(width)", lambda: get_cross_section("xs_sc", width=1)),
+        ("copy(width).name", lambda: xs.copy(width=1).name),
+    ]:
+        t = timeit.timeit(statement, number=n) / n
+        print(f"{label}: {t * 1e6:.2f} us")
+
+
 if __name__ == "__main__":
     # xs = gf.cross_section.pn(
     #     # slab_offset=0
@@ -0,0 +1,154 @@
+"""Batched extrusion of the merged polygons of each layer into a single mesh."""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
+
+import kfactory as kf
+import numpy as np
+
+from gdsfactory.component import Component
+from gdsfactory.typings import Layer
+
+Rings = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def region_to_rings(region: kf.kdb.Region, dbu: float) -> Rings:
+    """Returns (points, ring_offsets, polygon_offsets) for the polygons of a region.
+
+    points is an (N, 2) array in um and ring i is
+    points[ring_offsets[i]:ring_offsets[i + 1]]. Polygon j is made of rings
+    polygon_offsets[j]:polygon_offsets[j + 1], the hull and then the holes.
+    KLayout keeps the inside of each ring on its right.
+    """
+    xy: list[int] = []
+    ring_sizes = []
+    polygon_sizes = []
+    for polygon in region.each_merged():
+        ring_sizes.append(polygon.num_points_hull())
+        xy.extend(c for point in polygon.each_point_hull() for c in (point.x, point.y))
+        for hole in range(polygon.holes()):
+            ring_sizes.append(polygon.num_points_hole(hole))
+            xy.extend(
+                c for point in polygon.each_point_hole(hole) for c in (point.x, point.y)
+            )
+        polygon_sizes.append(polygon.holes() + 1)
+
+    points = np.array(xy, dtype=np.float64).reshape(-1, 2) * dbu
+    ring_offsets = np.zeros(len(ring_sizes) + 1, dtype=np.int64)
+    ring_offsets[1:] = np.cumsum(ring_sizes)
+    polygon_offsets = np.zeros(len(polygon_sizes) + 1, dtype=np.int64)
+    polygon_offsets[1:] = np.cumsum(polygon_sizes)
+    return points, ring_offsets, polygon_offsets
+
+
+def extrude_rings(
+    rings: Rings, zmin: float, height: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns (vertices, faces) of a closed mesh extruding the rings.
+
+    The caps of all polygons are triangulated with earcut, and the side walls
+    and the vertices of the caps are built with vectorized NumPy indexing.
+
+    Args:
+        rings: (points, ring_offsets, polygon_offsets) from region_to_rings.
+        zmin: bottom of the mesh.
+        height: of the mesh.
+    """
+    import mapbox_earcut
+
+    points, ring_offsets, polygon_offsets = rings
+    n = len(points)
+
+    caps = []
+    for start, stop in zip(polygon_offsets[:-1], polygon_offsets[1:]):
+        first = ring_offsets[start]
+        ends = (ring_offsets[start + 1 : stop + 1] - first).astype(np.uint32)
+        triangles = mapbox_earcut.triangulate_float64(
+            points[first : ring_offsets[stop]], ends
+        )
+        caps.append(triangles.astype(np.int64) + first)
+    top = np.concatenate(caps).reshape(-1, 3) if caps else np.empty((0, 3), np.int64)
+
+    # orient the top triangles up and the bottom ones down
+    a, b, c = points[top[:, 0]], points[top[:, 1]], points[top[:, 2]]
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (
+        c[:, 0] - a[:, 0]
+    )
+    top[area < 0] = top[area < 0][:, ::-1]
+    bottom = top[:, ::-1]
+
+    # the inside of the rings is on the right of each edge, walls face left
+    i = np.arange(n)
+    j = i + 1
+    j[ring_offsets[1:] - 1] = ring_offsets[:-1]
+    walls = np.concatenate(
+        [np.stack([i, j + n, j], axis=1), np.stack([i, i + n, j + n], axis=1)]
+    )
+
+    vertices = np.empty((2 * n, 3))
+    vertices[:n, :2] = points
+    vertices[n:, :2] = points
+    vertices[:n, 2] = zmin
+    vertices[n:, 2] = zmin + height
+    faces = np.concatenate([bottom, top + n, walls])
+    return vertices, faces
+
+
+def extrude_layers(
+    component: Component,
+    extrusions: dict[Hashable, tuple[Layer, float, float]],
+    bbox: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    max_workers: int | None = None,
+) -> dict[Hashable, tuple[np.ndarray, np.ndarray]]:
+    """Returns (vertices, faces) per extrusion, one merged mesh for each.
+
+    The polygons of each layer are read and merged once, even if several
+    extrusions use the layer.
+
+    Args:
+        component: to extrude.
+        extrusions: key to (layer, zmin, height). Layers without polygons are
+            skipped.
+        bbox: ((xmin, ymin), (xmax, ymax)) in um. Crops the polygons to it.
+        max_workers: number of worker processes to extrude the layers.
+            None or 1 extrudes them in this process.
+    """
+    from gdsfactory.pdk import get_layer
+
+    dbu = component.kcl.dbu
+    layer_indexes = set(component.kcl.layer_indexes())
+    layer_to_rings: dict[Layer, Rings | None] = {}
+
+    args = {}
+    for key, (layer, zmin, height) in extrusions.items():
+        if layer not in layer_to_rings:
+            layer_to_rings[layer] = None
+            layer_index = get_layer(layer)
+            if layer_index not in layer_indexes:
+                continue
+            region = kf.kdb.Region(component.begin_shapes_rec(layer_index))
+            if bbox is not None:
+                (xmin, ymin), (xmax, ymax) = bbox
+                box = kf.kdb.DBox(xmin, ymin, xmax, ymax).to_itype(dbu)
+                region &= kf.kdb.Region(box)
+            if not region.is_empty():
+                layer_to_rings[layer] = region_to_rings(region, dbu)
+        rings = layer_to_rings[layer]
+        if rings is not None:
+            args[key] = (rings, zmin, height)
+
+    if max_workers and max_workers > 1 and len(args) > 1:
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context
+        ) as executor:
+            meshes = executor.map(extrude_rings, *zip(*args.values()))
+            return dict(zip(args, meshes))
+    return {key: extrude_rings(*key_args) for key, key_args in args.items()}
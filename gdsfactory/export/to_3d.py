@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import shapely
-
 from gdsfactory.component import Component
+from gdsfactory.export.extrude import extrude_layers
 from gdsfactory.technology import LayerStack, LayerViews
 from gdsfactory.typings import Layer
 
@@ -12,9 +11,14 @@ def to_3d(
     layer_views: LayerViews | None = None,
     layer_stack: LayerStack | None = None,
     exclude_layers: tuple[Layer, ...] | None = None,
+    bbox: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    max_workers: int | None = None,
 ):
     """Return Component 3D trimesh Scene.
 
+    The scene has one mesh per layer, so it can be exported to GLB with
+    scene.export("component.glb").
+
     Args:
         component: to extrude in 3D.
         layer_views: layer colors from Klayout Layer Properties file.
@@ -22,12 +26,14 @@ def to_3d(
         layer_stack: contains thickness and zmin for each layer.
             Defaults to active PDK.layer_stack.
         exclude_layers: layers to exclude.
+        bbox: ((xmin, ymin), (xmax, ymax)) in um. Crops the polygons to it.
+        max_workers: number of worker processes to extrude the layers.
 
     """
     from gdsfactory.pdk import get_active_pdk, get_layer_stack, get_layer_views
 
     try:
-        from trimesh.creation import extrude_polygon
+        from trimesh import Trimesh
         from trimesh.scene import Scene
     except ImportError as e:
         print("you need to `pip install trimesh`")
@@ -40,31 +46,32 @@ def to_3d(
     exclude_layers = exclude_layers or ()
 
     component_with_booleans = layer_stack.get_component_with_derived_layers(component)
-    polygons_per_layer = component_with_booleans.get_polygons_points(merge=True)
-    component_layers = polygons_per_layer.keys()
-    has_polygons = False
-
-    for level in layer_stack.layers.values():
-        layer = level.layer
-
-        if layer not in exclude_layers and layer in component_layers:
-            height = level.thickness
-            zmin = level.zmin
-            layer_view = layer_views.get_from_tuple(layer)
-            color_rgb = [
-                c / 255 for c in layer_view.fill_color.as_rgb_tuple(alpha=False)
-            ]
-            polygons = polygons_per_layer[layer]
-
-            if zmin is not None and layer_view.visible:
-                has_polygons = True
-
-                for polygon in polygons:
-                    p = shapely.geometry.Polygon(polygon)
-                    mesh = extrude_polygon(p, height=height)
-                    mesh.apply_translation((0, 0, zmin))
-                    mesh.visual.face_colors = (*color_rgb, 0.5)
-                    scene.add_geometry(mesh)
+    component_layers = {
+        layer
+        for layer_index, layer in component_with_booleans._get_layer_indexes(
+            None
+        ).items()
+        if not component_with_booleans.bbox(layer_index).empty()
+    }
+    extrusions = {
+        level_name: (level.layer, level.zmin, level.thickness)
+        for level_name, level in layer_stack.layers.items()
+        if level.layer not in exclude_layers
+        and level.layer in component_layers
+        and level.zmin is not None
+        and layer_views.get_from_tuple(level.layer).visible
+    }
+    level_to_mesh = extrude_layers(
+        component_with_booleans, extrusions, bbox=bbox, max_workers=max_workers
+    )
+    has_polygons = bool(level_to_mesh)
+
+    for level_name, (vertices, faces) in level_to_mesh.items():
+        layer_view = layer_views.get_from_tuple(extrusions[level_name][0])
+        color_rgb = [c / 255 for c in layer_view.fill_color.as_rgb_tuple(alpha=False)]
+        mesh = Trimesh(vertices, faces, process=False)
+        mesh.visual.face_colors = (*color_rgb, 0.5)
+        scene.add_geometry(mesh, geom_name=level_name)
     if not has_polygons:
         raise ValueError(
             f"{component.name!r} does not have polygons defined in the "
@@ -7,10 +7,14 @@ See Also:
 - https://github.com/jamesbowman/cuflow/blob/master/gerber.py
 """
 
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel
 
 from gdsfactory import Component
 
@@ -63,14 +67,82 @@ def polygon(pp):
     return "G36*\n" + points(pp) + "G37*\n" + "\n"
 
 
+def polygons(
+    pp: np.ndarray, offsets: np.ndarray, chunk_size: int = 10_000
+) -> Iterator[str]:
+    """Yields the Gerber regions of packed polygons in chunks of chunk_size.
+
+    Args:
+        pp: (N, 2) array with the vertices of all polygons.
+        offsets: polygon i is pp[offsets[i]:offsets[i + 1]].
+        chunk_size: number of polygons per chunk.
+    """
+    xy = np.rint(pp * 10000).astype(np.int64)
+    lines = list(
+        map("X{:07d}Y{:07d}D01*\n".format, xy[:, 0].tolist(), xy[:, 1].tolist())
+    )
+    starts = offsets[:-1].tolist()
+    for i in starts:
+        lines[i] = lines[i][:-5] + "D02*\n"
+
+    bounds = list(zip(starts, offsets[1:].tolist()))
+    for chunk in range(0, len(bounds), chunk_size):
+        yield "".join(
+            "G36*\n" + "".join(lines[a:b]) + "G37*\n\n"
+            for a, b in bounds[chunk : chunk + chunk_size]
+        )
+
+
+def _write_gerber_layer(
+    filename: Path,
+    layer: GerberLayer,
+    options: GerberOptions,
+    header: list[str],
+    pp: np.ndarray,
+    offsets: np.ndarray,
+) -> None:
+    """Writes the polygons of one layer to a Gerber file."""
+    with open(filename, "w+", buffering=1 << 20) as f:
+        # Write file spec info
+        f.write("%TF.FileFunction," + ",".join(layer.function) + "*%\n")
+        f.write(f"%TF.FilePolarity,{layer.polarity}*%\n")
+
+        digits = resolutions[options.resolution]
+        f.write(f"%FSLA{options.int_size}{digits}Y{options.int_size}{digits}X*%\n")
+
+        # Write header comments
+        f.writelines([f"G04 {line}*\n" for line in header])
+
+        # Setup units/mode
+        units = options.mode.upper()
+        f.write(f"%MO{units}*%\n")
+        f.write("%LPD*%")
+
+        f.write("G01*\n")
+
+        # Aperture definition, shared by all the shapes of the file
+        f.write("%ADD10C,0.050000*%\n")
+
+        # Only supports polygons for now
+        f.writelines(polygons(pp, offsets))
+
+        # File end
+        f.write("M02*\n")
+
+
 def to_gerber(
     component: Component,
     dirpath: Path,
     layermap_to_gerber_layer: dict[tuple[int, int], GerberLayer],
-    options: GerberOptions = Field(default_factory=dict),
+    options: GerberOptions | None = None,
+    merge: bool = False,
+    max_workers: int | None = None,
 ) -> None:
     """Writes each layer to a different Gerber file.
 
+    Polygons are read one layer at a time, so only the layer being written is
+    held in memory.
+
     Args:
         component: to export.
         dirpath: directory path.
@@ -80,44 +152,64 @@ def to_gerber(
             mode: Literal["mm", "in"] = "mm"
             resolution: float = 1e-6
             int_size: int = 4
+        merge: if True, merges the polygons of each layer before writing them.
+        max_workers: number of worker processes to write the layers.
+            None or 1 writes them in this process.
     """
-    layer_to_polygons = component.get_polygons_points()
-
-    for layer_tup, layer in layermap_to_gerber_layer.items():
-        filename = (dirpath / layer.name.replace(" ", "_")).with_suffix(".gbr")
+    options = options or GerberOptions()
+    header = options.header or [
+        "Gerber file generated by gdsfactory",
+        f"Component: {component.name}",
+    ]
+
+    def layer_args() -> Iterator[tuple]:
+        for layer_tup, layer in layermap_to_gerber_layer.items():
+            filename = (Path(dirpath) / layer.name.replace(" ", "_")).with_suffix(
+                ".gbr"
+            )
+            arrays = component.get_polygons_arrays(layers=[layer_tup], merge=merge)
+            pp, offsets = arrays.get(
+                tuple(layer_tup), (np.empty((0, 2)), np.zeros(1, dtype=np.int64))
+            )
+            yield filename, layer, options, header, pp, offsets
 
-        with open(filename, "w+") as f:
-            header = options.header or [
-                "Gerber file generated by gdsfactory",
-                f"Component: {component.name}",
+    if max_workers and max_workers > 1 and len(layermap_to_gerber_layer) > 1:
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context
+        ) as executor:
+            futures = [
+                executor.submit(_write_gerber_layer, *args) for args in layer_args()
             ]
+            for future in futures:
+                future.result()
+    else:
+        for args in layer_args():
+            _write_gerber_layer(*args)
 
-            # Write file spec info
-            f.write("%TF.FileFunction," + ",".join(layer.function) + "*%\n")
-            f.write(f"%TF.FilePolarity,{layer.polarity}*%\n")
 
-            digits = resolutions[options.resolution]
-            f.write(f"%FSLA{options.int_size}{digits}Y{options.int_size}{digits}X*%\n")
+def _demo_to_gerber() -> None:
+    """Times writing a large pad array."""
+    import tempfile
+    import time
 
-            # Write header comments
-            f.writelines([f"G04 {line}*\n" for line in header])
-
-            # Setup units/mode
-            units = options.mode.upper()
-            f.write(f"%MO{units}*%\n")
-            f.write("%LPD*%")
-
-            f.write("G01*\n")
-
-            # Aperture definition
-            f.write("%ADD10C,0.050000*%\n")
-
-            # Only supports polygons for now
-            for poly in layer_to_polygons[layer_tup]:
-                f.write(polygon(poly))
+    import gdsfactory as gf
 
-            # File end
-            f.write("M02*\n")
+    c = gf.components.array(gf.components.pad, columns=100, rows=100)
+    layermap = {
+        (49, 0): GerberLayer(
+            name="M3", function=["Copper", "L1", "Top"], polarity="Positive"
+        )
+    }
+    with tempfile.TemporaryDirectory() as dirpath:
+        for merge in (False, True):
+            t0 = time.perf_counter()
+            to_gerber(c, Path(dirpath), layermap, merge=merge)
+            print(f"merge={merge}: {time.perf_counter() - t0:.2f}s")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,172 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import numpy.typing as npt
 
 from gdsfactory.component import Component
-from gdsfactory.typings import Floats, Layers
+from gdsfactory.typings import Floats, Layers, PathType
+
+
+def _fill_polygons(
+    channel: np.ndarray, polygons: list[np.ndarray], origin: tuple[int, int]
+) -> None:
+    """Fills the polygons into channel with a vectorized even-odd scanline.
+
+    Pixels sample the polygons at integer pixel coordinates, so pixel (r, c) is
+    filled when the point (r, c) is inside a polygon. Each polygon edge crosses
+    the rows between its end points, and the crossings of every polygon and row
+    are paired up into filled column spans.
+    """
+    if not polygons:
+        return
+    rows, columns = channel.shape
+    starts = np.concatenate(polygons) - origin
+    ends = np.concatenate([np.roll(polygon, -1, axis=0) for polygon in polygons])
+    ends = ends - origin
+    polygon_ids = np.repeat(np.arange(len(polygons)), [len(p) for p in polygons])
+
+    lo = np.clip(np.ceil(np.minimum(starts[:, 0], ends[:, 0])), 0, rows)
+    hi = np.clip(np.ceil(np.maximum(starts[:, 0], ends[:, 0])), 0, rows)
+    n = (hi - lo).astype(np.int64)
+    n[n < 0] = 0
+    if not n.any():
+        return
+
+    edges = np.repeat(np.arange(len(n)), n)
+    offsets = np.cumsum(n) - n
+    r = lo[edges] + (np.arange(len(edges)) - offsets[edges])
+    x0, y0 = starts[edges, 0], starts[edges, 1]
+    x1, y1 = ends[edges, 0], ends[edges, 1]
+    c = y0 + (r - x0) * (y1 - y0) / (x1 - x0)
+
+    order = np.lexsort((c, r, polygon_ids[edges]))
+    r, c = r[order].astype(np.int64), c[order]
+    span_rows = r[0::2]
+    span_starts = np.clip(np.ceil(c[0::2]), 0, columns).astype(np.int64)
+    span_ends = np.clip(np.floor(c[1::2]) + 1, 0, columns).astype(np.int64)
+    keep = span_ends > span_starts
+
+    counts = np.zeros((rows, columns + 1), dtype=np.int32)
+    np.add.at(counts, (span_rows[keep], span_starts[keep]), 1)
+    np.add.at(counts, (span_rows[keep], span_ends[keep]), -1)
+    channel[np.cumsum(counts, axis=1)[:, :columns] > 0] = 1
+
+
+def _rasterize_tile(
+    polygons: list[list[np.ndarray]],
+    origin: tuple[int, int],
+    shape: tuple[int, int],
+    dtype: npt.DTypeLike,
+) -> np.ndarray:
+    """Returns a (layers, rows, columns) tile with the polygons filled.
+
+    Args:
+        polygons: for each layer, polygons as (N, 2) arrays in pixel coordinates.
+        origin: (row, column) of the tile first pixel.
+        shape: (rows, columns) of the tile.
+        dtype: of the tile.
+    """
+    tile = np.zeros((len(polygons), *shape), dtype=dtype)
+    for channel, layer_polygons in zip(tile, polygons):
+        _fill_polygons(channel, layer_polygons, origin)
+    return tile
+
+
+def to_np_layers(
+    component: Component,
+    nm_per_pixel: int = 20,
+    layers: Layers = ((1, 0),),
+    pad_width: int = 1,
+    dtype: npt.DTypeLike = bool,
+    tile_size: int = 1024,
+    filepath: PathType | None = None,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    """Returns a (layers, x, y) stack of pixelated masks from Component polygons.
+
+    The image is rasterized in square tiles, so only the polygons that overlap a
+    tile are drawn into it.
+
+    Args:
+        component: Component.
+        nm_per_pixel: you can go from 20 (coarse) to 4 (fine).
+        layers: one channel per layer.
+        pad_width: padding pixels around the image.
+        dtype: of the masks, bool or uint8.
+        tile_size: in pixels.
+        filepath: optional .npy file to memory-map the stack to, for images
+            that do not fit in memory.
+        max_workers: number of worker processes to rasterize tiles.
+            None or 1 rasterizes in this process.
+    """
+    pixels_per_um = (1 / nm_per_pixel) * 1e3
+    bbox = component.dbbox()
+    xmin, ymin = bbox.left, bbox.bottom
+    shape = (
+        int(np.ceil(bbox.width()) * pixels_per_um),
+        int(np.ceil(bbox.height()) * pixels_per_um),
+    )
+    stack_shape = (len(layers), shape[0] + 2 * pad_width, shape[1] + 2 * pad_width)
+    if filepath:
+        img = np.lib.format.open_memmap(
+            filepath, mode="w+", dtype=dtype, shape=stack_shape
+        )
+    else:
+        img = np.zeros(stack_shape, dtype=dtype)
+
+    # polygons in pixel coordinates, with their bounding boxes
+    layer_polygons = []
+    for layer in layers:
+        arrays = component.get_polygons_arrays(layers=[layer])
+        if not arrays:
+            layer_polygons.append(([], np.empty((0, 2)), np.empty((0, 2))))
+            continue
+        points, offsets = next(iter(arrays.values()))
+        points = (points - (xmin, ymin)) * pixels_per_um
+        pmin = np.minimum.reduceat(points, offsets[:-1])
+        pmax = np.maximum.reduceat(points, offsets[:-1])
+        layer_polygons.append((np.split(points, offsets[1:-1]), pmin, pmax))
+
+    tiles = []
+    for r0 in range(0, shape[0], tile_size):
+        for c0 in range(0, shape[1], tile_size):
+            tile_shape = (min(tile_size, shape[0] - r0), min(tile_size, shape[1] - c0))
+            polygons = []
+            for layer_polygon_list, pmin, pmax in layer_polygons:
+                overlaps = np.flatnonzero(
+                    (pmax[:, 0] >= r0)
+                    & (pmin[:, 0] <= r0 + tile_shape[0])
+                    & (pmax[:, 1] >= c0)
+                    & (pmin[:, 1] <= c0 + tile_shape[1])
+                )
+                polygons.append([layer_polygon_list[i] for i in overlaps])
+            tiles.append((polygons, (r0, c0), tile_shape, dtype))
+
+    def write_tile(origin: tuple[int, int], tile: np.ndarray) -> None:
+        r0, c0 = origin[0] + pad_width, origin[1] + pad_width
+        img[:, r0 : r0 + tile.shape[1], c0 : c0 + tile.shape[2]] = tile
+
+    if max_workers and max_workers > 1 and len(tiles) > 1:
+        context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context
+        ) as executor:
+            for args, tile in zip(tiles, executor.map(_rasterize_tile, *zip(*tiles))):
+                write_tile(args[1], tile)
+    else:
+        for args in tiles:
+            write_tile(args[1], _rasterize_tile(*args))
+
+    if filepath:
+        img.flush()
+    return img
 
 
 def to_np(
@@ -12,6 +175,8 @@ def to_np(
     layers: Layers = ((1, 0),),
     values: Floats | None = None,
     pad_width: int = 1,
+    tile_size: int = 1024,
+    max_workers: int | None = None,
 ) -> np.ndarray:
     """Returns a pixelated numpy array from Component polygons.
 
@@ -21,34 +186,24 @@ def to_np(
         layers: to convert. Order matters (latter overwrite former).
         values: associated to each layer (defaults to 1).
         pad_width: padding pixels around the image.
+        tile_size: in pixels.
+        max_workers: number of worker processes to rasterize tiles.
 
     """
-    import skimage.draw as skdraw
-
-    pixels_per_um = (1 / nm_per_pixel) * 1e3
-    xmin, ymin = component.bbox[0]
-    xmax, ymax = component.bbox[1]
-    shape = (
-        int(np.ceil(xmax - xmin) * pixels_per_um),
-        int(np.ceil(ymax - ymin) * pixels_per_um),
+    masks = to_np_layers(
+        component,
+        nm_per_pixel=nm_per_pixel,
+        layers=layers,
+        pad_width=pad_width,
+        tile_size=tile_size,
+        max_workers=max_workers,
     )
-    img = np.zeros(shape, dtype=float)
-    layer_to_polygons = component.get_polygons(by_spec=True, depth=None)
-
     values = values or [1] * len(layers)
 
-    for layer, value in zip(layers, values):
-        if layer in layer_to_polygons:
-            polygons = layer_to_polygons[layer]
-            for polygon in polygons:
-                r = polygon[:, 0] - xmin
-                c = polygon[:, 1] - ymin
-                rr, cc = skdraw.polygon(
-                    r * pixels_per_um, c * pixels_per_um, shape=shape
-                )
-                img[rr, cc] = value
-
-    return np.pad(img, pad_width=pad_width)
+    img = np.zeros(masks.shape[1:], dtype=float)
+    for mask, value in zip(masks, values):
+        img[mask] = value
+    return img
 
 
 if __name__ == "__main__":
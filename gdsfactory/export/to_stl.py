@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import pathlib
+import warnings
 
 from gdsfactory.component import Component
+from gdsfactory.config import logger
+from gdsfactory.export.extrude import extrude_layers
 from gdsfactory.technology import LayerStack
 from gdsfactory.typings import Layer
 
@@ -13,11 +16,16 @@ def to_stl(
     layer_stack: LayerStack | None = None,
     exclude_layers: tuple[Layer, ...] | None = None,
     use_layer_name: bool = False,
-    hull_invalid_polygons: bool = False,
+    hull_invalid_polygons: bool | None = None,
     scale: float | None = None,
+    bbox: tuple[tuple[float, float], tuple[float, float]] | None = None,
+    max_workers: int | None = None,
 ) -> None:
     """Exports a Component into STL.
 
+    Each layer is written as a single binary STL mesh. The merged polygons of
+    a layer are triangulated in one batch.
+
     Args:
         component: to export.
         filepath: filepath prefix to write STL to.
@@ -25,64 +33,55 @@ def to_stl(
         layer_stack: contains thickness and zmin for each layer.
         exclude_layers: layers to exclude.
         use_layer_name: If True, uses LayerLevel names in output filenames rather than gds_layer and gds_datatype.
-        hull_invalid_polygons: If True, replaces invalid polygons (determined by shapely.Polygon.is_valid) with its convex hull.
+        hull_invalid_polygons: deprecated and ignored, merged polygons are always valid.
         scale: Optional factor by which to scale meshes before writing.
+        bbox: ((xmin, ymin), (xmax, ymax)) in um. Crops the polygons to it.
+        max_workers: number of worker processes to extrude the layers.
 
     """
-    import shapely
-    import trimesh.creation
+    import trimesh
 
     from gdsfactory.pdk import get_layer_stack
 
+    if hull_invalid_polygons is not None:
+        warnings.warn(
+            "hull_invalid_polygons is deprecated and ignored, "
+            "merged polygons are always valid",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
     layer_stack = layer_stack or get_layer_stack()
 
     layer_to_thickness = layer_stack.get_layer_to_thickness()
     layer_to_zmin = layer_stack.get_layer_to_zmin()
+    layer_to_layername = layer_stack.get_layer_to_layername()
     filepath = pathlib.Path(filepath)
     exclude_layers = exclude_layers or []
 
     component_with_booleans = layer_stack.get_component_with_derived_layers(component)
-    polygons_per_layer = component_with_booleans.get_polygons_points()
-    component_layers = polygons_per_layer.keys()
-    layer_names = list(layer_stack.layers.keys())
-    layer_tuples = list(layer_stack.layers.values())
-
-    for layer, polygons in polygons_per_layer.items():
-        if (
-            layer in exclude_layers
-            or layer not in layer_to_thickness
-            or layer not in layer_to_zmin
-            or layer not in component_layers
-        ):
-            continue
-
-        height = layer_to_thickness[layer]
-        zmin = layer_to_zmin[layer]
-
+    extrusions = {
+        layer: (layer, layer_to_zmin[layer], thickness)
+        for layer, thickness in layer_to_thickness.items()
+        if layer not in exclude_layers and layer in layer_to_zmin
+    }
+    layer_to_mesh = extrude_layers(
+        component_with_booleans, extrusions, bbox=bbox, max_workers=max_workers
+    )
+
+    for layer, (vertices, faces) in layer_to_mesh.items():
         layer_name = (
-            layer_names[layer_tuples.index(layer)]
-            if use_layer_name
-            else f"{layer[0]}_{layer[1]}"
+            layer_to_layername[layer][0] if use_layer_name else f"{layer[0]}_{layer[1]}"
         )
 
         filepath_layer = (
             filepath.parent / f"{filepath.stem}_{layer_name}{filepath.suffix}"
         )
-        print(
-            f"Write {filepath_layer.absolute()!r} zmin = {zmin:.3f}, height = {height:.3f}"
+        logger.debug(
+            f"Write {filepath_layer.absolute()!r} zmin = {layer_to_zmin[layer]:.3f}, "
+            f"height = {layer_to_thickness[layer]:.3f}"
         )
-        meshes = []
-        for polygon in polygons:
-            p = shapely.geometry.Polygon(polygon)
-
-            if hull_invalid_polygons and not p.is_valid:
-                p = p.convex_hull
-
-            mesh = trimesh.creation.extrude_polygon(p, height=height)
-            mesh.apply_translation((0, 0, zmin))
-            meshes.append(mesh)
-
-        layer_mesh = trimesh.util.concatenate(meshes)
+        layer_mesh = trimesh.Trimesh(vertices, faces, process=False)
 
         if scale:
             layer_mesh.apply_scale(scale)
@@ -90,6 +89,22 @@ def to_stl(
         layer_mesh.export(filepath_layer)
 
 
+def _demo_to_stl() -> None:
+    """Times exporting a ring array chip."""
+    import tempfile
+    import time
+
+    import gdsfactory as gf
+
+    c = gf.components.array(
+        gf.components.ring_single(), columns=10, rows=10, spacing=(60, 60)
+    )
+    with tempfile.TemporaryDirectory() as dirpath:
+        t0 = time.perf_counter()
+        to_stl(c, filepath=f"{dirpath}/ring_array.stl")
+        print(f"to_stl: {time.perf_counter() - t0:.2f}s")
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
@@ -18,7 +18,8 @@ Assumes two ports are connected when they have same width, x, y
 
 from __future__ import annotations
 
-from collections import defaultdict
+import copy
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable
 from typing import Any
 
@@ -132,8 +133,9 @@ def get_netlist(
     This allows us to use different logic to determine i.e.
     if an electrical port is properly connected vs an optical port.
     In this function, the core logic is the same, but we employ extra validation for optical ports.
-    snap_to_grid() allows a value of 0, which will return the original value,
-    is more efficient when the value is 1, and will throw a more descriptive error when the value is <0
+    Port centers of each type are packed into a NumPy array and hashed on the grid in one pass
+    (see group_by_grid), so only connected ports go through Python-level validation.
+    A tolerance of 0 or 1 does a single exact sweep, and a tolerance <0 raises a ValueError.
     the default value of tolerance is 5nm because it should allow better performance with the two-grid-sweep approach.
 
 
@@ -159,12 +161,12 @@ def get_netlist(
     connections = {}
     top_ports = {}
 
-    # store where ports are located
-    name2port = {}
-
     # TOP level ports
     ports = component.ports
-    ports_by_type = defaultdict(list)
+
+    # port names ("instance,port" or top-level "port") and ports, grouped by type
+    port_names_by_type: dict[str, list[str]] = defaultdict(list)
+    ports_by_type: dict[str, list[Port]] = defaultdict(list)
     top_ports_list = set()
 
     references = _get_references_to_netlist(component)
@@ -231,33 +233,30 @@ def get_netlist(
                         # ComponentArray, by our known naming convention. I hope no one
                         # renames these ports!
                         parent_port = component.ports[top_name]
-                        name2port[lower_name] = parent_port
                         top_ports_list.add(top_name)
-                        ports_by_type[parent_port.port_type].append(lower_name)
+                        port_names_by_type[parent_port.port_type].append(lower_name)
+                        ports_by_type[parent_port.port_type].append(parent_port)
         else:
             # lower level ports
             for port in reference.ports:
-                reference_name = get_instance_name(
-                    component,
-                    reference,
+                port_names_by_type[port.port_type].append(
+                    f"{reference_name},{port.name}"
                 )
-                src = f"{reference_name},{port.name}"
-                name2port[src] = port
-                ports_by_type[port.port_type].append(src)
+                ports_by_type[port.port_type].append(port)
 
     for port in ports:
         src = port.name
-        name2port[src] = port
         top_ports_list.add(src)
-        ports_by_type[port.port_type].append(src)
+        port_names_by_type[port.port_type].append(src)
+        ports_by_type[port.port_type].append(port)
 
     warnings = {}
-    for port_type, port_names in ports_by_type.items():
+    for port_type, port_names in port_names_by_type.items():
         if exclude_port_types and port_type in exclude_port_types:
             continue
         connections_t, warnings_t = extract_connections(
             port_names,
-            name2port,
+            ports_by_type[port_type],
             port_type,
             tolerance=tolerance,
             allow_multiple=allow_multiple,
@@ -293,15 +292,28 @@ def get_netlist(
 
 def extract_connections(
     port_names: list[str],
-    ports: dict[str, Port],
+    ports: dict[str, Port] | list[Port],
     port_type: str,
     tolerance: int = 5,
     validators: dict[str, Callable] | None = None,
     allow_multiple: bool = False,
 ):
+    """Returns connections and warnings for ports of a single port type.
+
+    Args:
+        port_names: names of the ports to match ("instance,port" or top-level "port").
+        ports: dict of port name to Port, or list of Ports aligned with port_names.
+        port_type: port type, used to select the connection validator.
+        tolerance: tolerance in grid_factor to consider two ports connected.
+        validators: dict of port_type to connection validator.
+        allow_multiple: False to raise an error if more than two ports share the same connection.
+    """
     if validators is None:
         validators = DEFAULT_CONNECTION_VALIDATORS
 
+    if isinstance(ports, dict):
+        ports = [ports[port_name] for port_name in port_names]
+
     validator = validators.get(port_type, _null_validator)
     return _extract_connections_two_sweep(
         port_names,
@@ -313,9 +325,57 @@ def extract_connections(
     )
 
 
+def get_ports_xy(ports: list[Port]) -> np.ndarray:
+    """Returns an (N, 2) int64 array of port centers in dbu."""
+    xy = np.empty((len(ports), 2), dtype=np.int64)
+    for i, port in enumerate(ports):
+        xy[i] = port.center
+    return xy
+
+
+def group_by_grid(
+    xy: np.ndarray, grid_size: int = 1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Groups points that snap to the same grid cell.
+
+    Points are snapped to the nearest multiple of grid_size, halves rounding up.
+    Groups are returned in order of first appearance and points within each group
+    keep their original order, so results match a dict-based grouping.
+
+    Args:
+        xy: (N, 2) array of coordinates in dbu.
+        grid_size: grid size in dbu.
+
+    Returns:
+        order: indices into xy sorted by group.
+        starts: start offset of each group in order.
+        counts: number of points in each group.
+    """
+    n = len(xy)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    # integer rounding, so every grid cell spans the same number of dbu
+    keys = (xy + grid_size // 2) // grid_size if grid_size > 1 else xy
+    order = np.lexsort((keys[:, 1], keys[:, 0]))
+    sorted_keys = keys[order]
+    is_new_group = np.empty(n, dtype=bool)
+    is_new_group[0] = True
+    np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1, out=is_new_group[1:])
+    starts = np.flatnonzero(is_new_group)
+    counts = np.diff(np.append(starts, n))
+
+    # reorder groups by first appearance (lexsort is stable)
+    group_order = np.argsort(order[starts], kind="stable")
+    starts = starts[group_order]
+    counts = counts[group_order]
+    return order, starts, counts
+
+
 def _extract_connections_two_sweep(
     port_names: list[str],
-    ports: dict[str, Port],
+    ports: list[Port],
     port_type: str,
     connection_validator: Callable,
     tolerance: int,
@@ -328,7 +388,6 @@ def _extract_connections_two_sweep(
             port_type, []
         )
 
-    unconnected_port_names = list(port_names)
     if tolerance < 0:
         raise ValueError(f"Cannot have a tolerance less than zero. Got {tolerance}")
     elif tolerance <= 1:
@@ -341,60 +400,50 @@ def _extract_connections_two_sweep(
         grids = [("fine", 1), ("coarse", tolerance)]
 
     connections = []
+    xy = get_ports_xy(ports)
+    unconnected = np.arange(len(ports))
 
     for _grid_name, grid_size in grids:
-        by_xy = defaultdict(list)
+        order, starts, counts = group_by_grid(xy[unconnected], grid_size or 1)
+        # map from positions within the unconnected subset back to port indices
+        order = unconnected[order]
+        unconnected = order[starts[counts == 1]]
 
-        for port_name in unconnected_port_names:
-            port = ports[port_name]
-            by_xy[tuple(snap_to_grid(port.center, grid_factor=grid_size))].append(
-                port_name
-            )
-
-        unconnected_port_names = []
+        for start, count in zip(starts[counts > 1], counts[counts > 1]):
+            ports_at_xy = [port_names[i] for i in order[start : start + count]]
 
-        for xy, ports_at_xy in by_xy.items():
-            if len(ports_at_xy) == 1:
-                unconnected_port_names.append(ports_at_xy[0])
-
-            elif len(ports_at_xy) == 2:
-                port1 = ports[ports_at_xy[0]]
-                port2 = ports[ports_at_xy[1]]
-                connection_validator(port1, port2, ports_at_xy, warnings)
+            if count == 2:
+                i1, i2 = order[start : start + 2]
+                connection_validator(ports[i1], ports[i2], ports_at_xy, warnings)
                 connections.append(ports_at_xy)
 
             elif not allow_multiple:
                 warnings["multiple_connections"].append(ports_at_xy)
-                raise ValueError(f"Found multiple connections at {xy}:{ports_at_xy}")
+                xy_at = tuple(xy[order[start]].tolist())
+                raise ValueError(f"Found multiple connections at {xy_at}:{ports_at_xy}")
 
             else:
                 # Iterates over the list of multiple ports to create related two-port connectivity
-                num_ports = len(ports_at_xy)
-                for portindex1, portindex2 in zip(
-                    range(-1, num_ports - 1), range(num_ports)
-                ):
-                    port1 = ports[ports_at_xy[portindex1]]
-                    port2 = ports[ports_at_xy[portindex2]]
+                indices = order[start : start + count]
+                for portindex1, portindex2 in zip(range(-1, count - 1), range(count)):
+                    port1 = ports[indices[portindex1]]
+                    port2 = ports[indices[portindex2]]
                     connection_validator(port1, port2, ports_at_xy, warnings)
                     connections.append(
                         [ports_at_xy[portindex1], ports_at_xy[portindex2]]
                     )
 
-    if unconnected_port_names:
-        unconnected_non_top_level = [
-            pname for pname in unconnected_port_names if ("," in pname)
-        ]
-        if unconnected_non_top_level:
-            unconnected_xys = [
-                ports[pname].center for pname in unconnected_non_top_level
-            ]
-            warnings["unconnected_ports"].append(
-                _make_warning(
-                    ports=unconnected_non_top_level,
-                    values=unconnected_xys,
-                    message=f"{len(unconnected_non_top_level)} unconnected {port_type} ports!",
-                )
+    unconnected_non_top_level = [
+        i for i in unconnected.tolist() if "," in port_names[i]
+    ]
+    if unconnected_non_top_level:
+        warnings["unconnected_ports"].append(
+            _make_warning(
+                ports=[port_names[i] for i in unconnected_non_top_level],
+                values=[ports[i].center for i in unconnected_non_top_level],
+                message=f"{len(unconnected_non_top_level)} unconnected {port_type} ports!",
             )
+        )
 
     critical_warnings = {
         w: warnings[w] for w in raise_error_for_warnings if w in warnings
@@ -527,62 +576,168 @@ def _get_references_to_netlist(component: Component) -> list[ComponentReference]
     return references
 
 
+NETLIST_CACHE_SIZE = 1024
+_netlist_cache: OrderedDict[tuple, tuple[tuple | None, dict[str, Any]]] = OrderedDict()
+
+
+def clear_netlist_cache() -> None:
+    """Clears the netlist cache used by get_netlist_recursive."""
+    _netlist_cache.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Returns a hashable version of a netlist kwarg value."""
+    if isinstance(value, list | tuple | set):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _get_netlist_fingerprint(component: Component) -> tuple | None:
+    """Returns what the netlist of a mutable component depends on.
+
+    Locked components (built by the cell decorator) cannot change so they return None.
+    """
+    if component._locked:
+        return None
+    insts = tuple(
+        (
+            inst.name,
+            inst.cell_inst.to_s(),
+            None if inst.cell._locked else tuple(p.hash() for p in inst.cell.ports),
+        )
+        for inst in component.insts
+    )
+    ports = tuple(p.hash() for p in component.ports)
+    return insts, ports
+
+
+def get_netlist_cached(
+    component: Component,
+    get_netlist_func: Callable = get_netlist,
+    **kwargs,
+) -> dict[str, Any]:
+    """Returns a copy of the component netlist, extracting it only once per cell.
+
+    The cache is keyed on the cell name, get_netlist_func and the kwargs that affect
+    the extraction (tolerance, exclude_port_types ...).
+    It keeps the NETLIST_CACHE_SIZE most recently used netlists.
+    Netlists of mutable components are extracted again if their instances or ports change.
+
+    Args:
+        component: to extract netlist.
+        get_netlist_func: function to extract the netlist.
+        kwargs: passed to get_netlist_func.
+    """
+    try:
+        key = (
+            component.kcl.name,
+            component.name,
+            get_netlist_func,
+            _freeze(kwargs),
+        )
+        hash(key)
+    except TypeError:
+        return get_netlist_func(component, **kwargs)
+
+    fingerprint = _get_netlist_fingerprint(component)
+    cached = _netlist_cache.get(key)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, get_netlist_func(component, **kwargs))
+        _netlist_cache[key] = cached
+        if len(_netlist_cache) > NETLIST_CACHE_SIZE:
+            _netlist_cache.popitem(last=False)
+    else:
+        _netlist_cache.move_to_end(key)
+    return copy.deepcopy(cached[1])
+
+
 def get_netlist_recursive(
     component: Component,
     component_suffix: str = "",
     get_netlist_func: Callable = get_netlist,
     get_instance_name: Callable[..., str] = get_instance_name_from_alias,
+    cache: bool = True,
     **kwargs,
 ) -> dict[str, Any]:
     """Returns recursive netlist for a component and subcomponents.
 
+    Each unique cell is netlisted once, no matter how many times it is instantiated.
+
     Args:
         component: to extract netlist.
         component_suffix: suffix to append to each component name.
             useful if to save and reload a back-annotated netlist.
         get_netlist_func: function to extract individual netlists.
+        get_instance_name: function to get instance name.
+        cache: reuse netlists extracted in previous calls (see get_netlist_cached).
 
     Keyword Args:
         tolerance: tolerance in grid_factor to consider two ports connected.
         exclude_port_types: optional list of port types to exclude from netlisting.
-        get_instance_name: function to get instance name.
 
     Returns:
         Dictionary of netlists, keyed by the name of each component.
 
     """
-    all_netlists = {}
+    all_netlists: dict[str, Any] = {}
+    _get_netlist_recursive(
+        component=component,
+        all_netlists=all_netlists,
+        component_suffix=component_suffix,
+        get_netlist_func=get_netlist_func,
+        get_instance_name=get_instance_name,
+        cache=cache,
+        **kwargs,
+    )
+    return all_netlists
 
+
+def _get_netlist_recursive(
+    component: Component,
+    all_netlists: dict[str, Any],
+    component_suffix: str,
+    get_netlist_func: Callable,
+    get_instance_name: Callable[..., str],
+    cache: bool,
+    **kwargs,
+) -> None:
+    """Adds the netlists of component and its subcomponents to all_netlists."""
     # only components with references (subcomponents) warrant a netlist
     references = _get_references_to_netlist(component)
+    if not references:
+        return
 
-    if references:
+    if cache:
+        netlist = get_netlist_cached(component, get_netlist_func, **kwargs)
+    else:
         netlist = get_netlist_func(component, **kwargs)
-        all_netlists[f"{component.name}{component_suffix}"] = netlist
-
-        # for each reference, expand the netlist
-        for ref in references:
-            rcell = ref.cell
-            grandchildren = get_netlist_recursive(
+    all_netlists[f"{component.name}{component_suffix}"] = netlist
+
+    # for each reference, expand the netlist
+    for ref in references:
+        rcell = ref.cell
+        rcell_name = f"{rcell.name}{component_suffix}"
+        if rcell_name not in all_netlists:
+            _get_netlist_recursive(
                 component=rcell,
+                all_netlists=all_netlists,
                 component_suffix=component_suffix,
                 get_netlist_func=get_netlist_func,
+                get_instance_name=get_instance_name_from_alias,
+                cache=cache,
                 **kwargs,
             )
-            all_netlists |= grandchildren
-
-            child_references = _get_references_to_netlist(ref.cell)
-
-            if child_references:
-                inst_name = get_instance_name(component, ref)
-                netlist_dict = {"component": f"{rcell.name}{component_suffix}"}
-                if hasattr(rcell, "settings"):
-                    netlist_dict.update(settings=rcell.settings)
-                if hasattr(rcell, "info"):
-                    netlist_dict.update(info=rcell.info)
-                netlist["instances"][inst_name] = netlist_dict
 
-    return all_netlists
+        if rcell_name in all_netlists:
+            inst_name = get_instance_name(component, ref)
+            netlist_dict = {"component": rcell_name}
+            if hasattr(rcell, "settings"):
+                netlist_dict.update(settings=rcell.settings)
+            if hasattr(rcell, "info"):
+                netlist_dict.update(info=rcell.info)
+            netlist["instances"][inst_name] = netlist_dict
 
 
 def _demo_ring_single_array() -> None:
@@ -592,6 +747,25 @@ def _demo_ring_single_array() -> None:
     c.get_netlist()
 
 
+def _demo_extract_connections_scaling(
+    sizes: tuple[int, ...] = (10**3, 10**4, 10**5, 10**6),
+) -> None:
+    """Prints the time to match port centers on the grid for an increasing number of ports."""
+    import time
+
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        # half of the ports are paired, the other half is 1nm off (coarse sweep)
+        xy = rng.integers(-(10**9), 10**9, size=(n // 2, 2))
+        xy = np.concatenate([xy, xy + rng.integers(0, 2, size=xy.shape)])
+
+        t0 = time.perf_counter()
+        order, starts, counts = group_by_grid(xy, grid_size=1)
+        group_by_grid(xy[order[starts[counts == 1]]], grid_size=5)
+        t1 = time.perf_counter()
+        print(f"{n:>8} ports: {t1 - t0:.3f}s")
+
+
 def _demo_mzi_lattice() -> None:
     import gdsfactory as gf
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import json
+import pathlib
+from collections.abc import Iterator
 from typing import Any
 
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.get_netlist import get_netlist_recursive
+from gdsfactory.serialization import clean_value_json
 
 
 def get_netlist_flat(
@@ -51,35 +54,104 @@ def get_netlist_flat(
         name: name of component.
         warnings: warning messages (disconnected pins).
     """
+    netlist = {
+        "connections": {},
+        "placements": {},
+        "instances": {},
+        "ports": {},
+        "name": component.name,
+    }
+    for section, key, value in iter_netlist_flat(component, **kwargs):
+        netlist[section][key] = value
+    return netlist
+
+
+def iter_netlist_flat(
+    component: Component,
+    **kwargs,
+) -> Iterator[tuple[str, str, Any]]:
+    """Yields the flat netlist of a component one entry at a time.
+
+    Walks the hierarchy depth first, so memory is bounded by the hierarchy depth
+    and the number of unique cells rather than by the number of leaf instances.
+
+    Args:
+        component: to extract flat netlist.
+
+    Keyword Args:
+        component_suffix: suffix to append to each component name.
+        get_netlist_func: function to extract individual netlists.
+        tolerance: tolerance in nm to consider two ports connected.
+        exclude_port_types: optional list of port types to exclude from netlisting.
+        get_instance_name: function to get instance name.
+
+    Yields:
+        (section, key, value) with section one of connections, placements, instances or ports,
+        using the same keys and values as get_netlist_flat.
+    """
     recursive_netlist = get_netlist_recursive(component, **kwargs)
     top_level_name = component.name
-    hierarchical_instances = _flatten_hierarchy(top_level_name, recursive_netlist)
-    connections = {}
-    ports = {}
-    placements = {}
-    instances = {}
-    for hierarchical_instance in hierarchical_instances:
+    for hierarchical_instance in _iter_hierarchy(top_level_name, recursive_netlist):
         c, p = _map_connections_ports(
             hierarchical_instance, top_level_name, recursive_netlist
         )
         for key, value in c.items():
             if len(value) != 0:
-                connections[key] = value
+                yield "connections", key, value
         for key, value in p.items():
             if len(value) != 0:
-                ports[key] = value
-        placements.update(
-            _accumulate_placements(hierarchical_instance, recursive_netlist)
-        )
-        instances.update(_get_instance_info(hierarchical_instance, recursive_netlist))
+                yield "ports", key, value
+        for key, value in _accumulate_placements(
+            hierarchical_instance, recursive_netlist
+        ).items():
+            yield "placements", key, value
+        for key, value in _get_instance_info(
+            hierarchical_instance, recursive_netlist
+        ).items():
+            yield "instances", key, value
+
+
+def write_netlist_flat(
+    component: Component,
+    filepath: str | pathlib.Path,
+    **kwargs,
+) -> pathlib.Path:
+    """Writes the flat netlist to a JSON lines file without holding it in memory.
 
-    return {
-        "connections": connections,
-        "placements": placements,
-        "instances": instances,
-        "ports": ports,
-        "name": recursive_netlist[top_level_name]["name"],
+    Each line is a JSON object with section, key and value (see iter_netlist_flat).
+    The first line has section "name" with the top level component name.
+
+    Args:
+        component: to extract flat netlist.
+        filepath: path to the .jsonl file.
+        kwargs: passed to iter_netlist_flat.
+    """
+    filepath = pathlib.Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w") as f:
+        f.write(json.dumps({"section": "name", "value": component.name}) + "\n")
+        for section, key, value in iter_netlist_flat(component, **kwargs):
+            line = {"section": section, "key": key, "value": value}
+            f.write(json.dumps(clean_value_json(line)) + "\n")
+    return filepath
+
+
+def read_netlist_flat(filepath: str | pathlib.Path) -> dict[str, Any]:
+    """Returns a flat netlist dict from a file written by write_netlist_flat."""
+    netlist: dict[str, Any] = {
+        "connections": {},
+        "placements": {},
+        "instances": {},
+        "ports": {},
     }
+    with open(filepath) as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry["section"] == "name":
+                netlist["name"] = entry["value"]
+            else:
+                netlist[entry["section"]][entry["key"]] = entry["value"]
+    return netlist
 
 
 def _flat_name(
@@ -163,7 +235,7 @@ def _map_connections_ports(
     # Starting point is ports of the leaf instance
     leaf_instance = hierarchy[-1][1]
     leaf_instance_name = hierarchy[-1][0].split(".")[-1]
-    leaf_instance_ports = list(gf.get_component(leaf_instance_name).ports.keys())
+    leaf_instance_ports = [p.name for p in gf.get_component(leaf_instance_name).ports]
 
     for leaf_portname in leaf_instance_ports:
         current_connections = []
@@ -218,80 +290,35 @@ def _accumulate_placements(
     return {_flat_name(hierarchy): placements}
 
 
-def _flatten_str_list(xs):
-    """Flatten nested list of strings to list of strings."""
-    for x in xs:
-        if isinstance(x, Iterable) and not isinstance(x, str | bytes):
-            yield from _flatten_str_list(x)
-        else:
-            yield x
-
-
-def _flatten_hierarchy(
-    netlist_name: str,
-    all_netlists: list[dict[str, Any]],
-    hierarchy_delimiter: str = "~",
-    component_instance_delimiter: str = ";",
-):
-    """Converts _flatten_netlist output str's to list of hierarchical (component, instance) tuples."""
-
-    instance_dict = _flatten_hierarchy_recurse(
-        netlist_name=netlist_name,
-        all_netlists=all_netlists,
-        hierarchy_delimiter=hierarchy_delimiter,
-        component_instance_delimiter=component_instance_delimiter,
-    )
-
-    hierarchies_lists = []
-    for hierarchy in _flatten_str_list(list(instance_dict.keys())):
-        hierarchy_list = []
-        levels = hierarchy.split(hierarchy_delimiter)
-        for level in levels:
-            components, instance = level.split(component_instance_delimiter)
-            hierarchy_list.append((components, instance))
-        hierarchies_lists.append(hierarchy_list)
-
-    return hierarchies_lists
-
-
-def _flatten_hierarchy_recurse(
+def _iter_hierarchy(
     netlist_name: str,
-    all_netlists: list[dict[str, Any]],
-    hierarchy: str | None = None,
-    hierarchy_delimiter: str = "~",
-    component_instance_delimiter: str = ";",
-) -> dict[str, Any]:
-    """Flattens the provided recursive netlist by recursively updating a list.
+    all_netlists: dict[str, Any],
+    hierarchy: list[tuple[str, str]] | None = None,
+) -> Iterator[list[tuple[str, str]]]:
+    """Yields the hierarchical (component, instance) list of each leaf instance.
 
     Args:
-        netlist_name: netlist entry to flatten
-        all_netlists: list of all possible netlists (output of get_netlist_recursive)
-        hierarchy: str to append to netlist_name
-        hierarchy_delimiter: str to separate hierarchy levels in flattened keys
-        component_instance_delimiter: str to separate instance name from component name for netlist reconstruction
-
-    Returns:
-        str of ...{hierarchy_delimiter}{component}{component_instance_delimiter}{instance}{hierarchy_delimiter} used to flatten the netlist
+        netlist_name: netlist entry to flatten.
+        all_netlists: all netlists (output of get_netlist_recursive).
+        hierarchy: (component, instance) tuples of the levels above netlist_name.
     """
-    instance_dict = {}
     if hierarchy is None:
-        top_component = all_netlists[netlist_name]["name"]
-        hierarchy = f"{top_component}{component_instance_delimiter}{netlist_name}"
+        hierarchy = [(all_netlists[netlist_name]["name"], netlist_name)]
     for instance_name, instance in all_netlists[netlist_name]["instances"].items():
         component_name = instance["component"]
-        hierarchy_str = f"{hierarchy}{hierarchy_delimiter}{component_name}{component_instance_delimiter}{instance_name}"
-        if component_name not in all_netlists.keys():
-            instance_dict[hierarchy_str] = True  # Done for this leaf
+        instance_hierarchy = [*hierarchy, (component_name, instance_name)]
+        if component_name not in all_netlists:
+            yield instance_hierarchy
         else:
-            instance_dict.update(
-                _flatten_hierarchy_recurse(
-                    component_name,
-                    all_netlists,
-                    hierarchy_str,
-                )
-            )
+            yield from _iter_hierarchy(component_name, all_netlists, instance_hierarchy)
+
 
-    return instance_dict
+def _flatten_hierarchy(
+    netlist_name: str,
+    all_netlists: dict[str, Any],
+) -> list[list[tuple[str, str]]]:
+    """Returns the list of hierarchical (component, instance) tuples of each leaf instance."""
+    return list(_iter_hierarchy(netlist_name, all_netlists))
 
 
 if __name__ == "__main__":
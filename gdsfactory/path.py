@@ -8,6 +8,7 @@ Adapted from PHIDL https://github.com/amccaugh/phidl/ by Adam McCaughan
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import math
 import warnings
@@ -151,7 +152,7 @@ class Path(_GeometryHelper):
 
         # Connect beginning of new points with old points
         points = _rotate_points(points, angle=self.end_angle - start_angle)
-        points += self.points[-1, :] - points[0, :]
+        points = points + self.points[-1, :] - points[0, :]
 
         # Update end angle
         self.end_angle = mod(end_angle + self.end_angle - start_angle, 360)
@@ -223,7 +224,7 @@ class Path(_GeometryHelper):
 
         """
         dx, dy = _parse_move(origin, destination, axis)
-        self.points += np.array([dx, dy])
+        self.points = self.points + np.array([dx, dy])
         return self
 
     def rotate(self, angle: float = 45, center: Float2 | None = (0, 0)):
@@ -289,6 +290,51 @@ class Path(_GeometryHelper):
             )
         return new_points
 
+    def _centerpoint_offset_curves(
+        self, points, offset_distances, start_angle, end_angle
+    ) -> np.ndarray:
+        """Returns the centerpoint offset curves for several constant offsets at once.
+
+        Equivalent to calling _centerpoint_offset_curve for each offset distance,
+        but the path tangents and normals are only computed once.
+
+        Args:
+            points: (N, 2) path points.
+            offset_distances: (K,) offset distances.
+            start_angle: path start angle in degrees.
+            end_angle: path end angle in degrees.
+
+        Returns:
+            (K, N, 2) array of offset points.
+        """
+        offset_distances = np.asarray(offset_distances, dtype=np.float64)
+        dx = np.diff(points[:, 0])
+        dy = np.diff(points[:, 1])
+        theta = np.arctan2(dy, dx)
+        theta = np.concatenate([theta[:1], theta, theta[-1:]])
+        theta_mid = (np.pi + theta[1:] + theta[:-1]) / 2  # Mean angle between segments
+        dtheta_int = np.pi + theta[:-1] - theta[1:]  # Internal angle between segments
+        offset_distance = offset_distances[:, None] / np.sin(dtheta_int / 2)[None, :]
+
+        new_points = np.empty((len(offset_distances), len(points), 2))
+        new_points[:, :, 0] = points[None, :, 0] - offset_distance * np.cos(theta_mid)
+        new_points[:, :, 1] = points[None, :, 1] - offset_distance * np.sin(theta_mid)
+        if start_angle is not None:
+            new_points[:, 0, 0] = (
+                points[0, 0] + np.sin(start_angle * np.pi / 180) * offset_distance[:, 0]
+            )
+            new_points[:, 0, 1] = (
+                points[0, 1] - np.cos(start_angle * np.pi / 180) * offset_distance[:, 0]
+            )
+        if end_angle is not None:
+            new_points[:, -1, 0] = (
+                points[-1, 0] + np.sin(end_angle * np.pi / 180) * offset_distance[:, -1]
+            )
+            new_points[:, -1, 1] = (
+                points[-1, 1] - np.cos(end_angle * np.pi / 180) * offset_distance[:, -1]
+            )
+        return new_points
+
     def _parametric_offset_curve(self, points, offset_distance, start_angle, end_angle):
         """Creates a parametric offset (does not account for cusps etc) \
         by using gradient of the supplied x and y points."""
@@ -763,8 +809,35 @@ def extrude(
     layer = layer or x.layer
     layer = get_layer(layer)
 
-    for section in x.sections:
-        p_sec = p.copy()
+    # sections with constant width and offset along the full path share the same
+    # path normals, so all their edges are computed in a single broadcast
+    batched_sections = [
+        i
+        for i, section in enumerate(x.sections)
+        if not (section.insets and section.insets != (0, 0))
+        and not callable(section.offset_function)
+        and not callable(section.width_function)
+    ]
+    batched_edges = {}
+    if batched_sections:
+        offsets = np.array([x.sections[i].offset for i in batched_sections])
+        widths = np.array([x.sections[i].width for i in batched_sections])
+        edges = p._centerpoint_offset_curves(
+            p.points,
+            offset_distances=np.concatenate(
+                [offsets + widths / 2, offsets - widths / 2]
+            ),
+            start_angle=p.start_angle,
+            end_angle=p.end_angle,
+        )
+        n = len(batched_sections)
+        batched_edges = {
+            i: (edges[j], edges[n + j]) for j, i in enumerate(batched_sections)
+        }
+        path_length = p.length()
+
+    for section_index, section in enumerate(x.sections):
+        p_sec = p if section_index in batched_edges else p.copy()
         port_names = section.port_names
         port_types = section.port_types
         hidden = section.hidden
@@ -778,6 +851,13 @@ def extrude(
         if isinstance(width, int | float) and isinstance(offset, int | float):
             xsection_points.append([width, offset])
 
+        if section_index in batched_edges:
+            points1, points2 = batched_edges[section_index]
+            end_angle = p.end_angle
+            start_angle = p.start_angle
+            points = p.points
+            p_sec_length = path_length
+
         if section.insets and section.insets != (0, 0):
             p_pts = p_sec.points
 
@@ -892,35 +972,37 @@ def extrude(
                 ]
             )
 
-        if callable(offset_function):
-            p_sec.offset(offset_function)
-            offset = 0
-        end_angle = p_sec.end_angle
-        start_angle = p_sec.start_angle
-        points = p_sec.points
-        if callable(width_function):
-            # Compute lengths
-            dx = np.diff(p_sec.points[:, 0])
-            dy = np.diff(p_sec.points[:, 1])
-            lengths = np.cumsum(np.sqrt(dx**2 + dy**2))
-            lengths = np.concatenate([[0], lengths])
-            width = width_function(lengths / lengths[-1])
-        dy = offset + width / 2
-
-        points1 = p_sec._centerpoint_offset_curve(
-            points,
-            offset_distance=dy,
-            start_angle=start_angle,
-            end_angle=end_angle,
-        )
-        dy = offset - width / 2
+        if section_index not in batched_edges:
+            if callable(offset_function):
+                p_sec.offset(offset_function)
+                offset = 0
+            end_angle = p_sec.end_angle
+            start_angle = p_sec.start_angle
+            points = p_sec.points
+            if callable(width_function):
+                # Compute lengths
+                dx = np.diff(p_sec.points[:, 0])
+                dy = np.diff(p_sec.points[:, 1])
+                lengths = np.cumsum(np.sqrt(dx**2 + dy**2))
+                lengths = np.concatenate([[0], lengths])
+                width = width_function(lengths / lengths[-1])
+            dy = offset + width / 2
+
+            points1 = p_sec._centerpoint_offset_curve(
+                points,
+                offset_distance=dy,
+                start_angle=start_angle,
+                end_angle=end_angle,
+            )
+            dy = offset - width / 2
 
-        points2 = p_sec._centerpoint_offset_curve(
-            points,
-            offset_distance=dy,
-            start_angle=start_angle,
-            end_angle=end_angle,
-        )
+            points2 = p_sec._centerpoint_offset_curve(
+                points,
+                offset_distance=dy,
+                start_angle=start_angle,
+                end_angle=end_angle,
+            )
+            p_sec_length = p_sec.length()
         if isinstance(simplify, bool):
             raise ValueError("simplify argument must be a number (e.g. 1e-3) or None")
 
@@ -933,7 +1015,7 @@ def extrude(
         # Join points together
         points_poly = np.concatenate([points1, points2[::-1, :]])
 
-        if not hidden and p_sec.length() > 1e-3:
+        if not hidden and p_sec_length > 1e-3:
             c.add_polygon(points_poly, layer=layer)
 
         # Add port_names if they were specified
@@ -1250,19 +1332,44 @@ def arc(
     npoints = npoints or abs(int(angle / 360 * radius / PDK.bend_points_distance / 2))
     npoints = max(int(npoints), int(360 / angle) + 1)
 
+    P = Path()
+    # Manually add points & adjust start and end angles
+    P.points = _arc_points(radius, angle, npoints, start_angle)
+    P.start_angle = start_angle + 90
+    P.end_angle = start_angle + angle + 90
+    return P
+
+
+BEND_POINTS_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=BEND_POINTS_CACHE_SIZE)
+def _arc_points(
+    radius: float, angle: float, npoints: int, start_angle: float
+) -> np.ndarray:
+    """Returns read-only arc points, cached for identical arguments."""
     t = np.linspace(
         start_angle * np.pi / 180, (angle + start_angle) * np.pi / 180, npoints
     )
     x = radius * np.cos(t)
     y = radius * (np.sin(t) + 1)
     points = np.array((x, y)).T * np.sign(angle)
+    points.flags.writeable = False
+    return points
 
-    P = Path()
-    # Manually add points & adjust start and end angles
-    P.points = points
-    P.start_angle = start_angle + 90
-    P.end_angle = start_angle + angle + 90
-    return P
+
+def bend_points_cache_info() -> dict[str, functools._CacheInfo]:
+    """Returns hits, misses and size of the arc and euler bend points caches."""
+    return {
+        "arc": _arc_points.cache_info(),
+        "euler": _euler_points.cache_info(),
+    }
+
+
+def clear_bend_points_cache() -> None:
+    """Clears the arc and euler bend points caches."""
+    _arc_points.cache_clear()
+    _euler_points.cache_clear()
 
 
 def _cumtrapz(x):
@@ -1333,16 +1440,41 @@ def euler(
     else:
         mirror = False
 
+    pdk = get_active_pdk()
+    npoints = npoints or abs(int(angle / 360 * radius / pdk.bend_points_distance / 2))
+    npoints = max(npoints, int(360 / angle) + 1)
+
+    points, Reff, Rmin = _euler_points(radius, angle, p, use_eff, npoints)
+    start_angle = 180 * (angle < 0)
+    end_angle = start_angle + angle
+
+    P = Path()
+
+    # Manually add points & adjust start and end angles
+    P.points = points
+    P.start_angle = start_angle
+    P.end_angle = end_angle
+    P.info["Reff"] = Reff
+    P.info["Rmin"] = Rmin
+    if mirror:
+        P.mirror((1, 0))
+    return P
+
+
+@functools.lru_cache(maxsize=BEND_POINTS_CACHE_SIZE)
+def _euler_points(
+    radius: float, angle: float, p: float, use_eff: bool, npoints: int
+) -> tuple[np.ndarray, float, float]:
+    """Returns read-only euler bend points, Reff and Rmin for a positive angle.
+
+    Cached for identical arguments.
+    """
     R0 = 1
     alpha = np.radians(angle)
     Rp = R0 / (np.sqrt(p * alpha))
     sp = R0 * np.sqrt(p * alpha)
     s0 = 2 * sp + Rp * alpha * (1 - p)
 
-    pdk = get_active_pdk()
-    npoints = npoints or abs(int(angle / 360 * radius / pdk.bend_points_distance / 2))
-    npoints = max(npoints, int(360 / angle) + 1)
-
     num_pts_euler = int(np.round(sp / (s0 / 2) * npoints))
     num_pts_arc = npoints - num_pts_euler
 
@@ -1389,18 +1521,8 @@ def euler(
     # Scale curve to either match Reff or Rmin
     scale = radius / Reff if use_eff else radius / Rmin
     points *= scale
-
-    P = Path()
-
-    # Manually add points & adjust start and end angles
-    P.points = points
-    P.start_angle = start_angle
-    P.end_angle = end_angle
-    P.info["Reff"] = Reff * scale
-    P.info["Rmin"] = Rmin * scale
-    if mirror:
-        P.mirror((1, 0))
-    return P
+    points.flags.writeable = False
+    return points, Reff * scale, Rmin * scale
 
 
 def straight(length: float = 10.0, npoints: int = 2) -> Path:
@@ -1557,6 +1679,45 @@ __all__ = [
     "transition_adiabatic",
 ]
 
+
+def _demo_extrude_cross_sections(npoints: int = 10_000, repeat: int = 10) -> None:
+    """Prints the time to compute section edges per section and batched for the built-in cross_sections."""
+    import time
+
+    from gdsfactory.cross_section import cross_sections
+
+    p = euler(radius=100, angle=90, npoints=npoints)
+    for name, cross_section in cross_sections.items():
+        try:
+            xs = cross_section()
+        except Exception:
+            continue
+        sections = [
+            s
+            for s in xs.sections
+            if not callable(s.width_function) and not callable(s.offset_function)
+        ]
+        offsets = np.array([s.offset for s in sections])
+        widths = np.array([s.width for s in sections])
+        dys = np.concatenate([offsets + widths / 2, offsets - widths / 2])
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for dy in dys:
+                p.copy()._centerpoint_offset_curve(
+                    p.points, dy, p.start_angle, p.end_angle
+                )
+        t1 = time.perf_counter()
+        for _ in range(repeat):
+            p._centerpoint_offset_curves(p.points, dys, p.start_angle, p.end_angle)
+        t2 = time.perf_counter()
+        print(
+            f"{name:40} {len(sections):3} sections: "
+            f"per section {(t1 - t0) / repeat * 1e3:7.2f} ms, "
+            f"batched {(t2 - t1) / repeat * 1e3:7.2f} ms"
+        )
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import pathlib
+import re
 import warnings
 from collections.abc import Callable
 from functools import partial
@@ -14,12 +16,11 @@ import numpy as np
 import omegaconf
 from kfactory import LayerEnum
 from omegaconf import DictConfig
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from gdsfactory import show
 from gdsfactory.config import CONF, logger
 from gdsfactory.events import Event
-from gdsfactory.read.from_yaml_template import cell_from_yaml_template
 from gdsfactory.symbols import floorplan_with_block_letters
 from gdsfactory.technology import LayerStack, LayerViews
 from gdsfactory.typings import (
@@ -39,6 +40,7 @@ from gdsfactory.typings import (
 )
 
 component_settings = ["function", "component", "settings"]
+_component_settings = frozenset(component_settings)
 cross_section_settings = ["function", "cross_section", "settings"]
 
 constants = {
@@ -108,6 +110,14 @@ def extract_args_from_docstring(docstring: str) -> dict[str, Any] | None:
     return args_dict
 
 
+def _validate_spec_keys(spec: dict[str, Any] | DictConfig) -> None:
+    """Raises ValueError if a dict spec has keys other than component_settings."""
+    if not _component_settings.issuperset(spec.keys()):
+        for key in spec.keys():
+            if key not in _component_settings:
+                raise ValueError(f"Invalid setting {key!r} not in {component_settings}")
+
+
 class Pdk(BaseModel):
     """Store layers, cross_sections, cell functions, simulation_settings ...
 
@@ -167,12 +177,17 @@ class Pdk(BaseModel):
     bend_points_distance: float = 20 * nm
     connectivity: list[ConnectivitySpec] | None = None
     max_name_length: int = CONF.max_name_length
+    _hash: tuple[tuple[Any, ...], str] | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
 
+    def model_post_init(self, __context: Any) -> None:
+        """Copies the base_pdks cells and cross_sections into this PDK."""
+        self._merge_base_pdks()
+
     def activate(self) -> None:
         """Set current pdk to the active pdk (if not already active)."""
         global _ACTIVE_PDK
@@ -180,20 +195,43 @@ class Pdk(BaseModel):
             return None
 
         logger.debug(f"{self.name!r} PDK is now active")
+        self._merge_base_pdks()
+        _set_active_pdk(self)
+
+    def _merge_base_pdks(self) -> None:
+        """Copies every base_pdks cell and cross_section not defined in this PDK.
 
+        The base PDKs are not modified.
+        """
         for pdk in self.base_pdks:
-            cross_sections = pdk.cross_sections
-            cross_sections.update(self.cross_sections)
-            cells = pdk.cells
-            self.cross_sections = cross_sections
-            cells.update(self.cells)
-            self.cells.update(cells)
+            pdk._merge_base_pdks()
+            for name, cell in pdk.cells.items():
+                self.cells.setdefault(name, cell)
+            for name, cross_section in pdk.cross_sections.items():
+                self.cross_sections.setdefault(name, cross_section)
 
-            # layers = pdk.layers
-            # layers.update(self.layers)
-            # self.layers.update(layers)
+    def get_hash(self) -> str:
+        """Returns a hash of the PDK name, cells, cross_sections, layers and constants.
 
-        _set_active_pdk(self)
+        Functions are hashed by name and arguments, so changes in their code are not
+        detected.
+        """
+        fingerprint = (
+            self.name,
+            tuple(self.cells.items()),
+            tuple(self.cross_sections.items()),
+            self.layers,
+            tuple(self.layer_transitions.items()),
+            tuple(self.constants.items()),
+        )
+        if self._hash is None or self._hash[0] != fingerprint:
+            layers = [
+                (layer.name, layer.layer, layer.datatype) for layer in self.layers or []
+            ]
+            text = repr(fingerprint[:3] + (layers,) + fingerprint[4:])
+            text = re.sub(r" at 0x[0-9a-f]+", "", text)
+            self._hash = (fingerprint, hashlib.sha256(text.encode()).hexdigest())
+        return self._hash[1]
 
     def register_cells(self, **kwargs) -> None:
         """Register cell factories."""
@@ -241,6 +279,8 @@ class Pdk(BaseModel):
 
         """
 
+        from gdsfactory.read.from_yaml_template import cell_from_yaml_template
+
         message = "Updated" if update else "Registered"
 
         if dirpath:
@@ -274,28 +314,22 @@ class Pdk(BaseModel):
 
     def get_cell(self, cell: CellSpec, **kwargs) -> ComponentFactory:
         """Returns ComponentFactory from a cell spec."""
-        cells = set(self.cells.keys())
-
-        if callable(cell):
-            return cell
-        elif isinstance(cell, str):
-            if cell not in cells:
+        if isinstance(cell, str):
+            if cell not in self.cells:
                 cells = list(self.cells.keys())
                 raise ValueError(
                     f"{cell!r} from PDK {self.name!r} not in cells: {cells} "
                 )
             return self.cells[cell]
+        elif callable(cell):
+            return cell
         elif isinstance(cell, dict | DictConfig):
-            for key in cell.keys():
-                if key not in component_settings:
-                    raise ValueError(
-                        f"Invalid setting {key!r} not in {component_settings}"
-                    )
+            _validate_spec_keys(cell)
             settings = dict(cell.get("settings", {}))
             settings.update(**kwargs)
 
             cell_name = cell.get("function")
-            if not isinstance(cell_name, str) or cell_name not in cells:
+            if not isinstance(cell_name, str) or cell_name not in self.cells:
                 cells = list(self.cells.keys())
                 raise ValueError(
                     f"{cell_name!r} from PDK {self.name!r} not in cells: {cells} "
@@ -328,9 +362,14 @@ class Pdk(BaseModel):
         **kwargs,
     ) -> Component:
         """Returns component from a component spec."""
-        cells = set(cells.keys())
-
-        if isinstance(component, Component):
+        if isinstance(component, str):
+            if component not in cells:
+                cells = list(cells.keys())
+                raise ValueError(
+                    f"{component!r} not in PDK {self.name!r} cells: {cells} "
+                )
+            return cells[component](**kwargs)
+        elif isinstance(component, Component):
             if kwargs:
                 raise ValueError(f"Cannot apply kwargs {kwargs} to {component.name!r}")
             return component
@@ -338,18 +377,8 @@ class Pdk(BaseModel):
             return Component.from_kcell(component)
         elif callable(component):
             return component(**kwargs)
-        elif isinstance(component, str):
-            if component not in cells:
-                raise ValueError(
-                    f"{component!r} not in PDK {self.name!r} cells: {cells} "
-                )
-            return self.cells[component](**kwargs)
         elif isinstance(component, dict | DictConfig):
-            for key in component.keys():
-                if key not in component_settings:
-                    raise ValueError(
-                        f"Invalid setting {key!r} not in {component_settings}"
-                    )
+            _validate_spec_keys(component)
             settings = dict(component.get("settings", {}))
             settings.update(**kwargs)
 
@@ -358,10 +387,11 @@ class Pdk(BaseModel):
             cell_name = cell_name.split(".")[-1]
 
             if not isinstance(cell_name, str) or cell_name not in cells:
+                cells = list(cells.keys())
                 raise ValueError(
                     f"{cell_name!r} from PDK {self.name!r} not in cells: {cells} "
                 )
-            return self.cells[cell_name](**settings)
+            return cells[cell_name](**settings)
         else:
             raise ValueError(
                 "get_component expects a ComponentSpec (Component, ComponentFactory, "
@@ -372,18 +402,18 @@ class Pdk(BaseModel):
         self, cross_section: CrossSectionSpec, **kwargs
     ) -> CrossSection | Transition:
         """Returns cross_section from a cross_section spec."""
-        if isinstance(cross_section, CrossSection):
-            return cross_section.copy(**kwargs)
-        elif isinstance(cross_section, Transition):
-            return cross_section
-        elif callable(cross_section):
-            return cross_section(**kwargs)
-        elif isinstance(cross_section, str):
+        if isinstance(cross_section, str):
             if cross_section not in self.cross_sections:
                 cross_sections = list(self.cross_sections.keys())
                 raise ValueError(f"{cross_section!r} not in {cross_sections}")
             xs = self.cross_sections[cross_section]
             return xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+        elif isinstance(cross_section, CrossSection):
+            return cross_section.copy(**kwargs)
+        elif isinstance(cross_section, Transition):
+            return cross_section
+        elif callable(cross_section):
+            return cross_section(**kwargs)
         elif isinstance(cross_section, dict | DictConfig):
             xs_name = cross_section.get("cross_section", None)
             settings = cross_section.get("settings", {})
@@ -606,6 +636,32 @@ on_yaml_cell_registered.add_handler(on_cell_registered.fire)
 on_yaml_cell_modified.add_handler(show)
 
 
+def _demo_spec_resolution(n: int = 10_000) -> None:
+    """Times cell, component and cross_section spec resolution on the active PDK."""
+    import timeit
+
+    pdk = get_active_pdk()
+    specs = [
+        ("get_cell(str)", pdk.get_cell, "mmi1x2"),
+        ("get_cell(dict)", pdk.get_cell, {"function": "mmi1x2", "settings": {}}),
+        ("get_component(str)", pdk.get_component, "mmi1x2"),
+        (
+            "get_component(dict)",
+            pdk.get_component,
+            {"component": "mmi1x2", "settings": {}},
+        ),
+        ("get_cross_section(str)", pdk.get_cross_section, "xs_sc"),
+        (
+            "get_cross_section(dict)",
+            pdk.get_cross_section,
+            {"cross_section": "xs_sc", "settings": {"width": 1}},
+        ),
+    ]
+    for label, function, spec in specs:
+        t = timeit.timeit(partial(function, spec), number=n) / n
+        print(f"{label}: {t * 1e6:.2f} us")
+
+
 if __name__ == "__main__":
     l1 = get_layer((1, 0))
     l2 = get_layer((3, 0))
@@ -33,7 +33,10 @@ import csv
 import functools
 import typing
 import warnings
-from collections.abc import Callable
+import weakref
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from functools import partial
 
 import kfactory as kf
@@ -242,6 +245,62 @@ def csv2port(csvpath) -> dict[str, Port]:
     return ports
 
 
+_DIRECTIONS = "ENWS"
+
+# sides in naming order, with the coordinate to sort the ports of each side by
+_CLOCKWISE = {"W": "+y", "N": "+x", "E": "-y", "S": "-x"}
+_COUNTER_CLOCKWISE = {"E": "+y", "N": "-x", "W": "-y", "S": "+x"}
+_CLOCKWISE_TOP_RIGHT = {"E": "-y", "S": "-x", "W": "+y", "N": "+x"}
+
+
+def _direction_codes(angles: np.ndarray) -> np.ndarray:
+    """Returns 0, 1, 2 or 3 for ports with orientation angles facing E, N, W, S."""
+    angles = np.asarray(angles, dtype=np.float64) % 360
+    return np.select(
+        [(angles <= 45) | (angles >= 315), angles <= 135, angles <= 225], [0, 1, 2], 3
+    )
+
+
+def _ports_xy(ports: list[kf.Port]) -> np.ndarray:
+    """Returns the (N, 2) centers of ports in dbu."""
+    disps = [port.trans.disp for port in ports]
+    return np.array([(d.x, d.y) for d in disps], dtype=np.int64).reshape(-1, 2)
+
+
+def _order_by_direction(
+    directions: np.ndarray, xy: np.ndarray, sides: dict[str, str]
+) -> np.ndarray:
+    """Returns the indexes that sort ports side by side, as sides does.
+
+    Args:
+        directions: 0, 1, 2, 3 for ports facing E, N, W, S.
+        xy: (N, 2) port centers.
+        sides: side to sort key, like "-y" to sort north to south. Ties keep
+            the order of the ports.
+    """
+    rank = np.zeros(4, dtype=np.int64)
+    axis = np.zeros(4, dtype=np.int64)
+    sign = np.ones(4, dtype=np.int64)
+    for i, (side, key) in enumerate(sides.items()):
+        direction = _DIRECTIONS.index(side)
+        rank[direction] = i
+        axis[direction] = "xy".index(key[1])
+        sign[direction] = -1 if key[0] == "-" else 1
+    keys = xy[np.arange(len(xy)), axis[directions]] * sign[directions]
+    return np.lexsort((keys, rank[directions]))
+
+
+def _sort_ports_by_direction(
+    ports: Iterable[kf.Port], sides: dict[str, str]
+) -> list[kf.Port]:
+    ports = list(ports)
+    transs = [port.trans for port in ports]
+    directions = np.array([trans.angle for trans in transs], dtype=np.int64)
+    disps = [trans.disp for trans in transs]
+    xy = np.array([(d.x, d.y) for d in disps], dtype=np.int64).reshape(-1, 2)
+    return [ports[i] for i in _order_by_direction(directions, xy, sides)]
+
+
 def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
     """Sort and return ports in the clockwise direction.
 
@@ -256,34 +315,7 @@ def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
             8   7
 
     """
-    port_list = ports
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    ports = west_ports + north_ports + east_ports + south_ports
-    return list(ports)
+    return _sort_ports_by_direction(ports, _CLOCKWISE)
 
 
 def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
@@ -300,38 +332,240 @@ def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
             7   8
 
     """
-    port_list = list(ports)
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
+    return _sort_ports_by_direction(ports, _COUNTER_CLOCKWISE)
 
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
 
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.y)  # sort south to north
+class PortIndex:
+    """Secondary indexes over a list of ports for selection without rescanning.
 
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.x)  # sort east to west
+    Port positions are grouped by port_type, layer, width, angle, direction and
+    name. Sorted names answer prefix and suffix queries by bisection and the
+    centers sorted by x answer bounding box queries.
+    """
 
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.y)  # sort north to south
+    def __init__(self, ports: Iterable[kf.Port]) -> None:
+        self.ports = list(ports)
+        by_type: dict[str, list[int]] = defaultdict(list)
+        by_layer: dict[int, list[int]] = defaultdict(list)
+        by_width: dict[int, list[int]] = defaultdict(list)
+        by_angle: dict[float, list[int]] = defaultdict(list)
+        by_direction: dict[str, list[int]] = defaultdict(list)
+        by_name: dict[str, list[int]] = defaultdict(list)
+        centers = np.empty((len(self.ports), 2))
+        for i, port in enumerate(self.ports):
+            trans = port.dcplx_trans
+            by_type[port.port_type].append(i)
+            by_layer[port.layer].append(i)
+            by_width[port.width].append(i)
+            by_angle[trans.angle].append(i)
+            by_name[port.name].append(i)
+            centers[i] = trans.disp.x, trans.disp.y
+        directions = _direction_codes(np.fromiter(by_angle, dtype=np.float64))
+        for indexes, direction in zip(by_angle.values(), directions.tolist()):
+            by_direction[_DIRECTIONS[direction]].extend(indexes)
+        self.by_type = dict(by_type)
+        self.by_layer = dict(by_layer)
+        self.by_width = dict(by_width)
+        self.by_angle = dict(by_angle)
+        self.by_direction = {
+            direction: sorted(indexes) for direction, indexes in by_direction.items()
+        }
+        self.by_name = dict(by_name)
+
+        names = [port.name or "" for port in self.ports]
+        self._names = sorted((name, i) for i, name in enumerate(names))
+        self._reversed_names = sorted((name[::-1], i) for i, name in enumerate(names))
+        self._x_order = np.argsort(centers[:, 0], kind="stable")
+        self._xs = centers[self._x_order, 0]
+        self._ys = centers[self._x_order, 1]
+
+    def __len__(self) -> int:
+        return len(self.ports)
+
+    @staticmethod
+    def _starting_with(names: list[tuple[str, int]], prefix: str) -> list[int]:
+        indexes = []
+        for name, i in names[bisect_left(names, (prefix,)) :]:
+            if not name.startswith(prefix):
+                break
+            indexes.append(i)
+        return indexes
+
+    def select(
+        self,
+        layer: LayerSpec | None = None,
+        prefix: str | None = None,
+        suffix: str | None = None,
+        orientation: float | None = None,
+        width: float | None = None,
+        layers_excluded: tuple[tuple[int, int], ...] | None = None,
+        port_type: str | None = None,
+        names: list[str] | None = None,
+        bbox: tuple[Float2, Float2] | None = None,
+        trans: kf.kdb.DCplxTrans | None = None,
+    ) -> list[int]:
+        """Returns the sorted positions of the ports matching all the filters.
+
+        Args:
+            layer: port GDS layer.
+            prefix: port name prefix.
+            suffix: port name suffix.
+            orientation: in degrees.
+            width: port width.
+            layers_excluded: layers to exclude.
+            port_type: optical, electrical, vertical_te.
+            names: port names.
+            bbox: ((xmin, ymin), (xmax, ymax)) in um around the port centers.
+            trans: matches orientation and bbox with the ports transformed,
+                for the ports of an instance. The bbox is only a coarse filter
+                for non manhattan transformations.
+        """
+        matches: list[typing.Collection[int]] = []
+        if layer:
+            from gdsfactory.pdk import get_layer
+
+            layer = get_layer(layer)
+            matches.append(
+                [
+                    i
+                    for key, indexes in self.by_layer.items()
+                    if get_layer(key) == layer
+                    for i in indexes
+                ]
+            )
+        if prefix:
+            matches.append(self._starting_with(self._names, prefix))
+        if suffix:
+            matches.append(self._starting_with(self._reversed_names, suffix[::-1]))
+        if orientation is not None:
+            matches.append(
+                [
+                    i
+                    for angle, indexes in self.by_angle.items()
+                    if np.isclose(
+                        (trans * kf.kdb.DCplxTrans(1, angle, False, 0, 0)).angle
+                        if trans
+                        else angle,
+                        orientation,
+                    )
+                    for i in indexes
+                ]
+            )
+        if layers_excluded:
+            matches.append(
+                [
+                    i
+                    for key, indexes in self.by_layer.items()
+                    if key not in layers_excluded
+                    for i in indexes
+                ]
+            )
+        if width:
+            matches.append(self.by_width.get(width, []))
+        if port_type:
+            matches.append(self.by_type.get(port_type, []))
+        if names:
+            matches.append([i for name in names for i in self.by_name.get(name, [])])
+        if bbox is not None:
+            box = kf.kdb.DBox(*bbox[0], *bbox[1])
+            if trans:
+                box = box.transformed(trans.inverted())
+            start = np.searchsorted(self._xs, box.left, side="left")
+            stop = np.searchsorted(self._xs, box.right, side="right")
+            ys = self._ys[start:stop]
+            inside = (ys >= box.bottom) & (ys <= box.top)
+            matches.append(self._x_order[start:stop][inside].tolist())
+
+        if not matches:
+            return list(range(len(self.ports)))
+        matches.sort(key=len)
+        selected = set(matches[0])
+        for indexes in matches[1:]:
+            if not selected:
+                break
+            selected.intersection_update(indexes)
+        return sorted(selected)
+
+
+def _ports_fingerprint(ports: Iterable[kf.Port]) -> int:
+    """Returns a hash of the names, transformations, widths, layers and types.
+
+    kfactory lets ports of locked cells be moved and renamed in place.
+    """
+    return hash(
+        tuple(
+            (
+                p.name,
+                p._trans if p._trans is not None else p._dcplx_trans,
+                p.width,
+                p.layer,
+                p.port_type,
+            )
+            for p in ports
+        )
+    )
 
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.x)  # sort west to east
 
-    ports = east_ports + north_ports + west_ports + south_ports
-    return list(ports)
+_port_indexes: dict[int, tuple[weakref.ref, int, PortIndex]] = {}
+
+
+def get_port_index(component: kf.KCell) -> PortIndex:
+    """Returns a PortIndex of the component ports.
+
+    The index of a locked component is cached until the component is deleted
+    or its ports are moved, renamed or changed.
+    """
+    ports = component.ports
+    if not component._locked:
+        return PortIndex(ports)
+    fingerprint = _ports_fingerprint(ports)
+    index = _cached_port_index(ports, fingerprint)
+    if index is None:
+        if id(ports) not in _port_indexes:
+            weakref.finalize(component, _port_indexes.pop, id(ports), None)
+        index = PortIndex(ports)
+        _port_indexes[id(ports)] = (weakref.ref(component), fingerprint, index)
+    return index
+
+
+def _cached_port_index(
+    ports: kf.Ports, fingerprint: int | None = None
+) -> PortIndex | None:
+    """Returns the cached PortIndex of the ports of a locked component."""
+    cached = _port_indexes.get(id(ports))
+    if cached is None:
+        return None
+    component = cached[0]()
+    if component is None or component.ports is not ports or not component._locked:
+        return None
+    if fingerprint is None:
+        fingerprint = _ports_fingerprint(ports)
+    return cached[2] if fingerprint == cached[1] else None
+
+
+def _indexed_ports(ports: typing.Any) -> tuple[PortIndex, kf.Instance | None] | None:
+    """Returns (index, instance) for the ports of a locked cell or of its instance.
+
+    The ports of an instance are the cell ports transformed.
+    """
+    if isinstance(ports, kf.Instance):
+        ports = ports.ports
+    if isinstance(ports, kf.kcell.InstancePorts):
+        instance = ports.instance
+        if instance.cell._locked and not instance.is_regular_array():
+            return get_port_index(instance.cell), instance
+    elif isinstance(ports, kf.KCell):
+        if ports._locked:
+            return get_port_index(ports), None
+    elif isinstance(ports, kf.Ports):
+        index = _cached_port_index(ports)
+        if index is not None:
+            return index, None
+    return None
 
 
 def select_ports(
-    ports: kf.Ports | kf.Instance,
+    ports: kf.Ports | kf.Instance | kf.KCell,
     layer: LayerSpec | None = None,
     prefix: str | None = None,
     suffix: str | None = None,
@@ -342,9 +576,13 @@ def select_ports(
     names: list[str] | None = None,
     clockwise: bool = True,
     sort_ports: bool = False,
+    bbox: tuple[Float2, Float2] | None = None,
 ) -> list[kf.Port]:
     """Returns a dict of ports from a list of ports.
 
+    The ports of locked components and of their instances are selected from a
+    cached PortIndex instead of scanning every port.
+
     Args:
         ports: port list.
         layer: select ports with port GDS layer.
@@ -354,8 +592,10 @@ def select_ports(
         width: select ports with port width.
         layers_excluded: List of layers to exclude.
         port_type: select ports with port type (optical, electrical, vertical_te).
+        names: select ports with these names.
         clockwise: if True, sort ports clockwise, False: counter-clockwise.
         sort_ports: if True, sort ports.
+        bbox: select ports with center in ((xmin, ymin), (xmax, ymax)) in um.
 
     Returns:
         Dict containing the selected ports {port name: port}.
@@ -364,7 +604,30 @@ def select_ports(
     if isinstance(ports, dict):
         ports = ports.values()
 
-    if isinstance(ports, kf.Instance):
+    indexed = _indexed_ports(ports)
+    if indexed is not None:
+        index, instance = indexed
+        selected = index.select(
+            layer=layer,
+            prefix=prefix,
+            suffix=suffix,
+            orientation=orientation,
+            width=width,
+            layers_excluded=layers_excluded,
+            port_type=port_type,
+            names=names,
+            bbox=bbox,
+            trans=instance.dcplx_trans if instance else None,
+        )
+        ports = [index.ports[i] for i in selected]
+        if instance is not None:
+            trans = instance.dcplx_trans if instance.is_complex() else instance.trans
+            ports = [p.copy(trans) for p in ports]
+            if bbox is not None:
+                ports = [p for p in ports if _in_bbox(p, bbox)]
+        return _sort_ports(ports, clockwise) if sort_ports else ports
+
+    if isinstance(ports, kf.Instance | kf.KCell):
         ports = ports.ports
 
     if layer:
@@ -388,13 +651,21 @@ def select_ports(
         ports = [p for p in ports if p.port_type == port_type]
     if names:
         ports = [p for p in ports if p.name in names]
+    if bbox is not None:
+        ports = [p for p in ports if _in_bbox(p, bbox)]
 
-    if sort_ports:
-        if clockwise:
-            ports = sort_ports_clockwise(ports)
-        else:
-            ports = sort_ports_counter_clockwise(ports)
-    return ports
+    return _sort_ports(ports, clockwise) if sort_ports else ports
+
+
+def _in_bbox(port: kf.Port, bbox: tuple[Float2, Float2]) -> bool:
+    (xmin, ymin), (xmax, ymax) = bbox
+    return xmin <= port.d.x <= xmax and ymin <= port.d.y <= ymax
+
+
+def _sort_ports(ports: list[kf.Port], clockwise: bool) -> list[kf.Port]:
+    if clockwise:
+        return sort_ports_clockwise(ports)
+    return sort_ports_counter_clockwise(ports)
 
 
 select_ports_optical = partial(select_ports, port_type="optical")
@@ -434,25 +705,18 @@ def get_ports_facing(ports: list[Port], direction: str = "W") -> list[Port]:
     if direction not in valid_directions:
         raise PortOrientationError(f"{direction} must be in {valid_directions} ")
 
+    indexed = _indexed_ports(ports)
+    if indexed is not None and indexed[1] is None:
+        index = indexed[0]
+        return [index.ports[i] for i in index.by_direction.get(direction, [])]
+
     if isinstance(ports, dict):
         ports = list(ports)
     elif isinstance(ports, Component | ComponentReference):
-        ports = list(ports.ports)
-
-    direction_ports: dict[str, list[Port]] = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in ports:
-        angle = p.orientation % 360 if p.orientation is not None else 0
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    return direction_ports[direction]
+        ports = ports.ports
+    ports = list(ports)
+    angles = (p.orientation if p.orientation is not None else 0 for p in ports)
+    return _direction_ports(ports, angles)[direction]
 
 
 def deco_rename_ports(component_factory: Callable) -> Callable:
@@ -465,83 +729,61 @@ def deco_rename_ports(component_factory: Callable) -> Callable:
     return auto_named_component_factory
 
 
-def _rename_ports_facing_side(
-    direction_ports: dict[str, list[Port]], prefix: str = ""
+def _name_ports_facing_side(
+    direction_ports: dict[str, list[Port]], prefix: str, sign: int
 ) -> None:
-    """Renames ports clockwise."""
-    for direction, list_ports in list(direction_ports.items()):
+    for direction, list_ports in direction_ports.items():
+        if not list_ports:
+            continue
+        xy = _ports_xy(list_ports) * sign
         if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: p.x)
-            list_ports.sort(key=lambda p: p.y)
+            # sort along y then x
+            order = np.lexsort((xy[:, 0], xy[:, 1]))
+        elif direction in ["S", "N"]:
+            # sort along x then y
+            order = np.lexsort((xy[:, 1], xy[:, 0]))
+        else:
+            order = range(len(list_ports))
+
+        for i, j in enumerate(order):
+            list_ports[j].name = f"{prefix}{direction}{i}"
 
-        if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: p.y)
-            list_ports.sort(key=lambda p: p.x)
 
-        for i, p in enumerate(list_ports):
-            p.name = prefix + direction + str(i)
+def _rename_ports_facing_side(
+    direction_ports: dict[str, list[Port]], prefix: str = ""
+) -> None:
+    """Renames ports clockwise."""
+    _name_ports_facing_side(direction_ports, prefix, sign=1)
 
 
 def _rename_ports_facing_side_ccw(
     direction_ports: dict[str, list[Port]], prefix: str = ""
 ) -> None:
     """Renames ports counter-clockwise."""
-    for direction, list_ports in list(direction_ports.items()):
-        if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: -p.x)
-            list_ports.sort(key=lambda p: -p.y)
+    _name_ports_facing_side(direction_ports, prefix, sign=-1)
 
-        if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: -p.y)
-            list_ports.sort(key=lambda p: -p.x)
 
-        for i, p in enumerate(list_ports):
-            p.name = prefix + direction + str(i)
+def _name_ports_by_direction(
+    direction_ports: PortsMap, prefix: str, sides: dict[str, str]
+) -> None:
+    ports = [p for side in sides for p in direction_ports[side]]
+    directions = np.repeat(
+        [_DIRECTIONS.index(side) for side in sides],
+        [len(direction_ports[side]) for side in sides],
+    )
+    order = _order_by_direction(directions, _ports_xy(ports), sides)
+    for i, j in enumerate(order):
+        ports[j].name = f"{prefix}{i+1}" if prefix else i + 1
 
 
 def _rename_ports_counter_clockwise(direction_ports, prefix="") -> None:
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    ports = east_ports + north_ports + west_ports + south_ports
-
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+    _name_ports_by_direction(direction_ports, prefix, _COUNTER_CLOCKWISE)
 
 
 def _rename_ports_clockwise(direction_ports: PortsMap, prefix: str = "") -> None:
     """Rename ports in the clockwise direction starting from the bottom left \
     (west) corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
-    # south_ports.sort(key=lambda p: p.y)  #  south first
-
-    ports = west_ports + north_ports + east_ports + south_ports
-
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+    _name_ports_by_direction(direction_ports, prefix, _CLOCKWISE)
 
 
 def _rename_ports_clockwise_top_right(
@@ -549,22 +791,16 @@ def _rename_ports_clockwise_top_right(
 ) -> None:
     """Rename ports in the clockwise direction starting from the top right \
     corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
+    _name_ports_by_direction(direction_ports, prefix, _CLOCKWISE_TOP_RIGHT)
 
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
 
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    ports = east_ports + south_ports + west_ports + north_ports
-
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+def _direction_ports(ports: list[Port], angles: Iterable[float]) -> PortsMap:
+    """Returns the ports grouped by the side their orientation angles face."""
+    directions = _direction_codes(np.fromiter(angles, dtype=np.float64))
+    direction_ports: PortsMap = {x: [] for x in _DIRECTIONS}
+    for port, direction in zip(ports, directions.tolist()):
+        direction_ports[_DIRECTIONS[direction]].append(port)
+    return direction_ports
 
 
 def rename_ports_by_orientation(
@@ -597,34 +833,26 @@ def rename_ports_by_orientation(
 
     """
     layers_excluded = layers_excluded or []
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
 
     ports = component.ports
     ports = select_ports(ports, **kwargs)
 
     ports_on_layer = [p for p in ports if p.layer not in layers_excluded]
 
+    angles = []
     for p in ports_on_layer:
         # Make sure we can backtrack the parent component from the port
         p.parent = component
+        orientation = p.orientation
+        angles.append(270 if orientation is None else orientation)
 
-        if p.orientation is not None:
-            angle = p.orientation % 360
-            if angle <= 45 or angle >= 315:
-                direction_ports["E"].append(p)
-            elif angle <= 135 and angle >= 45:
-                direction_ports["N"].append(p)
-            elif angle <= 225 and angle >= 135:
-                direction_ports["W"].append(p)
-            else:
-                direction_ports["S"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    function(direction_ports, prefix=prefix)
+    function(_direction_ports(ports_on_layer, angles), prefix=prefix)
     return component
 
 
+_auto_renamed_ports: dict[int, tuple[typing.Hashable, int]] = {}
+
+
 def auto_rename_ports(
     component: Component,
     function=_rename_ports_clockwise,
@@ -640,6 +868,9 @@ def auto_rename_ports(
 ) -> Component:
     """Adds prefix for optical and electrical.
 
+    A locked component renamed with the same arguments is returned as is, as
+    long as its ports did not change since the last rename.
+
     Args:
         component: to auto_rename_ports.
         function: to rename ports.
@@ -658,8 +889,33 @@ def auto_rename_ports(
         width: select ports with port width.
         layers_excluded: List of layers to exclude.
         clockwise: if True, sort ports clockwise, False: counter-clockwise.
-
     """
+    try:
+        key = (
+            id(component.ports),
+            function,
+            select_ports_optical,
+            select_ports_electrical,
+            select_ports_placement,
+            prefix,
+            prefix_optical,
+            prefix_electrical,
+            prefix_placement,
+            port_type,
+            tuple(sorted(kwargs.items())),
+        )
+        hash(key)
+    except TypeError:
+        key = None
+    cached = _auto_renamed_ports.get(id(component))
+    if (
+        component._locked
+        and cached is not None
+        and cached[0] == key
+        and cached[1] == _ports_fingerprint(component.ports)
+    ):
+        return component
+
     if port_type is None:
         if select_ports_optical:
             rename_ports_by_orientation(
@@ -694,6 +950,14 @@ def auto_rename_ports(
             port_type=port_type,
             **kwargs,
         )
+
+    if component._locked and key is not None:
+        if cached is None:
+            weakref.finalize(component, _auto_renamed_ports.pop, id(component), None)
+        _auto_renamed_ports[id(component)] = (
+            key,
+            _ports_fingerprint(component.ports),
+        )
     return component
 
 
@@ -769,24 +1033,12 @@ def map_ports_to_orientation_cw(
             S0   S1
 
     """
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
     ports = select_ports(ports, **kwargs)
     ports_on_layer = [p.copy() for p in ports]
+    names = [p.name for p in ports_on_layer]
 
-    for p in ports_on_layer:
-        p.name_original = p.name
-        angle = p.orientation % 360
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-    function(direction_ports)
-    return {p.name: p.name_original for p in ports_on_layer}
+    function(_direction_ports(ports_on_layer, (p.orientation for p in ports_on_layer)))
+    return {p.name: name for p, name in zip(ports_on_layer, names)}
 
 
 map_ports_to_orientation_ccw = partial(
@@ -844,6 +1096,8 @@ __all__ = [
     "csv2port",
     "select_ports",
     "select_ports_list",
+    "PortIndex",
+    "get_port_index",
     "flipped",
     "move_copy",
     "get_ports_facing",
@@ -855,6 +1109,43 @@ __all__ = [
     "map_ports_layer_to_orientation",
 ]
 
+
+def _demo_select_ports(columns: int = 100, rows: int = 100, repeat: int = 100) -> None:
+    """Times select_ports on a list against the index of a locked pad array."""
+    import timeit
+
+    import gdsfactory as gf
+
+    c = gf.components.pad_array(columns=columns, rows=rows)
+    t = timeit.timeit(lambda: PortIndex(c.ports), number=1)
+    print(f"PortIndex of {len(c.ports)} ports: {t * 1e3:.2f} ms")
+    get_port_index(c)
+    queries = [
+        {"prefix": "e1_1"},
+        {"orientation": 90},
+        {"port_type": "electrical", "bbox": ((0, 0), (500, 500))},
+    ]
+    for query in queries:
+        for ports in (list(c.ports), c):
+            t = timeit.timeit(partial(select_ports, ports, **query), number=repeat)
+            print(f"{type(ports).__name__} {query}: {t / repeat * 1e3:.2f} ms")
+
+
+def _demo_auto_rename_ports(
+    columns: int = 100, rows: int = 100, repeat: int = 5
+) -> None:
+    """Times auto_rename_ports on a pad array, unlocked and then locked."""
+    import timeit
+
+    import gdsfactory as gf
+
+    locked = gf.components.pad_array(columns=columns, rows=rows)
+    unlocked = locked.dup()
+    for c in (unlocked, locked, locked):
+        t = timeit.timeit(partial(auto_rename_ports, c), number=repeat) / repeat
+        print(f"locked={c._locked}: {t * 1e3:.2f} ms")
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
@@ -49,10 +49,16 @@ routes:
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import importlib
 import io
+import json
+import os
 import pathlib
+import re
 import warnings
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import partial
 from typing import IO, Any, Literal
@@ -63,6 +69,7 @@ from omegaconf import DictConfig, OmegaConf
 import gdsfactory as gf
 from gdsfactory.add_pins import add_instance_label
 from gdsfactory.component import Component, Instance
+from gdsfactory.config import CONF, PATH, __version__
 from gdsfactory.serialization import clean_value_json
 
 valid_placement_keys = [
@@ -160,11 +167,7 @@ def _get_anchor_value_from_name(
 def _move_ref(
     x: str | float,
     x_or_y: Literal["x", "y"],
-    placements_conf,
-    connections_by_transformed_inst,
-    instances,
-    encountered_insts,
-    all_remaining_insts,
+    instances: dict[str, Instance],
 ) -> float:
     if not isinstance(x, str):
         return x
@@ -173,15 +176,6 @@ def _move_ref(
             f"You can define {x_or_y} as `{x_or_y}: instanceName,portName` got `{x_or_y}: {x!r}`"
         )
     instance_name_ref, port_name = x.split(",")
-    if instance_name_ref in all_remaining_insts:
-        place(
-            placements_conf,
-            connections_by_transformed_inst,
-            instances,
-            encountered_insts,
-            instance_name_ref,
-            all_remaining_insts,
-        )
     if instance_name_ref not in instances:
         raise ValueError(
             f"{instance_name_ref!r} not in {list(instances.keys())}."
@@ -201,41 +195,105 @@ def _move_ref(
     return _get_anchor_value_from_name(instances[instance_name_ref], port_name, x_or_y)
 
 
+def _get_placement_dependencies(
+    instance_name: str,
+    placements_conf: dict[str, dict[str, int | float | str]],
+    connections_by_transformed_inst: dict[str, dict[str, str]],
+) -> list[str]:
+    """Returns the instances that need to be placed before instance_name."""
+    dependencies = []
+    placement_settings = placements_conf.get(instance_name) or {}
+    if isinstance(placement_settings, dict):
+        for key in ("x", "y", "xmin", "xmax", "ymin", "ymax"):
+            value = placement_settings.get(key)
+            if isinstance(value, str) and len(value.split(",")) == 2:
+                dependencies.append(value.split(",")[0])
+
+    if instance_name in connections_by_transformed_inst:
+        conn_info = connections_by_transformed_inst[instance_name]
+        dependencies.append(conn_info["instance_dst_name"])
+    return dependencies
+
+
+def get_placement_order(
+    placements_conf: dict[str, dict[str, int | float | str]],
+    connections_by_transformed_inst: dict[str, dict[str, str]],
+) -> list[str]:
+    """Returns the instances to place, sorted so that dependencies come first.
+
+    Builds a dependency graph from the relative placements (x: inst,port) and
+    the connections, and sorts it topologically in linear time.
+
+    Args:
+        placements_conf: Dict of instance_name to placement (x, y, rotation ...).
+        connections_by_transformed_inst: Dict of connection attributes.
+            keyed by the name of the instance which should be transformed.
+
+    Raises:
+        ValueError: if there is a circular reference in the placements.
+    """
+    to_place = dict.fromkeys(placements_conf)
+    to_place.update(dict.fromkeys(connections_by_transformed_inst))
+    graph = {
+        instance_name: [
+            dependency
+            for dependency in _get_placement_dependencies(
+                instance_name, placements_conf, connections_by_transformed_inst
+            )
+            if dependency in to_place
+        ]
+        for instance_name in to_place
+    }
+
+    order: list[str] = []
+    placed: set[str] = set()
+    for root in graph:
+        if root in placed:
+            continue
+        path = [root]
+        on_path = {root}
+        stack = [iter(graph[root])]
+        while stack:
+            dependency = next(stack[-1], None)
+            if dependency is None:
+                stack.pop()
+                instance_name = path.pop()
+                on_path.remove(instance_name)
+                placed.add(instance_name)
+                order.append(instance_name)
+            elif dependency in on_path:
+                loop = path[path.index(dependency) :] + [dependency]
+                loop_str = " -> ".join(loop)
+                raise ValueError(
+                    f"circular reference in placement for {dependency}! "
+                    f"Loop: {loop_str}"
+                )
+            elif dependency not in placed:
+                path.append(dependency)
+                on_path.add(dependency)
+                stack.append(iter(graph[dependency]))
+    return order
+
+
 def place(
     placements_conf: dict[str, dict[str, int | float | str]],
     connections_by_transformed_inst: dict[str, dict[str, str]],
     instances: dict[str, Instance],
-    encountered_insts: list[str],
-    instance_name: str | None = None,
-    all_remaining_insts: list[str] | None = None,
+    instance_name: str,
 ) -> None:
     """Place instance_name based on placements_conf config.
 
+    The instances that instance_name depends on need to be placed already,
+    see get_placement_order.
+
     Args:
         placements_conf: Dict of instance_name to placement (x, y, rotation ...).
         connections_by_transformed_inst: Dict of connection attributes.
             keyed by the name of the instance which should be transformed.
         instances: Dict of references.
-        encountered_insts: list of encountered_instances.
         instance_name: instance_name to place.
-        all_remaining_insts: list of all the remaining instances to place
-            instances pop from this instance as they are placed.
 
     """
-    if not all_remaining_insts:
-        return
-    if instance_name is None:
-        instance_name = all_remaining_insts.pop(0)
-    else:
-        all_remaining_insts.remove(instance_name)
-
-    if instance_name in encountered_insts:
-        encountered_insts.append(instance_name)
-        loop_str = " -> ".join(encountered_insts)
-        raise ValueError(
-            f"circular reference in placement for {instance_name}! Loop: {loop_str}"
-        )
-    encountered_insts.append(instance_name)
     if instance_name not in instances:
         raise ValueError(f"{instance_name!r} not in {list(instances.keys())}")
     ref = instances[instance_name]
@@ -304,11 +362,7 @@ def place(
             ref.d.x += _move_ref(
                 x,
                 x_or_y="x",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
 
         # print(instance_name, x, xmin, xmax, y, ymin, ymax)
@@ -318,11 +372,7 @@ def place(
             ref.d.y += _move_ref(
                 y,
                 x_or_y="y",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
 
         if rotation:
@@ -338,21 +388,13 @@ def place(
             ref.d.ymax = _move_ref(
                 ymax,
                 x_or_y="y",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
         elif ymin is not None:
             ref.ymin = _move_ref(
                 ymin,
                 x_or_y="y",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
 
         if xmin is not None and xmax is not None:
@@ -361,21 +403,13 @@ def place(
             ref.d.xmin = _move_ref(
                 xmin,
                 x_or_y="x",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
         elif xmax is not None:
             ref.d.xmax = _move_ref(
                 xmax,
                 x_or_y="x",
-                placements_conf=placements_conf,
-                connections_by_transformed_inst=connections_by_transformed_inst,
                 instances=instances,
-                encountered_insts=encountered_insts,
-                all_remaining_insts=all_remaining_insts,
             )
         if dx:
             ref.d.x += dx
@@ -385,17 +419,6 @@ def place(
 
     if instance_name in connections_by_transformed_inst:
         conn_info = connections_by_transformed_inst[instance_name]
-        instance_dst_name = conn_info["instance_dst_name"]
-        if instance_dst_name in all_remaining_insts:
-            place(
-                placements_conf,
-                connections_by_transformed_inst,
-                instances,
-                encountered_insts,
-                instance_dst_name,
-                all_remaining_insts,
-            )
-
         make_connection(instances=instances, **conn_info)
         # placements_conf.pop(instance_name)
 
@@ -687,33 +710,29 @@ def from_yaml(
 
     if routing_strategy is None:
         routing_strategy = get_routing_strategies()
-    if isinstance(yaml_str, str | pathlib.Path | IO):
-        yaml_str = (
-            io.StringIO(yaml_str)
-            if isinstance(yaml_str, str) and "\n" in yaml_str
-            else yaml_str
-        )
-
-        conf = OmegaConf.load(
-            yaml_str
-        )  # nicer loader than conf = yaml.safe_load(yaml_str)
-
-    else:
-        conf = OmegaConf.create(yaml_str)
-
-    for key in conf.keys():
-        if key not in valid_top_level_keys:
-            raise ValueError(f"{key!r} not in {list(valid_top_level_keys)}")
-
-    settings = conf.get("settings", {})
 
     mode = kwargs.pop("mode") if "mode" in kwargs else "layout"
-    for key, value in kwargs.items():
-        if key not in settings:
-            raise ValueError(f"{key!r} not in {settings.keys()}")
+
+    conf = None
+    if isinstance(yaml_str, str | pathlib.Path | IO):
+        compiled = compile_yaml(_read_yaml_text(yaml_str))
+        if kwargs or compiled["resolved"] is None:
+            dict_conf = OmegaConf.create(compiled["conf"])
         else:
-            conf["settings"][key] = value
-    conf = OmegaConf.to_container(conf, resolve=True)
+            conf = copy.deepcopy(compiled["resolved"])
+
+    else:
+        dict_conf = OmegaConf.create(yaml_str)
+        _validate_top_level_keys(dict_conf)
+
+    if conf is None:
+        settings = dict_conf.get("settings", {})
+        for key, value in kwargs.items():
+            if key not in settings:
+                raise ValueError(f"{key!r} not in {settings.keys()}")
+            else:
+                dict_conf["settings"][key] = value
+        conf = OmegaConf.to_container(dict_conf, resolve=True)
     name = conf.get("name", None)
     return _from_yaml(
         conf=conf,
@@ -724,6 +743,154 @@ def from_yaml(
     )
 
 
+YAML_CACHE_SIZE = 1024
+_compiled_yaml_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_resolver_pattern = re.compile(r"\$\{\s*[\w.-]+\s*:")
+
+
+def _read_yaml_text(yaml_str: str | pathlib.Path | IO[Any]) -> str:
+    """Returns the YAML text from a YAML string, filepath or file object."""
+    if isinstance(yaml_str, str) and "\n" in yaml_str:
+        return yaml_str
+    if isinstance(yaml_str, str | pathlib.Path):
+        return pathlib.Path(yaml_str).read_text()
+    return yaml_str.read()
+
+
+def _validate_top_level_keys(conf: DictConfig | dict[str, Any]) -> None:
+    for key in conf.keys():
+        if key not in valid_top_level_keys:
+            raise ValueError(f"{key!r} not in {list(valid_top_level_keys)}")
+
+
+def _normalize_instances(conf: dict[str, Any]) -> None:
+    """Replaces the instance components "module.function" by the PDK cell name."""
+    for instance_conf in (conf.get("instances") or {}).values():
+        if not isinstance(instance_conf, dict):
+            continue
+        component = instance_conf.get("component")
+        if isinstance(component, str) and "${" not in component:
+            instance_conf["component"] = component.split(".")[-1]
+
+
+def _encode_keys(value: Any) -> Any:
+    """Returns value with the dicts with non string keys as a list of items.
+
+    JSON keys are strings, so {1: "a"} would be read back as {"1": "a"}.
+    """
+    if isinstance(value, dict):
+        items = [[key, _encode_keys(v)] for key, v in value.items()]
+        if all(isinstance(key, str) for key in value):
+            return dict(items)
+        return {"__items__": items}
+    if isinstance(value, list):
+        return [_encode_keys(v) for v in value]
+    return value
+
+
+def _decode_keys(value: dict[str, Any]) -> dict[Any, Any]:
+    if len(value) == 1 and "__items__" in value:
+        return dict(value["__items__"])
+    return value
+
+
+def compile_yaml(yaml_text: str) -> dict[str, Any]:
+    """Returns the parsed and validated YAML netlist.
+
+    The compiled netlist has the unresolved `conf` (to override settings) and the
+    `resolved` conf with the default settings, or None when the YAML calls
+    resolvers such as ${oc.env:HOME}, as those are resolved on each call.
+    Instance components are stored by cell name, so _from_yaml looks them up
+    directly in the PDK cells.
+
+    When CONF.yaml_cache is True, the compiled netlist is cached by content hash
+    and active PDK, in memory and on disk in PATH.yaml_cache, so that loading the
+    same YAML again skips parsing and validation. The cache on disk keeps the
+    most recently used netlists up to CONF.yaml_cache_max_size bytes.
+
+    Args:
+        yaml_text: YAML netlist.
+    """
+    from gdsfactory.pdk import get_active_pdk
+
+    digest = ""
+    filepath = PATH.yaml_cache
+    if CONF.yaml_cache:
+        key = f"{__version__}\n{get_active_pdk().get_hash()}\n{yaml_text}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        if digest in _compiled_yaml_cache:
+            _compiled_yaml_cache.move_to_end(digest)
+            return _compiled_yaml_cache[digest]
+
+        filepath = PATH.yaml_cache / f"{digest}.json"
+        try:
+            compiled = json.loads(filepath.read_text(), object_hook=_decode_keys)
+            os.utime(filepath)
+        except (OSError, ValueError):
+            pass
+        else:
+            _store_compiled_yaml(digest, compiled)
+            return compiled
+
+    conf = OmegaConf.load(io.StringIO(yaml_text))
+    _validate_top_level_keys(conf)
+    compiled = dict(conf=OmegaConf.to_container(conf, resolve=False), resolved=None)
+    if not _resolver_pattern.search(yaml_text):
+        compiled["resolved"] = OmegaConf.to_container(conf, resolve=True)
+        _normalize_instances(compiled["resolved"])
+    _normalize_instances(compiled["conf"])
+    if not CONF.yaml_cache:
+        return compiled
+
+    _store_compiled_yaml(digest, compiled)
+    tmp = filepath.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(_encode_keys(compiled)))
+        os.replace(tmp, filepath)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
+        return compiled
+    _evict_yaml_cache(keep=filepath)
+    return compiled
+
+
+def _store_compiled_yaml(digest: str, compiled: dict[str, Any]) -> None:
+    _compiled_yaml_cache[digest] = compiled
+    if len(_compiled_yaml_cache) > YAML_CACHE_SIZE:
+        _compiled_yaml_cache.popitem(last=False)
+
+
+def _evict_yaml_cache(keep: pathlib.Path) -> None:
+    """Deletes the least recently used netlists until the cache on disk fits.
+
+    The cache fits when it is at most CONF.yaml_cache_max_size bytes.
+    """
+    entries = []
+    for filepath in PATH.yaml_cache.glob("*.json"):
+        try:
+            stat = filepath.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, filepath))
+    entries.sort(key=lambda entry: entry[0])
+
+    size = sum(entry[1] for entry in entries)
+    for _, entry_size, filepath in entries:
+        if size <= CONF.yaml_cache_max_size:
+            break
+        if filepath != keep:
+            filepath.unlink(missing_ok=True)
+            size -= entry_size
+
+
+def clear_yaml_cache() -> None:
+    """Clears the in-memory and on-disk compiled YAML netlist cache."""
+    _compiled_yaml_cache.clear()
+    for filepath in PATH.yaml_cache.glob("*.json"):
+        filepath.unlink(missing_ok=True)
+
+
 @gf.cell(rec_dicts=True, set_name=False)
 def _from_yaml(
     conf,
@@ -786,8 +953,11 @@ def _from_yaml(
         component = instance_conf["component"]
         settings = instance_conf.get("settings", {})
         settings = clean_value_json(settings)
-        component_spec = {"component": component, "settings": settings}
-        component = component_getter(component_spec)
+        if mode == "layout" and isinstance(component, str) and component in pdk.cells:
+            component = pdk.cells[component](**settings)
+        else:
+            component_spec = {"component": component, "settings": settings}
+            component = component_getter(component_spec)
         ref = c.add_ref(component, name=instance_name)
         instances[instance_name] = ref
 
@@ -806,17 +976,14 @@ def _from_yaml(
                 "with both connection and placement. Please use one or the other.",
             )
 
-    all_remaining_insts = list(
-        set(placements_conf.keys()).union(set(connections_by_transformed_inst.keys()))
-    )
-
-    while all_remaining_insts:
+    for instance_name in get_placement_order(
+        placements_conf, connections_by_transformed_inst
+    ):
         place(
             placements_conf=placements_conf,
             connections_by_transformed_inst=connections_by_transformed_inst,
             instances=instances,
-            encountered_insts=[],
-            all_remaining_insts=all_remaining_insts,
+            instance_name=instance_name,
         )
 
     for instance_name in instances_dict:
@@ -1463,6 +1630,28 @@ placements:
 """
 
 
+def _demo_placement_scaling(n: int = 10_000) -> None:
+    """Times placement of a YAML netlist with a chain of n connected instances."""
+    import time
+
+    instances = {f"s{i}": {"component": "straight"} for i in range(n)}
+    connections = {f"s{i},o1": f"s{i - 1},o2" for i in range(1, n)}
+    placements = {"s0": {"x": 0, "y": 0}}
+    conf = dict(
+        name=f"placement_scaling_{n}",
+        instances=instances,
+        connections=connections,
+        placements=placements,
+    )
+
+    t0 = time.perf_counter()
+    get_placement_order(dict(placements), transform_connections_dict(connections))
+    t1 = time.perf_counter()
+    from_yaml(conf)
+    t2 = time.perf_counter()
+    print(f"{n} instances: order {t1 - t0:.3f}s, from_yaml {t2 - t1:.3f}s")
+
+
 if __name__ == "__main__":
     # c = from_yaml(sample_doe_function)
     # c = from_yaml(sample_mmis)
@@ -39,6 +39,31 @@ def import_gds(
     return c
 
 
+def component_from_meta_info(
+    kdb_cell: kf.kdb.Cell, kcl: KCLayout | None = None
+) -> Component:
+    """Returns a locked Component for a cell read with its meta info.
+
+    Reads the ports, settings and info written by Component.write.
+    kfactory reads the ports sorted by their index as a string (port 10 before
+    port 2), so they are put back in the order they were written.
+
+    Args:
+        kdb_cell: KLayout cell read into kcl.
+        kcl: layout of the cell. Defaults to the gdsfactory layout.
+    """
+    kcl = kcl or kf.kcl
+    component = Component(name=kdb_cell.name, kcl=kcl, kdb_cell=kdb_cell)
+    ports = list(component.ports)
+    indexes = sorted(range(len(ports)), key=str)
+    ports_written = dict(zip(indexes, ports))
+    component.ports = kf.Ports(
+        kcl=kcl, ports=[ports_written[i] for i in range(len(ports))]
+    )
+    component._locked = True
+    return component
+
+
 def import_gds_with_conflicts(
     gdspath: str | Path,
     cellname: str | None = None,
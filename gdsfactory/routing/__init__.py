@@ -14,6 +14,7 @@ from gdsfactory.routing.route_bundle import (
     route_bundle,
     route_bundle_electrical,
     route_bundle_electrical_multilayer,
+    route_bundles,
 )
 from gdsfactory.routing.route_bundle_sbend import route_bundle_sbend
 from gdsfactory.routing.route_ports_to_side import route_ports_to_side
@@ -42,6 +43,7 @@ __all__ = [
     "route_bundle_all_angle",
     "route_bundle_electrical",
     "route_bundle_electrical_multilayer",
+    "route_bundles",
     "route_single",
     "route_single_electrical",
     "route_bundle_sbend",
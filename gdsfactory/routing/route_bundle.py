@@ -12,7 +12,10 @@ route_bundle calls different function depending on the port orientation.
 
 from __future__ import annotations
 
+import inspect
+from collections.abc import Callable
 from functools import partial
+from typing import Any
 
 import kfactory as kf
 from kfactory.routing.optical import OpticalManhattanRoute
@@ -25,6 +28,7 @@ from gdsfactory.components.wire import wire_corner
 from gdsfactory.port import Port
 from gdsfactory.routing.sort_ports import get_port_x, get_port_y
 from gdsfactory.routing.sort_ports import sort_ports as sort_ports_function
+from gdsfactory.routing.utils import get_straight_dbu
 from gdsfactory.typings import (
     Component,
     ComponentSpec,
@@ -33,6 +37,14 @@ from gdsfactory.typings import (
     MultiCrossSectionAngleSpec,
 )
 
+# kfactory 0.13.3 renamed allow_different_port_widths to allow_width_mismatch
+_allow_width_mismatch = (
+    "allow_width_mismatch"
+    if "allow_width_mismatch"
+    in inspect.signature(kf.routing.optical.route_bundle).parameters
+    else "allow_different_port_widths"
+)
+
 
 def get_min_spacing(
     ports1: list[Port],
@@ -176,6 +188,153 @@ def route_bundle(
 
     """
 
+    factories = _get_route_bundle_factories(
+        component=component,
+        straight=straight,
+        bend=bend,
+        cross_section=cross_section,
+        taper=taper,
+        **kwargs,
+    )
+    ports1, ports2 = _get_bundle_ports(
+        ports1,
+        ports2,
+        sort_ports=sort_ports,
+        enforce_port_ordering=enforce_port_ordering,
+    )
+    return _route_bundle(
+        component,
+        ports1,
+        ports2,
+        separation=separation,
+        start_straight_length=start_straight_length,
+        end_straight_length=end_straight_length,
+        min_straight_taper=min_straight_taper,
+        port_type=port_type,
+        collision_check_layers=collision_check_layers,
+        on_collision=on_collision,
+        bboxes=bboxes,
+        allow_different_port_widths=allow_different_port_widths,
+        **factories,
+    )
+
+
+def route_bundles(
+    component: Component,
+    bundles: list[tuple[list[Port], list[Port]]],
+    separation: float = 3.0,
+    straight: ComponentSpec = straight_function,
+    bend: ComponentSpec = bend_euler,
+    sort_ports: bool = False,
+    cross_section: CrossSectionSpec | MultiCrossSectionAngleSpec = "xs_sc",
+    start_straight_length: float = 0,
+    end_straight_length: float = 0,
+    enforce_port_ordering: bool = True,
+    min_straight_taper: float = 100,
+    taper: ComponentSpec | None = None,
+    port_type: str = "optical",
+    collision_check_layers: LayerSpecs | None = None,
+    on_collision: str | None = "show_error",
+    bboxes: list[kf.kdb.Box] | None = None,
+    allow_different_port_widths: bool = False,
+    **kwargs,
+) -> list[list[OpticalManhattanRoute]]:
+    """Places many independent bundles of routes with the same settings.
+
+    Equivalent to calling route_bundle for each (ports1, ports2) group, but the
+    cross_section, bend, taper and straight factory are only resolved once.
+
+    Args:
+        component: component to add the routes to.
+        bundles: list of (ports1, ports2) groups to connect.
+        separation: bundle separation (center to center).
+        straight: function for the straight.
+        bend: function for the bend. Defaults to euler.
+        sort_ports: sort port coordinates.
+        cross_section: CrossSection or function that returns a cross_section.
+        start_straight_length: straight length at the beginning of the route.
+        end_straight_length: end length at the beginning of the route.
+        enforce_port_ordering: If True, enforce that the ports are connected in the specific order.
+        min_straight_taper: minimum straight length to place tapers.
+        taper: optional taper.
+        port_type: port type to place the bends with.
+        collision_check_layers: list of layers to check for collisions.
+        on_collision: action to take on collision. Defaults to show_error.
+        bboxes: list of bounding boxes to avoid collisions, shared by all bundles.
+            The bbox of each straight and bend of a routed bundle is added for
+            the bundles after it, so later bundles can start between its routes.
+        allow_different_port_widths: allow different port widths.
+        kwargs: cross_section settings.
+
+    Returns:
+        list of routes for each bundle, in the same order as bundles.
+
+    .. code::
+
+        import gdsfactory as gf
+
+        c = gf.Component()
+        mmis = [c << gf.components.mmi2x2() for _ in range(4)]
+        for i, mmi in enumerate(mmis):
+            mmi.d.move((200 * (i // 2), 40 * (i % 2)))
+        routes = gf.routing.route_bundles(
+            c,
+            [
+                ([mmis[0].ports["o3"]], [mmis[2].ports["o1"]]),
+                ([mmis[1].ports["o3"]], [mmis[3].ports["o1"]]),
+            ],
+        )
+
+    """
+    factories = _get_route_bundle_factories(
+        component=component,
+        straight=straight,
+        bend=bend,
+        cross_section=cross_section,
+        taper=taper,
+        **kwargs,
+    )
+    bboxes = list(bboxes or [])
+    routes = []
+    for ports1, ports2 in bundles:
+        ports1, ports2 = _get_bundle_ports(
+            ports1,
+            ports2,
+            sort_ports=sort_ports,
+            enforce_port_ordering=enforce_port_ordering,
+        )
+        routes.append(
+            _route_bundle(
+                component,
+                ports1,
+                ports2,
+                separation=separation,
+                start_straight_length=start_straight_length,
+                end_straight_length=end_straight_length,
+                min_straight_taper=min_straight_taper,
+                port_type=port_type,
+                collision_check_layers=collision_check_layers,
+                on_collision=on_collision,
+                bboxes=bboxes,
+                allow_different_port_widths=allow_different_port_widths,
+                **factories,
+            )
+        )
+        bboxes.extend(
+            instance.bbox() for route in routes[-1] for instance in route.instances
+        )
+    return routes
+
+
+def _get_route_bundle_factories(
+    component: Component,
+    straight: ComponentSpec,
+    bend: ComponentSpec,
+    cross_section: CrossSectionSpec | MultiCrossSectionAngleSpec,
+    taper: ComponentSpec | None,
+    **kwargs,
+) -> dict[str, Any]:
+    """Returns the straight factory, bend, taper and route width in dbu."""
     if isinstance(cross_section, list | tuple):
         xs_list = []
         for element in cross_section:
@@ -189,6 +348,37 @@ def route_bundle(
         cross_section = gf.get_cross_section(cross_section)
         cross_section = cross_section.copy(**kwargs)
 
+    xs = gf.get_cross_section(cross_section, **kwargs)
+    width = xs.width
+    width_dbu = round(width / component.kcl.dbu)
+    taper_cell = gf.get_cell(taper) if taper else None
+    bend90 = (
+        bend
+        if isinstance(bend, Component)
+        else gf.get_component(bend, cross_section=xs)
+    )
+
+    straight_dbu = get_straight_dbu(
+        component=component,
+        straight=straight,
+        cross_section=cross_section,
+        width_dbu=width_dbu,
+    )
+    return dict(
+        straight_factory=straight_dbu,
+        bend90_cell=bend90,
+        taper_cell=taper_cell,
+        route_width=width_dbu,
+    )
+
+
+def _get_bundle_ports(
+    ports1: list[Port],
+    ports2: list[Port],
+    sort_ports: bool,
+    enforce_port_ordering: bool,
+) -> tuple[list[Port], list[Port]]:
+    """Returns ports1 and ports2 as lists of the same length."""
     # convert single port to list
     if isinstance(ports1, Port):
         ports1 = [ports1]
@@ -213,27 +403,27 @@ def route_bundle(
         ports1, ports2 = sort_ports_function(
             ports1, ports2, enforce_port_ordering=enforce_port_ordering
         )
+    return ports1, ports2
 
-    xs = gf.get_cross_section(cross_section, **kwargs)
-    width = xs.width
-    width_dbu = round(width / component.kcl.dbu)
-    taper_cell = gf.get_cell(taper) if taper else None
-    bend90 = (
-        bend
-        if isinstance(bend, Component)
-        else gf.get_component(bend, cross_section=xs)
-    )
-
-    def straight_dbu(
-        length: int, width: int = width_dbu, cross_section=cross_section, **kwargs
-    ) -> Component:
-        return straight(
-            length=length * component.kcl.dbu,
-            width=width * component.kcl.dbu,
-            cross_section=cross_section,
-            **kwargs,
-        )
 
+def _route_bundle(
+    component: Component,
+    ports1: list[Port],
+    ports2: list[Port],
+    separation: float,
+    start_straight_length: float,
+    end_straight_length: float,
+    min_straight_taper: float,
+    port_type: str,
+    collision_check_layers: LayerSpecs | None,
+    on_collision: str | None,
+    bboxes: list[kf.kdb.Box] | None,
+    allow_different_port_widths: bool,
+    straight_factory: Callable[..., Component],
+    bend90_cell: Component,
+    taper_cell: Component | None,
+    route_width: int,
+) -> list[OpticalManhattanRoute]:
     dbu = component.kcl.dbu
     end_straight = round(end_straight_length / dbu)
     start_straight = round(start_straight_length / dbu)
@@ -248,8 +438,8 @@ def route_bundle(
         ports1,
         ports2,
         round(separation / component.kcl.dbu),
-        straight_factory=straight_dbu,
-        bend90_cell=bend90,
+        straight_factory=straight_factory,
+        bend90_cell=bend90_cell,
         taper_cell=taper_cell,
         start_straights=start_straight,
         end_straights=end_straight,
@@ -257,12 +447,55 @@ def route_bundle(
         place_port_type=port_type,
         collision_check_layers=collision_check_layers,
         on_collision=on_collision,
-        allow_different_port_widths=allow_different_port_widths,
         bboxes=bboxes or [],
-        route_width=width_dbu,
+        route_width=route_width,
+        **{_allow_width_mismatch: allow_different_port_widths},
     )
 
 
+def _demo_route_bundles(n: int = 100) -> None:
+    """Compares route_bundles against a loop of route_bundle calls."""
+    import time
+
+    def _bundles() -> list[tuple[list[Port], list[Port]]]:
+        bundles = []
+        for i in range(n):
+            y = i * 50.0
+            ports1 = [
+                Port(
+                    f"in{i}_{j}",
+                    center=(0, y + j * 5.0),
+                    width=0.5,
+                    orientation=0,
+                    layer=(1, 0),
+                )
+                for j in range(4)
+            ]
+            ports2 = [
+                Port(
+                    f"out{i}_{j}",
+                    center=(200, y + j * 5.0 + 10),
+                    width=0.5,
+                    orientation=180,
+                    layer=(1, 0),
+                )
+                for j in range(4)
+            ]
+            bundles.append((ports1, ports2))
+        return bundles
+
+    c = gf.Component()
+    t0 = time.perf_counter()
+    for ports1, ports2 in _bundles():
+        route_bundle(c, ports1, ports2)
+    t1 = time.perf_counter()
+
+    c = gf.Component()
+    route_bundles(c, _bundles())
+    t2 = time.perf_counter()
+    print(f"route_bundle loop: {t1 - t0:.3f}s, route_bundles: {t2 - t1:.3f}s")
+
+
 route_bundle_electrical = partial(
     route_bundle,
     bend=wire_corner,
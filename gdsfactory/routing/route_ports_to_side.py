@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 import kfactory as kf
@@ -161,10 +162,13 @@ def route_ports_to_x(
     4. north ports
 
     """
-    north_ports = [p for p in list_ports if p.orientation == 90]
-    south_ports = [p for p in list_ports if p.orientation == 270]
-    east_ports = [p for p in list_ports if p.orientation == 0]
-    west_ports = [p for p in list_ports if p.orientation == 180]
+    ports_by_orientation: dict[float, list[Port]] = defaultdict(list)
+    for p in list_ports:
+        ports_by_orientation[p.orientation].append(p)
+    north_ports = ports_by_orientation[90]
+    south_ports = ports_by_orientation[270]
+    east_ports = ports_by_orientation[0]
+    west_ports = ports_by_orientation[180]
 
     y0_bottom = round(y0_bottom / component.kcl.dbu) if y0_bottom else None
     y0_top = round(y0_top / component.kcl.dbu) if y0_top else None
@@ -39,6 +39,7 @@ from gdsfactory.components.bend_euler import bend_euler
 from gdsfactory.components.straight import straight as straight_function
 from gdsfactory.components.taper import taper as taper_function
 from gdsfactory.port import Port
+from gdsfactory.routing.utils import get_straight_dbu
 from gdsfactory.typings import (
     ComponentFactory,
     ComponentSpec,
@@ -79,6 +80,7 @@ def route_single(
         end_straight_length: length of end straight.
         cross_section: spec.
         waypoints: list of points to pass through.
+        port_type: port type to route.
         kwargs: cross_section settings.
 
 
@@ -117,16 +119,12 @@ def route_single(
         else gf.get_component(bend, cross_section=xs)
     )
 
-    def straight_dbu(
-        length: int, width: int = width_dbu, cross_section=cross_section, **kwargs
-    ) -> Component:
-        return gf.get_component(
-            straight,
-            length=length * component.kcl.dbu,
-            width=width * component.kcl.dbu,
-            cross_section=cross_section,
-            **kwargs,
-        )
+    straight_dbu = get_straight_dbu(
+        component=component,
+        straight=straight,
+        cross_section=cross_section,
+        width_dbu=width_dbu,
+    )
 
     dbu = component.kcl.dbu
     end_straight = round(end_straight_length / dbu)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 from numpy import float64
 
+from gdsfactory.component import Component
 from gdsfactory.port import Port
+from gdsfactory.typings import ComponentSpec
 
 
 class RouteWarning(UserWarning):
@@ -67,6 +72,57 @@ def get_list_ports_angle(list_ports: list[Port]) -> float64 | int:
     return list_ports[0].orientation
 
 
+def _get_cross_section_key(cross_section: Any) -> Any:
+    """Returns a hashable key for a cross_section spec."""
+    if isinstance(cross_section, list | tuple):
+        return tuple(_get_cross_section_key(xs) for xs in cross_section)
+    return getattr(cross_section, "name", cross_section)
+
+
+def get_straight_dbu(
+    component: Component,
+    straight: ComponentSpec,
+    cross_section: Any,
+    width_dbu: float,
+) -> Callable[..., Component]:
+    """Returns a straight factory in dbu that reuses straights within a route.
+
+    Straights are cached by length, width and cross_section, so each unique
+    segment is resolved once per routing call.
+
+    Args:
+        component: component the route is placed into.
+        straight: straight spec.
+        cross_section: default cross_section for the straights.
+        width_dbu: default straight width in dbu.
+    """
+    import gdsfactory as gf
+
+    dbu = component.kcl.dbu
+    straights: dict[Any, Component] = {}
+
+    def straight_dbu(
+        length: int, width: float = width_dbu, cross_section=cross_section, **kwargs
+    ) -> Component:
+        key = (
+            length,
+            width,
+            _get_cross_section_key(cross_section),
+            tuple(sorted(kwargs.items())),
+        )
+        if key not in straights:
+            straights[key] = gf.get_component(
+                straight,
+                length=length * dbu,
+                width=width * dbu,
+                cross_section=cross_section,
+                **kwargs,
+            )
+        return straights[key]
+
+    return straight_dbu
+
+
 if __name__ == "__main__":
     import gdsfactory as gf
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import numpy as np
 
 import gdsfactory as gf
-from gdsfactory import Port
 from gdsfactory.component import Component
 from gdsfactory.typings import CrossSectionSpec
 
@@ -28,7 +27,6 @@ def big_device(
         cross_section: spec.
     """
     component = gf.Component()
-    p0 = np.array((0, 0))
 
     w, h = size
     dx = w / 2
@@ -38,46 +36,19 @@ def big_device(
     points = [[dx, dy], [dx, -dy], [-dx, -dy], [-dx, dy]]
     component.add_polygon(points, layer=layer)
 
-    for i in range(N):
-        port = Port(
-            name=f"W{i}",
-            center=p0 + (-dx, (i - N / 2) * spacing),
-            orientation=180,
-            layer=layer,
-            width=wg_width,
-        )
-        component.add_port(port=port)
-
-    for i in range(N):
-        port = Port(
-            name=f"E{i}",
-            center=p0 + (dx, (i - N / 2) * spacing),
-            orientation=0,
-            layer=layer,
-            width=wg_width,
-        )
-        component.add_port(port=port)
-
-    for i in range(N):
-        port = Port(
-            name=f"N{i}",
-            center=p0 + ((i - N / 2) * spacing, dy),
-            orientation=90,
-            layer=layer,
-            width=wg_width,
-        )
-        component.add_port(port=port)
-
-    for i in range(N):
-        port = Port(
-            name=f"S{i}",
-            center=p0 + ((i - N / 2) * spacing, -dy),
-            orientation=-90,
-            layer=layer,
-            width=wg_width,
-        )
-        component.add_port(port=port)
-
+    offsets = (np.arange(N) - N / 2) * spacing
+    ones = np.ones(N)
+    centers = np.concatenate(
+        [
+            np.stack([-dx * ones, offsets], axis=1),
+            np.stack([dx * ones, offsets], axis=1),
+            np.stack([offsets, dy * ones], axis=1),
+            np.stack([offsets, -dy * ones], axis=1),
+        ]
+    )
+    names = [f"{side}{i}" for side in "WENS" for i in range(N)]
+    orientations = np.repeat([180, 0, 90, -90], N)
+    component.create_ports(names, centers, orientations, wg_width, layer=layer)
     component.auto_rename_ports()
     return component
 
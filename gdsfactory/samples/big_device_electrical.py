@@ -3,7 +3,6 @@ from __future__ import annotations
 import numpy as np
 
 import gdsfactory as gf
-from gdsfactory import Port
 from gdsfactory.component import Component
 from gdsfactory.typings import CrossSectionSpec
 
@@ -26,7 +25,6 @@ def big_device(
         cross_section: spec.
     """
     component = gf.Component()
-    p0 = np.array((0, 0))
 
     w, h = size
     dx = w / 2
@@ -36,51 +34,31 @@ def big_device(
     xs = gf.get_cross_section(cross_section)
     layer = xs.layer
     width = xs.width
-    port_settings = dict(
-        port_type=port_type, cross_section=xs, layer=layer, width=width
-    )
 
     points = [[dx, dy], [dx, -dy], [-dx, -dy], [-dx, dy]]
     component.add_polygon(points, layer=layer)
-    ports = []
-
-    for i in range(N):
-        port = Port(
-            name=f"W{i}",
-            center=p0 + (-dx, (i - N / 2) * spacing),
-            orientation=180,
-            **port_settings,
-        )
-        ports.append(port)
-
-    for i in range(N):
-        port = Port(
-            name=f"E{i}",
-            center=p0 + (dx, (i - N / 2) * spacing),
-            orientation=0,
-            **port_settings,
-        )
-        ports.append(port)
-
-    for i in range(N):
-        port = Port(
-            name=f"N{i}",
-            center=p0 + ((i - N / 2) * spacing, dy),
-            orientation=90,
-            **port_settings,
-        )
-        ports.append(port)
 
-    for i in range(N):
-        port = Port(
-            name=f"S{i}",
-            center=p0 + ((i - N / 2) * spacing, -dy),
-            orientation=-90,
-            **port_settings,
-        )
-        ports.append(port)
-
-    component.add_ports(ports)
+    offsets = (np.arange(N) - N / 2) * spacing
+    ones = np.ones(N)
+    centers = np.concatenate(
+        [
+            np.stack([-dx * ones, offsets], axis=1),
+            np.stack([dx * ones, offsets], axis=1),
+            np.stack([offsets, dy * ones], axis=1),
+            np.stack([offsets, -dy * ones], axis=1),
+        ]
+    )
+    names = [f"{side}{i}" for side in "WENS" for i in range(N)]
+    orientations = np.repeat([180, 0, 90, -90], N)
+    component.create_ports(
+        names,
+        centers,
+        orientations,
+        width,
+        layer=layer,
+        port_type=port_type,
+        cross_section=xs,
+    )
     component.auto_rename_ports()
     return component
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import weakref
 from collections import defaultdict
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Literal
 
 import kfactory as kf
@@ -13,6 +15,13 @@ from gdsfactory.component import Component, boolean_operations
 if TYPE_CHECKING:
     from gdsfactory.technology import LayerViews
 
+# id(LayerStack) -> (cache key, index)
+_layer_stack_indexes: dict[int, tuple[tuple, dict[str, dict]]] = {}
+_get_level_fields = attrgetter(
+    "layer", "thickness", "zmin", "material", "sidewall_angle"
+)
+_get_level_info = attrgetter("info")
+
 
 class LayerLevel(BaseModel):
     """Level for 3D LayerStack.
@@ -92,7 +101,7 @@ class LayerStack(BaseModel):
 
     def model_copy(self) -> LayerStack:
         """Returns a copy of the LayerStack."""
-        return LayerStack.model_validate_json(self.model_dump_json())
+        return LayerStack.model_validate(self.model_dump())
 
     def __init__(self, **data: Any) -> None:
         """Add LayerLevels automatically for subclassed LayerStacks."""
@@ -103,6 +112,51 @@ class LayerStack(BaseModel):
             if isinstance(val, LayerLevel):
                 self.layers[field] = val
 
+    def _get_index_key(self) -> tuple:
+        """Returns the level names and fields the lookup tables are built from."""
+        levels = self.layers.values()
+        return (
+            tuple(self.layers),
+            tuple(map(_get_level_fields, levels)),
+            tuple(map(id, map(_get_level_info, levels))),
+        )
+
+    def _get_index(self) -> dict[str, dict]:
+        """Returns layer tuple lookup tables, rebuilt when the levels change."""
+        key = self._get_index_key()
+        cached = _layer_stack_indexes.get(id(self))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        levels = self.layers.values()
+        layer_to_thickness = {}
+        for level in levels:
+            if level.layer and level.thickness:
+                layer_to_thickness[level.layer] = level.thickness
+            elif hasattr(level, "operator"):
+                layer_to_thickness[level.layer] = level.thickness
+
+        layer_to_levels = defaultdict(list)
+        for level_name, level in self.layers.items():
+            layer_to_levels[level.layer].append(level_name)
+
+        index = {
+            "thickness": layer_to_thickness,
+            "zmin": {level.layer: level.zmin for level in levels if level.thickness},
+            "material": {
+                level.layer: level.material for level in levels if level.thickness
+            },
+            "sidewall_angle": {
+                level.layer: level.sidewall_angle for level in levels if level.thickness
+            },
+            "info": {level.layer: level.info for level in levels},
+            "layername": dict(layer_to_levels),
+        }
+        if cached is None:
+            weakref.finalize(self, _layer_stack_indexes.pop, id(self), None)
+        _layer_stack_indexes[id(self)] = (key, index)
+        return index
+
     def pprint(self) -> None:
         console = Console()
         table = Table(show_header=True, header_style="bold")
@@ -120,17 +174,7 @@ class LayerStack(BaseModel):
 
     def get_layer_to_thickness(self) -> dict[tuple[int, int], float]:
         """Returns layer tuple to thickness (um)."""
-        layer_to_thickness = {}
-
-        for level in self.layers.values():
-            layer = level.layer
-
-            if layer and level.thickness:
-                layer_to_thickness[layer] = level.thickness
-            elif hasattr(level, "operator"):
-                layer_to_thickness[level.layer] = level.thickness
-
-        return layer_to_thickness
+        return dict(self._get_index()["thickness"])
 
     def get_component_with_derived_layers(self, component, **kwargs):
         """Returns component with derived layers."""
@@ -141,38 +185,33 @@ class LayerStack(BaseModel):
 
     def get_layer_to_zmin(self) -> dict[tuple[int, int], float]:
         """Returns layer tuple to z min position (um)."""
-        return {
-            level.layer: level.zmin for level in self.layers.values() if level.thickness
-        }
+        return dict(self._get_index()["zmin"])
 
     def get_layer_to_material(self) -> dict[tuple[int, int], str]:
         """Returns layer tuple to material name."""
-        return {
-            level.layer: level.material
-            for level in self.layers.values()
-            if level.thickness
-        }
+        return dict(self._get_index()["material"])
 
     def get_layer_to_sidewall_angle(self) -> dict[tuple[int, int], str]:
-        """Returns layer tuple to material name."""
-        return {
-            level.layer: level.sidewall_angle
-            for level in self.layers.values()
-            if level.thickness
-        }
+        """Returns layer tuple to sidewall angle."""
+        return dict(self._get_index()["sidewall_angle"])
 
     def get_layer_to_info(self) -> dict[tuple[int, int], dict]:
         """Returns layer tuple to info dict."""
-        return {level.layer: level.info for level in self.layers.values()}
+        return dict(self._get_index()["info"])
 
     def get_layer_to_layername(self) -> dict[tuple[int, int], str]:
         """Returns layer tuple to layername."""
+        layer_to_names = self._get_index()["layername"]
+        return defaultdict(list, {k: list(v) for k, v in layer_to_names.items()})
 
-        d = defaultdict(list)
-        for level_name, level in self.layers.items():
-            d[level.layer].append(level_name)
+    def get_layer_levels(self, layer: tuple[int, int]) -> list[LayerLevel]:
+        """Returns the LayerLevels drawn on a layer tuple.
 
-        return d
+        Args:
+            layer: (GDSII Layer number, GDSII datatype).
+        """
+        layer_to_names = self._get_index()["layername"]
+        return [self.layers[name] for name in layer_to_names.get(layer, ())]
 
     def to_dict(self) -> dict[str, dict[str, Any]]:
         return {level_name: dict(level) for level_name, level in self.layers.items()}
@@ -377,12 +416,27 @@ class LayerStack(BaseModel):
         return self
 
 
-def get_component_with_derived_layers(component, layer_stack: LayerStack) -> Component:
-    """Returns a component with derived layers.
+def get_derived_layer_regions(
+    component: Component,
+    layer_stack: LayerStack,
+    dss: kf.kdb.DeepShapeStore | None = None,
+) -> dict[tuple[int, int], list[kf.kdb.Region]]:
+    """Returns the derived layer regions of a component, per layer tuple.
+
+    Regions are built straight from the layout. With a DeepShapeStore they are
+    hierarchical, so booleans between etch and grow layers run once per cell
+    instead of once per instance.
+
+    - grow layers not etched by any etch layer are returned as they are.
+    - grow layers with an etch layer `into` them are returned as they are, and
+      for each etch layer with a derived_layer the grow & etch region is
+      added on the etch layer.
 
     Args:
-        component: Component to get derived layers for.
-        layer_stack: Layer stack to get derived layers from.
+        component: to get derived layers for.
+        layer_stack: defines grow and etch layers.
+        dss: for deep (hierarchical) regions, needs to outlive them.
+            Flat regions if None.
     """
     from gdsfactory.pdk import get_layer
 
@@ -407,55 +461,84 @@ def get_component_with_derived_layers(component, layer_stack: LayerStack) -> Com
             if layer_name_etched in unetched_layers:
                 unetched_layers.remove(layer_name_etched)
 
-    polygons_per_layer = component.get_polygons()
-    component_layers = polygons_per_layer.keys()
+    layer_to_region: dict[tuple[int, int], kf.kdb.Region] = {}
+
+    def get_region(layer: tuple[int, int]) -> kf.kdb.Region:
+        if layer not in layer_to_region:
+            iterator = component.begin_shapes_rec(get_layer(layer))
+            layer_to_region[layer] = (
+                kf.kdb.Region(iterator, dss) if dss else kf.kdb.Region(iterator)
+            )
+        return layer_to_region[layer]
+
+    regions = defaultdict(list)
 
     # Define pure grown layers
-    unetched_layer_numbers = [
-        layer_stack.layers[layer_name].layer
-        for layer_name in unetched_layers
-        if layer_stack.layers[layer_name].layer in component_layers
-    ]
-    component_derived = component.extract(unetched_layer_numbers)
+    for layer_name in unetched_layers:
+        layer = layer_stack.layers[layer_name].layer
+        if not get_region(layer).is_empty():
+            regions[layer].append(get_region(layer))
 
     # Define unetched layers
-    for unetched_layer_name, unetched_layers in unetched_layers_dict.items():
+    for unetched_layer_name, etching_layer_names in unetched_layers_dict.items():
         layer = layer_stack.layers[unetched_layer_name].layer
-        layer_index = get_layer(layer)
-        polygons = polygons_per_layer[layer]
-        for polygon in polygons:
-            component_derived.shapes(layer_index).insert(polygon)
-
-        # Add all the etching layers (OR)
-        for etching_layers in unetched_layers:
-            layer = layer_stack.layers[etching_layers].layer
-            if layer in polygons_per_layer:
-                layer_index = get_layer(layer)
-                B_polys = polygons_per_layer[layer]
-                derived_layer = layer_stack.layers[etching_layers].derived_layer
-                if derived_layer:
-                    r1 = polygons
-                    r2 = B_polys
-                    operation = "and"
-
-                    r1 = kf.kdb.Region(r1)
-                    r2 = kf.kdb.Region(r2)
-                    f = boolean_operations[operation]
-                    r = f(r1, r2)
-                    r = component_derived.shapes(layer_index).insert(r)
-
-        # Remove all etching layers
-        # layer = layer_stack.layers[unetched_layer_name].layer
-        # polygons = polygons_per_layer[layer]
-        # unetched_polys = boolean(
-        #     polygons,
-        #     polygons_to_remove,
-        #     operation="not",
-        #     layer=layer
-        # )
-        # component_derived.shapes(layer_index).insert(unetched_polys)
+        grown = get_region(layer)
+        regions[layer].append(grown)
+
+        for etching_layer_name in etching_layer_names:
+            level = layer_stack.layers[etching_layer_name]
+            etched = get_region(level.layer)
+            if level.derived_layer and not etched.is_empty():
+                regions[level.layer].append(boolean_operations["and"](grown, etched))
+
+    return dict(regions)
+
+
+# id(LayerStack) -> {(kcl id, cell index, cell name): (layer stack JSON, Component)}
+_derived_components: dict[int, dict[tuple, tuple[str, Component]]] = {}
+
+
+def get_component_with_derived_layers(component, layer_stack: LayerStack) -> Component:
+    """Returns a component with derived layers.
+
+    Results for locked components (the ones returned by cells) are cached per
+    (component, layer_stack) and shared by the exporters, so they are returned
+    locked. They are computed again after the layer_stack changes.
+
+    Args:
+        component: Component to get derived layers for.
+        layer_stack: Layer stack to get derived layers from.
+    """
+    from gdsfactory.pdk import get_layer
+
+    cache = None
+    if component._locked:
+        cache = _derived_components.get(id(layer_stack))
+        if cache is None:
+            cache = _derived_components[id(layer_stack)] = {}
+            weakref.finalize(
+                layer_stack, _derived_components.pop, id(layer_stack), None
+            )
+        key = (id(component.kcl), component.cell_index(), component.name)
+        content = layer_stack.model_dump_json()
+        cached = cache.get(key)
+        if cached is not None and cached[0] == content and not cached[1].destroyed():
+            return cached[1]
+
+    component_derived = Component()
+    # deep mode has a fixed overhead that only pays off with hierarchy
+    dss = kf.kdb.DeepShapeStore() if component.hierarchy_levels() else None
+    layer_to_regions = get_derived_layer_regions(component, layer_stack, dss)
+    for layer, regions in layer_to_regions.items():
+        shapes = component_derived.shapes(get_layer(layer))
+        for region in regions:
+            shapes.insert(region)
 
     component_derived.add_ports(component.ports)
+
+    if cache is not None:
+        component_derived._locked = True
+        cache[key] = (content, component_derived)
     return component_derived
 
 
@@ -6,12 +6,15 @@ You can maintain LayerViews in YAML (.yaml) or Klayout XML file (.lyp)
 
 from __future__ import annotations
 
+import hashlib
 import os
 import pathlib
 import re
 import typing
 import warnings
+import weakref
 import xml.etree.ElementTree as ET
+from operator import attrgetter
 
 import numpy as np
 import yaml
@@ -20,7 +23,7 @@ from pydantic import BaseModel, Field, field_validator
 from pydantic.color import ColorType
 from pydantic_extra_types.color import Color
 
-from gdsfactory.config import logger
+from gdsfactory.config import GDSDIR_TEMP, logger
 from gdsfactory.name import clean_name
 from gdsfactory.technology.color_utils import ensure_six_digit_hex_color
 from gdsfactory.technology.xml_utils import make_pretty_xml
@@ -39,6 +42,11 @@ PathLike = pathlib.Path | str
 
 Layer = tuple[int, int]
 
+# id(LayerViews) -> (cache key, index)
+_layer_views_indexes: dict[int, tuple[tuple, dict[str, dict]]] = {}
+_get_layer = attrgetter("layer")
+
+
 _klayout_line_styles = {
     "solid": "",
     "dotted": "*.",
@@ -861,12 +869,57 @@ class LayerViews(BaseModel):
         ):
             layer_view.line_style = self.custom_line_styles[line_style]
 
+    def _get_index_key(self) -> tuple:
+        """Returns the names, views, layers and group members of the lookup tables."""
+        views = self.layer_views.values()
+        groups = [view.group_members for view in views if view.group_members]
+        return (
+            tuple(self.layer_views),
+            tuple(map(id, views)),
+            tuple(map(_get_layer, views)),
+            tuple(
+                (
+                    tuple(group),
+                    tuple(map(id, group.values())),
+                    tuple(map(_get_layer, group.values())),
+                )
+                for group in groups
+            ),
+        )
+
+    def _get_index(self) -> dict[str, dict]:
+        """Returns lookup tables for the LayerViews, rebuilt when the views change.
+
+        Views are returned as they are, so edits of other view attributes
+        show without a rebuild.
+        """
+        key = self._get_index_key()
+        cached = _layer_views_indexes.get(id(self))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        views = self._get_layer_views()
+        index = {
+            "views": views,
+            "tuple_to_view": {view.layer: view for view in views.values()},
+            "name_to_tuple": {name: view.layer for name, view in views.items()},
+        }
+        if cached is None:
+            weakref.finalize(self, _layer_views_indexes.pop, id(self), None)
+        _layer_views_indexes[id(self)] = (key, index)
+        return index
+
     def get_layer_views(self, exclude_groups: bool = False) -> dict[str, LayerView]:
         """Return all LayerViews.
 
         Args:
             exclude_groups: Whether to exclude LayerViews that contain other LayerViews.
         """
+        if exclude_groups:
+            return self._get_layer_views(exclude_groups=True)
+        return dict(self._get_index()["views"])
+
+    def _get_layer_views(self, exclude_groups: bool = False) -> dict[str, LayerView]:
         layers = {}
         for name, view in self.layer_views.items():
             if view.group_members and not exclude_groups:
@@ -912,7 +965,7 @@ class LayerViews(BaseModel):
 
         """
         try:
-            return self.get_layer_views()[val]
+            return self._get_index()["views"][val]
         except Exception as error:
             raise ValueError(
                 f"LayerView {val!r} not in LayerViews {list(self.layer_views.keys())}"
@@ -927,18 +980,27 @@ class LayerViews(BaseModel):
         Returns:
             LayerView.
         """
-        tuple_to_name = {v.layer: k for k, v in self.get_layer_views().items()}
-        if layer_tuple not in tuple_to_name:
+        tuple_to_view = self._get_index()["tuple_to_view"]
+        if layer_tuple not in tuple_to_view:
             raise ValueError(
-                f"LayerView {layer_tuple} not in {list(tuple_to_name.keys())}"
+                f"LayerView {layer_tuple} not in {list(tuple_to_view.keys())}"
             )
+        return tuple_to_view[layer_tuple]
 
-        name = tuple_to_name[layer_tuple]
-        return self.get_layer_views()[name]
+    def get_layer_tuple(self, name: str) -> Layer:
+        """Returns layer tuple from LayerView name.
+
+        Args:
+            name: LayerView name.
+        """
+        name_to_tuple = self._get_index()["name_to_tuple"]
+        if name not in name_to_tuple:
+            raise ValueError(f"LayerView {name!r} not in {list(name_to_tuple.keys())}")
+        return name_to_tuple[name]
 
     def get_layer_tuples(self) -> set[Layer]:
         """Returns a tuple for each layer."""
-        return {layer.layer for layer in self.get_layer_views().values()}
+        return set(self._get_index()["tuple_to_view"])
 
     def clear(self) -> None:
         """Deletes all layers in the LayerViews."""
@@ -1023,6 +1085,20 @@ class LayerViews(BaseModel):
         filepath.write_bytes(make_pretty_xml(root))
         return filepath
 
+    def _get_lyp(self) -> tuple[pathlib.Path, str]:
+        """Returns a .lyp file with the layer properties and their content hash.
+
+        Files are named by the hash, so LayerViews with the same properties
+        share one file.
+        """
+        content_hash = hashlib.sha256(self.model_dump_json().encode()).hexdigest()
+        filepath = GDSDIR_TEMP / "lyp" / f"{content_hash}.lyp"
+        if not filepath.exists():
+            tmp = filepath.with_suffix(f".{os.getpid()}.tmp")
+            self.to_lyp(tmp)
+            os.replace(tmp, filepath)
+        return filepath, content_hash
+
     @staticmethod
     def from_lyp(
         filepath: str | pathlib.Path,
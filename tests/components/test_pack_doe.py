@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import kfactory as kf
+
+import gdsfactory as gf
+from gdsfactory.components.pack_doe import generate_doe
+
+
+def test_generate_doe_parallel() -> None:
+    settings = dict(length_mmi=(11, 12, 13))
+    components, settings_list = generate_doe("mmi1x2", settings, max_workers=2)
+    assert [c.settings.length_mmi for c in components] == [11, 12, 13]
+    assert [s["length_mmi"] for s in settings_list] == [11, 12, 13]
+
+    for component, length_mmi in zip(components, settings["length_mmi"]):
+        reference = gf.components.mmi1x2(length_mmi=length_mmi)
+        assert component.name == reference.name
+        assert component.bbox() == reference.bbox()
+        assert [p.name for p in component.ports] == [p.name for p in reference.ports]
+
+
+def test_generate_doe_parallel_port_order() -> None:
+    settings = dict(columns=(11, 12))
+    components, _ = generate_doe("pad_array", settings, max_workers=2)
+    for component, columns in zip(components, settings["columns"]):
+        reference = gf.components.pad_array(columns=columns)
+        assert [p.name for p in component.ports] == [p.name for p in reference.ports]
+        assert component.settings.columns == columns
+
+
+def test_generate_doe_parallel_cell_cache(tmp_path) -> None:
+    settings = dict(length_mmi=(21, 22))
+    components, _ = generate_doe("mmi1x2", settings, max_workers=2)
+    assert gf.components.mmi1x2(length_mmi=21) is components[0]
+
+    c = gf.Component()
+    c << components[1]
+    c << gf.components.mmi1x2(length_mmi=22)
+    c << gf.components.mmi1x2(length_mmi=23)
+    c.write(
+        filename=str(tmp_path / "doe.oas"),
+        save_options=kf.kcell.save_layout_options(format="OASIS"),
+    )
@@ -0,0 +1,31 @@
+import gdsfactory as gf
+from gdsfactory.export.to_gerber import GerberLayer, to_gerber
+
+layermap = {
+    (49, 0): GerberLayer(
+        name="F Cu", function=["Copper", "L1", "Top"], polarity="Positive"
+    ),
+    (1, 0): GerberLayer(
+        name="B_Cu", function=["Copper", "L2", "Bot"], polarity="Positive"
+    ),
+}
+
+
+def test_to_gerber(tmp_path) -> None:
+    c = gf.Component()
+    c << gf.components.pad()
+    c.add_polygon([(0, 0), (60, 0), (60, 10), (0, 10)], layer=(49, 0))
+    c.add_polygon([(200, 0), (210, 0), (210, 10), (200, 10)], layer=(49, 0))
+
+    (tmp_path / "merged").mkdir()
+    to_gerber(c, tmp_path / "merged", layermap, merge=True)
+    text = (tmp_path / "merged" / "F_Cu.gbr").read_text()
+    assert text.startswith("%TF.FileFunction,Copper,L1,Top*%")
+    assert text.endswith("M02*\n")
+    assert text.count("G36*") == text.count("G37*") == 2
+    assert text.count("%ADD10") == 1
+    assert "G36" not in (tmp_path / "merged" / "B_Cu.gbr").read_text()
+
+    (tmp_path / "flat").mkdir()
+    to_gerber(c, tmp_path / "flat", layermap, max_workers=2)
+    assert (tmp_path / "flat" / "F_Cu.gbr").read_text().count("G36*") == 3
@@ -0,0 +1,44 @@
+import numpy as np
+
+import gdsfactory as gf
+from gdsfactory.export import to_np, to_np_layers
+
+
+def test_to_np_tiles() -> None:
+    c = gf.components.ring_single()
+    img = to_np(c, nm_per_pixel=100, tile_size=10_000)
+    assert img.any()
+    assert np.array_equal(img, to_np(c, nm_per_pixel=100, tile_size=37))
+
+
+def test_to_np_rectangle() -> None:
+    c = gf.components.rectangle(size=(10, 5), layer=(1, 0))
+    img = to_np(c, nm_per_pixel=100, tile_size=37)
+    assert img.shape == (102, 52)
+    assert img.sum() == 100 * 50
+    assert img[1:-1, 1:-1].all()
+
+
+def test_to_np_layers(tmp_path) -> None:
+    c = gf.components.straight_heater_metal(length=30)
+    layers = ((1, 0), (49, 0), (47, 0))
+    masks = to_np_layers(c, nm_per_pixel=200, layers=layers, dtype=np.uint8)
+    assert masks.shape[0] == len(layers) and masks.dtype == np.uint8
+    assert masks[0].any() and masks[1].any()
+
+    filepath = tmp_path / "masks.npy"
+    mapped = to_np_layers(
+        c,
+        nm_per_pixel=200,
+        layers=layers,
+        dtype=np.uint8,
+        tile_size=64,
+        filepath=filepath,
+    )
+    assert np.array_equal(np.load(filepath), masks)
+    assert np.array_equal(mapped, masks)
+
+    parallel = to_np_layers(
+        c, nm_per_pixel=200, layers=layers, dtype=np.uint8, tile_size=64, max_workers=2
+    )
+    assert np.array_equal(parallel, masks)
@@ -1,5 +1,8 @@
 import pathlib
 
+import pytest
+import trimesh
+
 import gdsfactory as gf
 from gdsfactory.export.to_stl import to_stl
 
@@ -34,6 +37,27 @@ def test_export_exclude_layers() -> None:
     assert not pathlib.Path(filepath).exists()
 
 
+# Tests that each layer is a single closed mesh, cropped to the bbox.
+def test_export_merged_mesh(tmp_path) -> None:
+    component = gf.components.array(gf.c.pad(), columns=2, rows=1, spacing=(200, 0))
+    filepath = tmp_path / "test.stl"
+    to_stl(component, filepath, max_workers=2)
+    mesh = trimesh.load(tmp_path / "test_49_0.stl")
+    assert mesh.is_watertight
+    assert len(mesh.split()) == 2
+
+    to_stl(component, filepath, bbox=((-50, -50), (0, 50)))
+    mesh = trimesh.load(tmp_path / "test_49_0.stl")
+    assert len(mesh.split()) == 1
+    assert mesh.bounds[1][0] == 0
+
+
+# Tests that the ignored hull_invalid_polygons warns.
+def test_export_hull_invalid_polygons_deprecated(tmp_path) -> None:
+    with pytest.warns(DeprecationWarning, match="hull_invalid_polygons"):
+        to_stl(gf.c.pad(), tmp_path / "test.stl", hull_invalid_polygons=True)
+
+
 if __name__ == "__main__":
     test_export_filepath()
     # test_export_empty_component()
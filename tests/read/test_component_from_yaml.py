@@ -4,8 +4,16 @@ import numpy as np
 import pytest
 from pytest_regressions.data_regression import DataRegressionFixture
 
+import gdsfactory as gf
+from gdsfactory.config import CONF, PATH
 from gdsfactory.difftest import difftest
-from gdsfactory.read.from_yaml import from_yaml, sample_doe_function, sample_mmis
+from gdsfactory.read.from_yaml import (
+    _compiled_yaml_cache,
+    compile_yaml,
+    from_yaml,
+    sample_doe_function,
+    sample_mmis,
+)
 
 sample_connections = """
 name: sample_connections
@@ -535,6 +543,63 @@ def test_settings(
         data_regression.check(c.to_dict())
 
 
+def test_compile_yaml_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "yaml_cache", tmp_path)
+    monkeypatch.setattr(CONF, "yaml_cache", True)
+    yaml_str = """
+name: compile_yaml_cache
+settings:
+    length: 3
+instances:
+    s:
+      component: gdsfactory.components.straight
+      settings:
+        length: ${settings.length}
+"""
+    _compiled_yaml_cache.clear()
+    compiled = compile_yaml(yaml_str)
+    assert compiled["resolved"]["instances"]["s"]["settings"]["length"] == 3
+    assert compiled["resolved"]["instances"]["s"]["component"] == "straight"
+    assert compile_yaml(yaml_str) is compiled
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    _compiled_yaml_cache.clear()
+    assert compile_yaml(yaml_str) == compiled
+    compile_yaml("info:\n    1: one\n")
+    _compiled_yaml_cache.clear()
+    assert compile_yaml("info:\n    1: one\n")["resolved"]["info"] == {1: "one"}
+
+    c = from_yaml(yaml_str, length=5)
+    assert c.insts["s"].cell.settings["length"] == 5
+
+    pdk = gf.get_active_pdk()
+    monkeypatch.setitem(pdk.cells, "compile_yaml_cache", gf.components.straight)
+    assert compile_yaml(yaml_str) is not compiled
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+    monkeypatch.setattr(CONF, "yaml_cache_max_size", 0)
+    compile_yaml(yaml_str + "\n")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_compile_yaml_resolvers(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "yaml_cache", tmp_path)
+    monkeypatch.setattr(CONF, "yaml_cache", True)
+    yaml_str = """
+name: compile_yaml_resolvers_${oc.env:COMPILE_YAML_LENGTH}
+instances:
+    s:
+      component: straight
+      settings:
+        length: ${oc.decode:${oc.env:COMPILE_YAML_LENGTH}}
+"""
+    monkeypatch.setenv("COMPILE_YAML_LENGTH", "3")
+    assert compile_yaml(yaml_str)["resolved"] is None
+    assert from_yaml(yaml_str).insts["s"].cell.settings["length"] == 3
+    monkeypatch.setenv("COMPILE_YAML_LENGTH", "4")
+    assert from_yaml(yaml_str).insts["s"].cell.settings["length"] == 4
+
+
 # @pytest.mark.parametrize("yaml_key", yaml_strings.keys())
 # def test_netlists(
 #     yaml_key: str,
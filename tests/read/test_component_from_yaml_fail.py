@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import pytest
+
 import gdsfactory as gf
+from gdsfactory.read.from_yaml import get_placement_order
 
 yaml_fail = """
 instances:
@@ -54,23 +57,27 @@ placements:
         dy: 20
 """
 
-# import pytest
-
 
-# def test_circular_import_fail():
-#     """Circular dependency should raise an error
-#     FIXME: this should raise an error
-#     """
-#     with pytest.raises(ValueError):
-#         gf.read.from_yaml(yaml_fail)
+def test_circular_import_fail() -> None:
+    """Circular dependency should raise an error."""
+    with pytest.raises(ValueError, match="circular reference"):
+        gf.read.from_yaml(yaml_fail)
 
 
 def test_circular_import_pass() -> None:
     gf.read.from_yaml(yaml_pass)
 
 
+def test_get_placement_order() -> None:
+    placements = {"c": {"x": "b,o2"}, "a": {"x": 0}}
+    connections = {"b": {"instance_dst_name": "a"}}
+    assert get_placement_order(placements, connections) == ["a", "b", "c"]
+
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        get_placement_order({"a": {"x": "b,o1"}, "b": {"y": "a,o1"}}, {})
+
+
 if __name__ == "__main__":
     # c = test_circular_import_pass()
-    # c = test_circular_import_fail()
-    c = gf.read.from_yaml(yaml_fail)
+    test_circular_import_fail()
     # c.show( )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import jsondiff
+import kfactory as kf
 
 import gdsfactory as gf
-from gdsfactory.read.import_gds import import_gds
+from gdsfactory.read.import_gds import component_from_meta_info, import_gds
 
 # def test_import_gds_snap_to_grid() -> None:
 #     gdspath = gf.PATH.gdsdir / "mmi1x2.gds"
@@ -69,3 +70,20 @@ def test_import_gds_raw() -> None:
 
     c = gf.read.import_gds(gdspath)
     assert c
+
+
+def test_component_from_meta_info(tmp_path) -> None:
+    """Ports are read in the order they were written, also past port 10."""
+    c0 = gf.components.pad_array(columns=12)
+    filepath = tmp_path / f"{c0.name}.oas"
+    c0.write(
+        filename=str(filepath),
+        save_options=kf.kcell.save_layout_options(format="OASIS"),
+    )
+
+    kcl = kf.KCLayout(name="test_component_from_meta_info")
+    kcl.read(filepath)
+    c1 = component_from_meta_info(kcl.layout.cell(c0.name), kcl=kcl)
+    assert [p.name for p in c1.ports] == [p.name for p in c0.ports]
+    assert c1.settings.columns == 12
+    assert c1._locked
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pytest_regressions.data_regression import DataRegressionFixture
 
 import gdsfactory as gf
+from gdsfactory.routing.utils import get_straight_dbu
 
 
 def test_route_single(
@@ -44,6 +45,18 @@ def test_route_single_electrical_multilayer(
         data_regression.check(lengths)
 
 
+def test_get_straight_dbu() -> None:
+    c = gf.Component()
+    straight_dbu = get_straight_dbu(
+        component=c,
+        straight=gf.components.straight,
+        cross_section="xs_sc",
+        width_dbu=500,
+    )
+    assert straight_dbu(length=10_000) is straight_dbu(length=10_000)
+    assert straight_dbu(length=10_000) is not straight_dbu(length=10_001)
+
+
 if __name__ == "__main__":
     # c = gf.Component("sample_connect")
     # mmi1 = c << gf.components.mmi1x2()
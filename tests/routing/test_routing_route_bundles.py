@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+
+
+def test_route_bundles() -> None:
+    c = gf.Component()
+    mmis = [c << gf.components.mmi2x2() for _ in range(4)]
+    for i, mmi in enumerate(mmis):
+        mmi.d.move((200 * (i // 2), 40 * (i % 2)))
+
+    bundles = [
+        ([mmis[0].ports["o3"]], [mmis[2].ports["o1"]]),
+        ([mmis[1].ports["o3"]], [mmis[3].ports["o1"]]),
+    ]
+    routes = gf.routing.route_bundles(c, bundles, separation=5.0)
+    assert len(routes) == 2
+
+    c2 = gf.Component()
+    mmis = [c2 << gf.components.mmi2x2() for _ in range(4)]
+    for i, mmi in enumerate(mmis):
+        mmi.d.move((200 * (i // 2), 40 * (i % 2)))
+    route = gf.routing.route_bundle(
+        c2, [mmis[0].ports["o3"]], [mmis[2].ports["o1"]], separation=5.0
+    )
+    assert [r.length for r in routes[0]] == [r.length for r in route]
+
+
+def test_route_bundles_interleaved() -> None:
+    c = gf.Component()
+    starts = [c << gf.components.straight(length=10) for _ in range(4)]
+    for start, xy in zip(starts, [(0, 0), (20, 20), (150, 100), (170, 120)]):
+        start.d.move(xy)
+    ends = [c << gf.components.nxn(west=2, east=0, ysize=20) for _ in range(2)]
+    ends[0].d.move((400, 300))
+    ends[1].d.move((400, 150))
+
+    # the second bundle starts inside the bbox of the first one
+    bundles = [
+        (
+            [starts[0].ports["o2"], starts[1].ports["o2"]],
+            list(ends[0].ports.filter(orientation=180)),
+        ),
+        (
+            [starts[2].ports["o2"], starts[3].ports["o2"]],
+            list(ends[1].ports.filter(orientation=180)),
+        ),
+    ]
+    routes = gf.routing.route_bundles(c, bundles, on_collision="error")
+    assert [len(bundle_routes) for bundle_routes in routes] == [2, 2]
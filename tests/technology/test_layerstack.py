@@ -15,3 +15,40 @@ def test_layerstack_copy() -> None:
     ls2 = LAYER_STACK.model_copy()
     ls2.layers["metal5"] = ls2.layers["metal1"]
     assert len(ls2.layers) == len(ls1.layers) + 1
+
+
+def test_layerstack_lookup_invalidation() -> None:
+    ls = LAYER_STACK.model_copy()
+    layer = ls.layers["metal1"].layer
+    zmin = ls.get_layer_to_zmin()[layer]
+
+    ls.layers["metal1"].zmin = zmin + 1
+    assert ls.get_layer_to_zmin()[layer] == zmin + 1
+    assert LAYER_STACK.get_layer_to_zmin()[layer] == zmin
+    assert ls.layers["metal1"] in ls.get_layer_levels(layer)
+
+    ls.layers["metal1"] = ls.layers["metal1"].model_copy(update={"zmin": 42})
+    assert ls.get_layer_to_zmin()[layer] == 42
+    del ls.layers["metal1"]
+    assert not ls.get_layer_levels(layer)
+    ls.layers = {"metal1": LAYER_STACK.layers["metal1"]}
+    ls.layers.update(metal2=LAYER_STACK.layers["metal2"])
+    assert ls.get_layer_to_zmin()[layer] == zmin
+    assert len(ls.get_layer_to_layername()) == 2
+
+
+def test_component_with_derived_layers_cached() -> None:
+    import gdsfactory as gf
+
+    c = gf.components.straight_heater_doped_rib()
+    c1 = LAYER_STACK.get_component_with_derived_layers(c)
+    c2 = LAYER_STACK.get_component_with_derived_layers(c)
+    assert c1 is c2
+    assert c1.get_polygons().keys()
+
+    ls = LAYER_STACK.model_copy()
+    c3 = ls.get_component_with_derived_layers(c)
+    assert ls.get_component_with_derived_layers(c) is c3
+    etch = next(level for level in ls.layers.values() if level.derived_layer)
+    etch.derived_layer = None
+    assert ls.get_component_with_derived_layers(c) is not c3
@@ -1,5 +1,5 @@
 from gdsfactory.config import PATH
-from gdsfactory.technology import LayerViews
+from gdsfactory.technology import LayerView, LayerViews
 
 
 def test_yaml() -> None:
@@ -19,5 +19,45 @@ def test_yaml() -> None:
     assert lyp_loaded == lyp
 
 
+def test_layer_views_lookup() -> None:
+    lyp = LayerViews.from_lyp(str(PATH.klayout_lyp))
+    name, view = next(iter(lyp.get_layer_views().items()))
+    assert lyp.get_from_tuple(view.layer) is view
+    assert lyp.get_layer_tuple(name) == view.layer
+
+    view.layer = (9999, 99)
+    assert lyp.get_from_tuple((9999, 99)) is view
+    assert (9999, 99) in lyp.get_layer_tuples()
+
+    name = next(
+        name for name, view in lyp.layer_views.items() if not view.group_members
+    )
+    lyp.layer_views[name] = LayerView(name=name, layer=(9998, 0))
+    assert lyp.get_layer_tuple(name) == (9998, 0)
+    del lyp.layer_views[name]
+    assert name not in lyp.get_layer_views()
+
+    group = next(view for view in lyp.layer_views.values() if view.group_members)
+    member = next(iter(group.group_members.values()))
+    member.layer = (9997, 0)
+    assert lyp.get_from_tuple((9997, 0)) is member
+
+
+def test_layer_views_lyp() -> None:
+    lyp = LayerViews.from_lyp(str(PATH.klayout_lyp))
+    filepath, content_hash = lyp._get_lyp()
+    assert lyp._get_lyp() == (filepath, content_hash)
+    assert LayerViews.from_lyp(str(PATH.klayout_lyp))._get_lyp() == (
+        filepath,
+        content_hash,
+    )
+
+    name = next(iter(lyp.layer_views))
+    lyp.layer_views[name].layer = (9998, 0)
+    filepath2, content_hash2 = lyp._get_lyp()
+    assert content_hash2 != content_hash
+    assert "9998/0" in filepath2.read_text()
+
+
 if __name__ == "__main__":
     test_yaml()
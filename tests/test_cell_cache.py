@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+from gdsfactory.cell import _cells, cell_cache_info, clear_cell_cache
+from gdsfactory.config import CONF, PATH
+
+
+@gf.cell
+def cell_cache_sample(length: float = 3, name: str = "o1") -> gf.Component:
+    c = gf.Component()
+    ref = c << gf.components.straight(length=length)
+    c.add_port(name, port=ref.ports["o1"])
+    c.add_port("o2", port=ref.ports["o2"])
+    c.info["length"] = length
+    return c
+
+
+def test_cell_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "cell_cache", tmp_path)
+    monkeypatch.setattr(CONF, "cell_cache", True)
+    clear_cell_cache()
+
+    c1 = cell_cache_sample(length=11, name="in")
+    assert cell_cache_sample(length=11.0, name="in") is c1
+    stores = cell_cache_info()["stores"]
+    assert stores == cell_cache_info()["misses"] > 1
+    assert len(list(tmp_path.glob("*.oas"))) == stores
+
+    name = c1.name
+    ports = [(p.name, p.center, p.orientation, p.width) for p in c1.ports]
+    settings = dict(c1.settings)
+    child = c1.insts[0].cell.name
+    c1.delete()
+    gf.kcl[child].delete()
+    _cells.clear()
+
+    c2 = cell_cache_sample(length=11, name="in")
+    assert cell_cache_info()["hits"] == 1
+    assert c2.name == name
+    assert c2._locked
+    assert [(p.name, p.center, p.orientation, p.width) for p in c2.ports] == ports
+    assert dict(c2.settings) == settings
+    assert c2.info["length"] == 11
+    assert c2.insts[0].cell.name == child
+
+    # the child is built again before the top cell is loaded
+    c2.delete()
+    gf.kcl[child].delete()
+    _cells.clear()
+    monkeypatch.setattr(CONF, "cell_cache", False)
+    straight = gf.components.straight(length=11)
+    monkeypatch.setattr(CONF, "cell_cache", True)
+    c3 = cell_cache_sample(length=11, name="in")
+    assert cell_cache_info()["hits"] == 2
+    assert c3.insts[0].cell.cell_index() == straight.cell_index()
+    assert [p.name for p in straight.ports] == ["o1", "o2"]
+    assert [(p.name, p.center, p.orientation, p.width) for p in c3.ports] == ports
+
+    # the key changes with the PDK content
+    misses = cell_cache_info()["misses"]
+    pdk = gf.get_active_pdk()
+    monkeypatch.setitem(pdk.cells, "cell_cache_sample", cell_cache_sample)
+    _cells.clear()
+    c3.delete()
+    cell_cache_sample(length=11, name="in")
+    assert cell_cache_info()["hits"] == 2
+    assert cell_cache_info()["misses"] > misses
+
+    monkeypatch.setattr(CONF, "cell_cache_max_size", 0)
+    cell_cache_sample(length=12)
+    assert cell_cache_info()["evictions"] > stores
+    clear_cell_cache()
+    assert cell_cache_info()["size"] == 0
@@ -63,5 +63,101 @@ def test_remove_labels() -> None:
     assert len(c.labels) == 0
 
 
+def test_plot_cache() -> None:
+    import matplotlib
+
+    from gdsfactory.component import _plot_images
+
+    matplotlib.use("Agg")
+    c = gf.components.straight(length=11.5)
+    c.plot()
+    n = len(_plot_images)
+    c.plot()
+    assert len(_plot_images) == n
+    c.plot(show_labels=True)
+    assert len(_plot_images) == n + 1
+
+
+def test_plot_cache_lru(monkeypatch) -> None:
+    import matplotlib
+
+    from gdsfactory import component
+
+    matplotlib.use("Agg")
+    monkeypatch.setattr(component, "PLOT_IMAGES_SIZE", 2)
+    c1 = gf.components.straight(length=12.5)
+    c2 = gf.components.straight(length=13.5)
+    c3 = gf.components.straight(length=14.5)
+    c1.plot()
+    c2.plot()
+    c1.plot()
+    c3.plot()
+    names = [key[2] for key in component._plot_images]
+    assert names == [c1.name, c3.name]
+
+
+def test_get_polygons_arrays() -> None:
+    c = gf.components.array(gf.components.straight(), columns=3, rows=2)
+    polygons = c.get_polygons_points()
+    arrays = c.get_polygons_arrays()
+    points, offsets = arrays[(1, 0)]
+    assert len(offsets) - 1 == len(polygons[(1, 0)]) == 6
+    assert points.shape == (offsets[-1], 2)
+
+    cells = c.get_polygons_arrays_by_cell(layers=[(1, 0)])
+    (cell_polygons, transforms), *_ = cells.values()
+    assert len(cells) == 1 and transforms.shape == (6, 3, 3)
+    assert len(cell_polygons[(1, 0)][1]) - 1 == 1
+
+    points, offsets = c.get_polygons_arrays(bbox=((-1, -1), (1, 1)))[(1, 0)]
+    assert len(offsets) - 1 == 1
+
+
+def test_add_polygons() -> None:
+    import numpy as np
+
+    squares = [np.array([(0, 0), (1, 0), (1, 1), (0, 1)]) + 2 * i for i in range(3)]
+    c1 = gf.Component()
+    c1.add_polygons(squares, layer=(1, 0))
+    c2 = gf.Component()
+    c2.add_polygons(
+        np.concatenate(squares), layer=(1, 0), offsets=np.array([0, 4, 8, 12])
+    )
+    c3 = gf.Component()
+    for square in squares:
+        c3.add_polygon(square, layer=(1, 0))
+
+    expected = c3.get_polygons_points()[(1, 0)]
+    assert c1.get_polygons_points()[(1, 0)] == expected
+    assert c2.get_polygons_points()[(1, 0)] == expected
+
+
+def test_create_ports() -> None:
+    names = ["o1", "o2", "o3"]
+    centers = [(0, 0), (10.0005, 3), (5, -2)]
+    orientations = [180, 45, -90]
+    c1 = gf.Component()
+    c1.create_ports(names, centers, orientations, widths=0.5, layer=(1, 0))
+    c2 = gf.Component()
+    for name, center, orientation in zip(names, centers, orientations):
+        c2.add_port(
+            name, center=center, orientation=orientation, width=0.5, layer=(1, 0)
+        )
+
+    assert [str(port) for port in c1.ports] == [str(port) for port in c2.ports]
+
+
+def test_array_mirrored_ports() -> None:
+    c = gf.Component()
+    c.add_polygon([(0, 0), (1, 0), (1, 1), (0, 1)], layer=(1, 0))
+    c.add_port("o1", center=(0, 0.5), orientation=180, width=0.5, layer=(1, 0))
+    c.add_port("o2", center=(1, 0.5), orientation=0, width=0.5, layer=(1, 0))
+    c.ports["o2"].trans = gf.kdb.Trans(0, True, 1000, 500)
+
+    array = gf.components.array(c, columns=2, rows=1, spacing=(10, 0))
+    assert not array.ports["o1_1_1"].trans.is_mirror()
+    assert array.ports["o2_1_2"].trans == gf.kdb.Trans(0, True, 11000, 500)
+
+
 if __name__ == "__main__":
     test_extract()
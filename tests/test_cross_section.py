@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gc
 from functools import partial
 
 import jsondiff
@@ -47,6 +48,30 @@ def test_copy() -> None:
     assert len(d) == 0, d
 
 
+def test_copy_shared() -> None:
+    xs = gf.cross_section.strip()
+    assert xs.copy() is xs
+    assert xs.copy(width=2) is xs.copy(width=2)
+    assert xs.copy(width=2) is not xs.copy(width=2.5)
+    assert xs.copy(width=2).width == 2
+    assert xs.copy(width=2).name == xs.copy(width=2).name != xs.name
+
+
+def test_copy_shared_released(monkeypatch) -> None:
+    monkeypatch.setattr(gf.cross_section, "CROSS_SECTION_COPIES_SIZE", 2)
+    xs = gf.cross_section.cross_section(width=0.7)
+    xs_id = id(xs)
+    xs2 = xs.copy(width=2)
+    xs.copy(width=3)
+    xs.copy(width=4)
+    assert len(gf.cross_section._cross_section_copies[xs_id]) == 2
+    assert xs.copy(width=2) is not xs2
+
+    del xs, xs2
+    gc.collect()
+    assert xs_id not in gf.cross_section._cross_section_copies
+
+
 xc_sin = partial(
     gf.cross_section.cross_section,
     width=1.0,
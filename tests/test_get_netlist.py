@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 import gdsfactory as gf
-from gdsfactory.get_netlist import get_netlist_recursive
+from gdsfactory.get_netlist import get_netlist, get_netlist_recursive, group_by_grid
 
 
 def test_netlist_simple() -> None:
@@ -330,6 +331,93 @@ def test_get_netlist_transformed() -> None:
     assert i2_netlist["placements"][None]["rotation"] == rotation_value
 
 
+def test_get_netlist_recursive_cache() -> None:
+    from gdsfactory.get_netlist import clear_netlist_cache, get_netlist
+
+    netlisted = []
+
+    def get_netlist_counting(component, **kwargs):
+        netlisted.append(component.name)
+        return get_netlist(component, **kwargs)
+
+    clear_netlist_cache()
+    c = gf.components.mzi_arms()
+    n1 = get_netlist_recursive(c, get_netlist_func=get_netlist_counting)
+    assert len(netlisted) == len(set(netlisted)) == len(n1)
+
+    n2 = get_netlist_recursive(c, get_netlist_func=get_netlist_counting)
+    assert len(netlisted) == len(n1)
+    assert n1 == n2
+
+    n2[c.name]["instances"].clear()
+    n3 = get_netlist_recursive(c, get_netlist_func=get_netlist_counting)
+    assert n3 == n1
+
+
+def test_get_netlist_cache_invalidation() -> None:
+    from gdsfactory.get_netlist import get_netlist_cached
+
+    c = gf.Component()
+    i1 = c.add_ref(gf.components.straight(), "i1")
+    i2 = c.add_ref(gf.components.straight(), "i2")
+    i2.connect("o2", i1.ports["o1"])
+    assert len(get_netlist_cached(c)["connections"]) == 1
+
+    i2.movey(100)
+    assert len(get_netlist_cached(c)["connections"]) == 0
+
+
+def test_get_netlist_cache_size(monkeypatch) -> None:
+    from gdsfactory import get_netlist as netlist_module
+
+    monkeypatch.setattr(netlist_module, "NETLIST_CACHE_SIZE", 2)
+    netlist_module.clear_netlist_cache()
+    for length in (1, 2, 3):
+        netlist_module.get_netlist_cached(gf.components.straight(length=length))
+    assert len(netlist_module._netlist_cache) == 2
+
+
+def test_group_by_grid() -> None:
+    xy = np.array([[0, 0], [10, 0], [1, 0], [0, 0], [10, 2], [50, 50]])
+    order, starts, counts = group_by_grid(xy, grid_size=1)
+    groups = [order[s : s + n].tolist() for s, n in zip(starts, counts)]
+    assert groups == [[0, 3], [1], [2], [4], [5]]
+
+    order, starts, counts = group_by_grid(xy, grid_size=5)
+    groups = [order[s : s + n].tolist() for s, n in zip(starts, counts)]
+    assert groups == [[0, 2, 3], [1, 4], [5]]
+
+
+def test_get_netlist_near_miss() -> None:
+    """Ports 2nm apart are connected by the coarse sweep."""
+    c = gf.Component()
+    c.add_ref(gf.components.straight(length=10), "i1")
+    i2 = c.add_ref(gf.components.straight(length=10), "i2")
+    i2.d.movex(-10.002)
+    assert c.get_netlist()["connections"] == {"i1,o1": "i2,o2"}
+    assert get_netlist(c, tolerance=1)["connections"] == {}
+
+
+def test_get_netlist_duplicate_port_names() -> None:
+    """Ports sharing a name are matched one by one, not collapsed by name."""
+    child = gf.Component()
+    child.add_polygon([(0, -1), (10, -1), (10, 1), (0, 1)], layer=(1, 0))
+    for x, orientation in ((10, 0), (0, 180)):
+        child.add_port(
+            "e1",
+            center=(x, 0),
+            orientation=orientation,
+            width=2,
+            layer=(1, 0),
+            port_type="electrical",
+        )
+    c = gf.Component()
+    c.add_ref(child, "a")
+    b = c.add_ref(gf.components.straight(cross_section="metal_routing"), "b")
+    b.d.movex(10)
+    assert c.get_netlist()["connections"] == {"a,e1": "b,e1"}
+
+
 if __name__ == "__main__":
     # c = gf.c.array()
     # n = c.get_netlist()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import gdsfactory as gf
+
+lazy_modules = (
+    "gdsfactory.components",
+    "gdsfactory.read",
+    "gdsfactory.routing",
+    "gdsfactory.write_cells",
+)
+# seconds, to catch modules that get imported eagerly again
+import_time_budget = 5
+
+
+def test_import_lazy_modules() -> None:
+    """Heavy submodules are only imported when first accessed."""
+    code = "import sys, gdsfactory\nprint(' '.join(sys.modules))\n"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(out.stdout.split())
+    assert "gdsfactory" in modules
+    for module in lazy_modules:
+        assert module not in modules, f"{module} imported by `import gdsfactory`"
+
+
+def _import_times(code: str) -> dict[str, float]:
+    """Returns the cumulative import time in seconds per module of code."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in out.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, module = line.split("|")
+            times[module.strip()] = int(cumulative) * 1e-6
+    return times
+
+
+def test_import_time() -> None:
+    """Tracks the import time of gdsfactory and what the lazy modules save."""
+    import_time = _import_times("import gdsfactory")["gdsfactory"]
+    times = _import_times(f"import gdsfactory, {', '.join(lazy_modules)}")
+    saved = sum(times.get(module, 0) for module in lazy_modules)
+    print(f"import gdsfactory: {import_time:.2f} s, lazy modules: {saved:.2f} s")
+    assert import_time < import_time_budget
+
+
+def test_lazy_attributes() -> None:
+    assert gf.c is gf.components
+    assert callable(gf.routing.route_single)
+    assert gf.import_gds is gf.read.import_gds
+    assert "pack" in dir(gf)
@@ -66,6 +66,15 @@ def test_flatten_netlist_identical_references():
     assert len(get_netlist_flat(vdiv, allow_multiple=True)["instances"]) == 8
 
 
+def test_write_netlist_flat(tmp_path) -> None:
+    from gdsfactory.get_netlist_flat import read_netlist_flat, write_netlist_flat
+
+    c = gf.components.mzi_arms()
+    netlist = get_netlist_flat(c)
+    filepath = write_netlist_flat(c, tmp_path / "netlist_flat.jsonl")
+    assert read_netlist_flat(filepath) == netlist
+
+
 if __name__ == "__main__":
     test_flatten_netlist_identical_references()
     # test_flat_netlist_photonic()
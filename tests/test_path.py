@@ -164,6 +164,24 @@ def test_path_add() -> None:
     assert p.end_angle == 45
 
 
+def test_bend_points_cache() -> None:
+    gf.path.clear_bend_points_cache()
+    p1 = gf.path.euler(radius=10, angle=90, p=0.5)
+    p2 = gf.path.euler(radius=10, angle=90, p=0.5)
+    info = gf.path.bend_points_cache_info()["euler"]
+    assert info.misses == 1
+    assert info.hits == 1
+    assert not p1.points.flags.writeable
+    np.testing.assert_array_equal(p1.points, p2.points)
+
+    p1.move((5, 0))
+    assert p2.points[0, 0] == 0
+
+    gf.path.arc(radius=10, angle=90)
+    gf.path.arc(radius=10, angle=90)
+    assert gf.path.bend_points_cache_info()["arc"].hits == 1
+
+
 if __name__ == "__main__":
     test_layers2()
     # test_append()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory import Section
 from gdsfactory.generic_tech import LAYER
@@ -136,6 +138,17 @@ def test_extrude_port_centers() -> None:
     assert s.ports["e2"].center[1] == s.ports["o2"].center[1] - s1_offset
 
 
+def test_centerpoint_offset_curves() -> None:
+    p = gf.path.euler(radius=10, angle=90) + gf.path.straight(length=5)
+    offsets = np.array([0.25, -0.25, 3.0, -4.5])
+    curves = p._centerpoint_offset_curves(p.points, offsets, p.start_angle, p.end_angle)
+    for curve, offset in zip(curves, offsets):
+        expected = p._centerpoint_offset_curve(
+            p.points, offset, p.start_angle, p.end_angle
+        )
+        np.testing.assert_array_equal(curve, expected)
+
+
 if __name__ == "__main__":
     # test_diagonal_extrude_consistent_naming()
     # test_transition_cross_section()
@@ -1,3 +1,5 @@
+import pytest
+
 import gdsfactory as gf
 
 
@@ -7,3 +9,33 @@ def test_get_cross_section() -> None:
     cross_section = {"cross_section": "xs_sc", "settings": {"width": 1}}
     xs = gf.get_cross_section(cross_section)
     assert xs.sections[0].width == 1
+
+
+def test_get_component_spec() -> None:
+    pdk = gf.get_active_pdk()
+    assert pdk.get_cell("mmi1x2") is pdk.cells["mmi1x2"]
+    c1 = pdk.get_component("mmi1x2", length_mmi=5)
+    c2 = pdk.get_component({"component": "gdsfactory.components.mmi1x2"}, length_mmi=5)
+    assert c1 is c2
+
+    with pytest.raises(ValueError, match="not in PDK"):
+        pdk.get_component("not_a_cell")
+    with pytest.raises(ValueError, match="Invalid setting"):
+        pdk.get_component({"component": "mmi1x2", "length": 5})
+
+
+def test_base_pdks() -> None:
+    base = gf.get_active_pdk()
+    pdk = gf.Pdk(name="derived", base_pdks=[base])
+    assert pdk.cells["mmi1x2"] is base.cells["mmi1x2"]
+    assert pdk.get_cross_section("xs_sc").name == base.get_cross_section("xs_sc").name
+
+    pdk.remove_cell("mmi1x2")
+    assert "mmi1x2" in base.cells
+    with pytest.raises(ValueError):
+        pdk.get_cell("mmi1x2")
+
+    with pytest.warns(UserWarning, match="Overwriting cell 'straight'"):
+        pdk.register_cells(straight=gf.components.straight)
+    with pytest.raises(ValueError, match="already registered"):
+        pdk.register_cells_yaml(bend_euler=gf.components.bend_euler)
@@ -71,3 +71,66 @@ def test_get_ports_sort_counter_clockwise() -> None:
 def test_rename_ports(port_type, data_regression: DataRegressionFixture):
     c = gf.components.nxn(port_type=port_type)
     data_regression.check(c.to_dict())
+
+
+def test_select_ports_index() -> None:
+    from gdsfactory.port import get_ports_facing, select_ports
+
+    mzi = gf.components.mzi_phase_shifter()
+    c = gf.Component()
+    ref = c << mzi
+    ref.dcplx_trans = gf.kdb.DCplxTrans(1, 90, True, 10, 5)
+
+    queries = [
+        {"port_type": "electrical"},
+        {"prefix": "o", "orientation": 180},
+        {"suffix": "2"},
+        {"layers_excluded": ((1, 0),), "sort_ports": True},
+        {"bbox": ((-100, -100), (0, 100))},
+    ]
+    for ports in (mzi, ref):
+        for query in queries:
+            selected = select_ports(ports, **query)
+            expected = select_ports(list(ports.ports), **query)
+            assert [str(p) for p in selected] == [str(p) for p in expected]
+
+    for direction in "ENWS":
+        assert get_ports_facing(mzi, direction) == get_ports_facing(
+            list(mzi.ports), direction
+        )
+
+
+def test_select_ports_index_changed_ports() -> None:
+    from gdsfactory.port import select_ports
+
+    c = gf.components.mmi1x2(length_mmi=33)
+    bbox = ((-20, -5), (0, 5))
+    assert [p.name for p in select_ports(c, bbox=bbox)] == ["o1"]
+
+    c.ports["o1"].d.x -= 100
+    assert select_ports(c, bbox=bbox) == []
+    assert [p.name for p in select_ports(c, bbox=((-120, -5), (-100, 5)))] == ["o1"]
+
+    c.ports["o1"].name = "zz"
+    assert select_ports(c, prefix="o1") == []
+    assert [p.name for p in select_ports(c, prefix="zz")] == ["zz"]
+
+
+def test_auto_rename_ports_locked() -> None:
+    from gdsfactory.port import auto_rename_ports, select_ports
+
+    c = gf.components.pad_array(columns=3, rows=2)
+    names = [p.name for p in c.ports]
+    assert len(select_ports(c, prefix="e2")) == 3
+
+    auto_rename_ports(c)
+    renamed = [p.name for p in c.ports]
+    assert renamed != names
+    assert len(select_ports(c, prefix="e2")) == 1
+
+    auto_rename_ports(c)
+    assert [p.name for p in c.ports] == renamed
+
+    c.ports["e1"].d.y -= 1000
+    auto_rename_ports(c)
+    assert [p.name for p in c.ports] != renamed